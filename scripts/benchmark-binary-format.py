@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+
+import json
+import pickle
+import sys
+import time
+from pathlib import Path
+from urllib.parse import ParseResult
+
+PROJECT_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_DIR / 'src'))
+
+from configoo import field, model, dump_to_binary, load_from_binary  # noqa: E402
+
+
+FIELDS = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+ROUNDS = int(sys.argv[2]) if len(sys.argv) > 2 else 1000
+
+FIELD_TYPES = (
+    (lambda: field.IntField(), '8080'),
+    (lambda: field.StrField(), 'value'),
+    (lambda: field.FloatField(), '0.25'),
+    (lambda: field.UrlField(), 'https://example.com/path?query=1'),
+    (lambda: field.PathField(), '/var/lib/service'),
+    (lambda: field.IpField(), '10.0.0.1'),
+    (lambda: field.ListField(field.IntField()), '1,2,3,4,5,6,7,8'),
+    (lambda: field.DictField(field.StrField(), field.StrField()), 'a:1,b:2,c:3'),
+)
+
+
+def create_config() -> model.Model:
+    fields = {}
+    data = {}
+
+    for i in range(FIELDS):
+        create_field, value = FIELD_TYPES[i % len(FIELD_TYPES)]
+        fields[f'FIELD_{i}'] = item = create_field()
+        data[f'FIELD_{i}'] = item.parse(value)
+
+    config_model = type('Config', (model.Model,), fields)
+    globals()['Config'] = config_model
+
+    return config_model(data)
+
+
+def dump_json(config: model.Model) -> str:
+    # Parsed URLs are tuples, JSON would write them as arrays.
+    return json.dumps(
+        {key: value.geturl() if isinstance(value, ParseResult) else value for key, value in config},
+        default=str,
+    )
+
+
+def measure(func) -> float:
+    started = time.perf_counter()
+    for _ in range(ROUNDS):
+        func()
+
+    return (time.perf_counter() - started) / ROUNDS
+
+
+def main() -> None:
+    config = create_config()
+    config_model = type(config)
+
+    fields = list(config_model.iter_fields())
+
+    def load_json_typed(data: str) -> model.Model:
+        values = json.loads(data)
+
+        return config_model({
+            key: definition.get_parser(type(values[key]))(values[key])
+            for key, definition in fields
+        })
+
+    # Plain JSON output loses the value types, the typed variant parses them back with the fields.
+    formats = {
+        'binary': (lambda: dump_to_binary(config), lambda data: load_from_binary(config_model, data)),
+        'pickle': (lambda: pickle.dumps(config), pickle.loads),
+        'json': (lambda: dump_json(config), json.loads),
+        'json+parse': (lambda: dump_json(config), load_json_typed),
+    }
+
+    print(f"model: {FIELDS} fields, {ROUNDS} rounds")
+
+    for name, (dump, load) in formats.items():
+        data = dump()
+        dumps = measure(dump)
+        loads = measure(lambda: load(data))
+
+        print(f"{name:>10}: {len(data):6d} B, encode {dumps * 1e6:7.1f} us, decode {loads * 1e6:7.1f} us")
+
+
+if __name__ == '__main__':
+    main()
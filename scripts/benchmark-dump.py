@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+
+import sys
+import time
+from pathlib import Path
+
+PROJECT_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_DIR / 'src'))
+
+from configoo import field, model, loader, dump_to_env, dump_to_json  # noqa: E402
+
+
+FIELDS = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+ROUNDS = int(sys.argv[2]) if len(sys.argv) > 2 else 2000
+
+FIELD_TYPES = (
+    (lambda: field.IntField(), '8080'),
+    (lambda: field.StrField(), 'value'),
+    (lambda: field.UrlField(), 'https://example.com/path?query=1'),
+    (lambda: field.PathField(), '/var/lib/service'),
+    (lambda: field.IpField(), '10.0.0.1'),
+    (lambda: field.LoggingLevelField(), 'INFO'),
+    (lambda: field.ListField(field.IntField()), '1,2,3'),
+    (lambda: field.DictField(field.StrField(), field.StrField(), frozen=True), 'a:1,b:2'),
+)
+
+
+def create_config() -> model.Model:
+    fields = {}
+    data = {}
+
+    for i in range(FIELDS):
+        create_field, value = FIELD_TYPES[i % len(FIELD_TYPES)]
+        fields[f'FIELD_{i}'] = item = create_field()
+        data[f'FIELD_{i}'] = item.parse(value)
+
+    return type('Config', (model.Model,), fields)(data)
+
+
+def measure(func) -> float:
+    started = time.perf_counter()
+    for _ in range(ROUNDS):
+        func()
+
+    return (time.perf_counter() - started) / ROUNDS
+
+
+def main() -> None:
+    config = create_config()
+    env = dump_to_env(config)
+
+    # The env loader reads the dumped values instead of the process environment.
+    driver = loader.EnvLoaderDriver()
+    driver.get_field_value = lambda context: env.get(context.field.name, driver._NONE)
+    env_loader = loader.EnvLoader(driver=driver)
+
+    assert env_loader.load_model(type(config)).fingerprint == config.fingerprint
+
+    print(f"model: {FIELDS} fields, {ROUNDS} rounds")
+    print(f"dump_to_env: {measure(lambda: dump_to_env(config)) * 1e6:.1f} us")
+    print(f"dump_to_json: {measure(lambda: dump_to_json(config)) * 1e6:.1f} us")
+    print(f"load from env: {measure(lambda: env_loader.load_model(type(config))) * 1e6:.1f} us")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+
+import sys
+import tracemalloc
+from pathlib import Path
+
+PROJECT_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_DIR / 'src'))
+
+from configoo import field, model  # noqa: E402
+
+
+MODELS = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+FIELDS = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+
+
+def create_fields():
+    return [
+        field.IntField(default=1, min_value=0)
+        for _ in range(MODELS * FIELDS)
+    ]
+
+
+def create_models():
+    # Every model declares the same set of fields, as services sharing a common config would.
+    return [
+        type(f'Model{i}', (model.Model,), {
+            f'FIELD_{j}': field.IntField(default=j)
+            for j in range(FIELDS)
+        })
+        for i in range(MODELS)
+    ]
+
+
+def measure(func):
+    tracemalloc.start()
+    started = tracemalloc.take_snapshot()
+    result = func()
+    finished = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+
+    size = sum(stat.size_diff for stat in finished.compare_to(started, 'filename'))
+    return result, size
+
+
+def main() -> None:
+    fields, fields_size = measure(create_fields)
+    models, models_size = measure(create_models)
+
+    # Every model owns a bound copy, identical fields share the parser table of one definition.
+    tables = {
+        id(definition._FieldDefinition__parsers)
+        for item in models
+        for _, definition in item.iter_fields()
+    }
+
+    print(f"fields: {len(fields)}, {fields_size / len(fields):.0f} B per field")
+    print(f"models: {MODELS} x {FIELDS} fields, {len(tables)} distinct parser tables")
+    print(f"models: {models_size / 1024:.0f} KiB, {models_size / MODELS:.0f} B per model")
+
+
+if __name__ == '__main__':
+    main()
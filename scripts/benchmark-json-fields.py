@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+
+import sys
+import json
+import timeit
+import tempfile
+from pathlib import Path
+
+PROJECT_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_DIR / 'src'))
+
+from configoo import field, model, loader  # noqa: E402
+
+
+SIZE = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+NUMBER = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+
+
+ID = field.IntField(min_value=0)
+WEIGHT = field.NumField()
+LABEL = field.StrField()
+LIMIT = field.IntField()
+
+
+class Config(model.Model):
+    IDS = field.ListField(ID)
+    WEIGHTS = field.ListField(WEIGHT)
+    LABELS = field.DictField(LABEL, LABEL)
+    LIMITS = field.DictField(LABEL, LIMIT)
+
+
+def generic_load(driver: loader.JsonLoaderDriver, path: Path) -> dict:
+    # Reference point: every item goes through the string oriented Field.parse.
+    context = driver.create_context(Config, path)
+
+    with context:
+        document = context.document
+
+        return {
+            'IDS': [ID.parse(item) for item in document['IDS']],
+            'WEIGHTS': [WEIGHT.parse(item) for item in document['WEIGHTS']],
+            'LABELS': {LABEL.parse(key): LABEL.parse(item) for key, item in document['LABELS'].items()},
+            'LIMITS': {LABEL.parse(key): LIMIT.parse(item) for key, item in document['LIMITS'].items()},
+        }
+
+
+def main() -> None:
+    data = {
+        'IDS': list(range(SIZE)),
+        'WEIGHTS': [i / 3 for i in range(SIZE)],
+        'LABELS': {f'label-{i}': f'value-{i}' for i in range(SIZE)},
+        'LIMITS': {f'limit-{i}': i for i in range(SIZE)},
+    }
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / 'config.json'
+        path.write_text(json.dumps(data))
+
+        driver = loader.JsonLoaderDriver()
+        json_loader = loader.JsonLoader(driver=driver)
+
+        # Warm up the document cache, so only field parsing is measured.
+        json_loader.load_model(Config, path)
+
+        generic = min(timeit.repeat(lambda: generic_load(driver, path), number=1, repeat=NUMBER))
+        typed = min(timeit.repeat(lambda: json_loader.load_model(Config, path), number=1, repeat=NUMBER))
+
+    print(f"fields: 4 x {SIZE} items, best of {NUMBER} loads")
+    print(f"generic parse: {generic * 1000:.1f} ms")
+    print(f"typed parsers: {typed * 1000:.1f} ms ({generic / typed:.2f}x)")
+
+
+if __name__ == '__main__':
+    main()
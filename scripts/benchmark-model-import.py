@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+
+import sys
+import time
+from pathlib import Path
+
+PROJECT_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_DIR / 'src'))
+
+import configoo  # noqa: E402
+
+
+MODELS = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+FIELDS = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+DEPTH = int(sys.argv[3]) if len(sys.argv) > 3 else 5
+
+FIELD_TYPES = (
+    'field.IntField(default=1)',
+    'field.StrField(default="x")',
+    'field.FloatField(default=1.0)',
+    'field.ListField(field.IntField(), default=[])',
+    'field.DictField(field.StrField(), field.StrField(), default={})',
+)
+
+
+def generate_module() -> str:
+    # Every model extends the previous one in a chain of DEPTH classes and adds FIELDS own fields.
+    lines = [
+        'from configoo import field, model',
+        '',
+    ]
+
+    for i in range(MODELS):
+        base = f'Model{i - 1}' if i % DEPTH else 'model.Model'
+        lines.append(f'class Model{i}({base}):')
+
+        for j in range(FIELDS):
+            lines.append(f'    FIELD_{i}_{j} = {FIELD_TYPES[j % len(FIELD_TYPES)]}')
+
+        lines.append('')
+
+    return '\n'.join(lines)
+
+
+def main() -> None:
+    # Compile the module source up front, only class creation is measured.
+    code = compile(generate_module(), 'generated_models', 'exec')
+    namespace = {}
+
+    started = time.perf_counter()
+    exec(code, namespace)
+    elapsed = time.perf_counter() - started
+
+    last = namespace[f'Model{MODELS - 1}']
+
+    print(f"models: {MODELS} x {FIELDS} own fields, inheritance depth {DEPTH}")
+    print(f"fields of the last model: {len(list(last.iter_fields()))}")
+    print(f"class creation: {elapsed * 1000:.1f} ms ({elapsed / MODELS * 1e6:.0f} us per model)")
+
+
+if __name__ == '__main__':
+    main()
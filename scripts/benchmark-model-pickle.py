@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+
+import pickle
+import sys
+import time
+from pathlib import Path
+
+PROJECT_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_DIR / 'src'))
+
+from configoo import field, model  # noqa: E402
+
+
+FIELDS = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+ROUNDS = int(sys.argv[2]) if len(sys.argv) > 2 else 2000
+
+FIELD_TYPES = (
+    (lambda: field.IntField(), '8080'),
+    (lambda: field.StrField(), 'value'),
+    (lambda: field.UrlField(), 'https://example.com/path?query=1'),
+    (lambda: field.PathField(), '/var/lib/service'),
+    (lambda: field.IpField(), '10.0.0.1'),
+    (lambda: field.LoggingLevelField(), 'INFO'),
+    (lambda: field.ListField(field.IntField()), '1,2,3'),
+    (lambda: field.DictField(field.StrField(), field.StrField(), frozen=True), 'a:1,b:2'),
+)
+
+
+def create_config() -> model.Model:
+    fields = {}
+    data = {}
+
+    for i in range(FIELDS):
+        create_field, value = FIELD_TYPES[i % len(FIELD_TYPES)]
+        fields[f'FIELD_{i}'] = item = create_field()
+        data[f'FIELD_{i}'] = item.parse(value)
+
+    config_model = type('Config', (model.Model,), fields)
+    # Pickle finds the model class by reference.
+    globals()['Config'] = config_model
+
+    return config_model(data)
+
+
+def measure(func) -> float:
+    started = time.perf_counter()
+    for _ in range(ROUNDS):
+        func()
+
+    return (time.perf_counter() - started) / ROUNDS
+
+
+def main() -> None:
+    config = create_config()
+    payload = pickle.dumps(config)
+
+    dumps = measure(lambda: pickle.dumps(config))
+    loads = measure(lambda: pickle.loads(payload))
+
+    print(f"model: {FIELDS} fields, {ROUNDS} rounds")
+    print(f"size: {len(payload)} B")
+    print(f"dumps: {dumps * 1e6:.1f} us")
+    print(f"loads: {loads * 1e6:.1f} us")
+
+
+if __name__ == '__main__':
+    main()
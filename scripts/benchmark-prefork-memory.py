@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+
+import gc
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+PROJECT_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_DIR / 'src'))
+
+from configoo import field, model, freeze_for_fork  # noqa: E402
+
+
+FIELDS = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+ITEMS = int(sys.argv[2]) if len(sys.argv) > 2 else 500
+CHILDREN = int(sys.argv[3]) if len(sys.argv) > 3 else 4
+
+MODES = ('plain', 'frozen', 'frozen+gc')
+
+
+def get_private_dirty() -> int:
+    # Linux only, pages written by this process after fork are private.
+    with open('/proc/self/smaps_rollup') as fd:
+        for line in fd:
+            if line.startswith('Private_Dirty:'):
+                return int(line.split()[1]) * 1024
+
+    raise RuntimeError("Private_Dirty is not reported!")
+
+
+def create_config() -> model.Model:
+    config_model = type('Config', (model.Model,), {
+        f'FIELD_{i}': field.ListField(field.StrField())
+        for i in range(FIELDS)
+    })
+
+    return config_model({
+        f'FIELD_{i}': [f'value-{i}-{j}' for j in range(ITEMS)]
+        for i in range(FIELDS)
+    })
+
+
+def use_config(config: model.Model) -> None:
+    # A worker reading every value, then a collection as a long running worker would run.
+    for _, values in config:
+        for value in values:
+            len(value)
+
+    gc.collect()
+
+
+def run_child(config: model.Model, write_fd: int) -> None:
+    started = get_private_dirty()
+    use_config(config)
+    os.write(write_fd, str(get_private_dirty() - started).encode())
+    os._exit(0)
+
+
+def measure(mode: str) -> None:
+    config = create_config()
+
+    if mode != 'plain':
+        config = freeze_for_fork(config, gc_freeze=mode == 'frozen+gc')
+
+    growth = []
+
+    for _ in range(CHILDREN):
+        read_fd, write_fd = os.pipe()
+        pid = os.fork()
+
+        if not pid:
+            os.close(read_fd)
+            run_child(config, write_fd)
+
+        os.close(write_fd)
+        growth.append(int(os.read(read_fd, 64)))
+        os.close(read_fd)
+        os.waitpid(pid, 0)
+
+    print(f"{mode:>10}: {sum(growth) / len(growth) / 1024:8.0f} KiB private memory growth per child")
+
+
+def main() -> None:
+    if len(sys.argv) > 4:
+        measure(sys.argv[4])
+        return
+
+    print(f"config: {FIELDS} fields x {ITEMS} strings, {CHILDREN} children")
+
+    # Every mode runs in its own interpreter, gc.freeze() can not be undone for the next one.
+    for mode in MODES:
+        subprocess.run(
+            [sys.executable, __file__, str(FIELDS), str(ITEMS), str(CHILDREN), mode],
+            check=True,
+        )
+
+
+if __name__ == '__main__':
+    main()
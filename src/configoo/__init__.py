@@ -1,5 +1,34 @@
 from .exception import *
-from .field import *
-from .model import *
-from .loader import *
-from .utils import *
+from . import exception, field, model, loader
+from ._lazy import lazy_exports
+
+# Field, model and loader modules are imported on the first access of their names.
+_names, __getattr__, __dir__ = lazy_exports(__name__, {
+    '.field': field.__all__,
+    '.model': model.__all__,
+    '.loader': loader.__all__,
+    '.utils': (
+        'load_from_env',
+        'load_from_json',
+        'load_from_json_directory',
+        'load_from_directory',
+        'load_rewriting',
+        'load_appending',
+    ),
+    '.binary': (
+        'dump_to_binary',
+        'load_from_binary',
+    ),
+    '.dump': (
+        'dump_to_env',
+        'dump_to_dotenv',
+        'dump_to_json',
+    ),
+    '.prefork': (
+        'SharedConfigPublisher',
+        'SharedConfigReader',
+        'freeze_for_fork',
+    ),
+})
+
+__all__ = exception.__all__ + _names
@@ -0,0 +1,46 @@
+from typing import Any, Callable, Dict, Iterable, List, Tuple
+import importlib
+import sys
+
+__all__ = [
+    'lazy_exports',
+]
+
+
+def lazy_exports(
+        package: str,
+        exports: Dict[str, Iterable[str]],
+) -> Tuple[List[str], Callable[[str], Any], Callable[[], List[str]]]:
+    # PEP 562 module hooks, a submodule is imported on the first access of one of its names.
+    origins = {
+        name: module
+        for module, names in exports.items()
+        for name in names
+    }
+
+    def __getattr__(name: str) -> Any:
+        module = origins.get(name)
+        if module is None:
+            return _import_submodule(name)
+
+        value = getattr(importlib.import_module(module, package), name)
+        # Later lookups find the name in the module dict and skip this hook.
+        setattr(sys.modules[package], name, value)
+
+        return value
+
+    def _import_submodule(name: str) -> Any:
+        # Submodules used to be bound as attributes by the eager imports, e.g. configoo.utils.
+        try:
+            return importlib.import_module(f'.{name}', package)
+
+        except ModuleNotFoundError as error:
+            if error.name != f'{package}.{name}':
+                raise
+
+        raise AttributeError(f"module {package!r} has no attribute {name!r}")
+
+    def __dir__() -> List[str]:
+        return sorted(set(vars(sys.modules[package])) | set(origins))
+
+    return list(origins), __getattr__, __dir__
@@ -0,0 +1,468 @@
+from typing import TypeVar, Type, Any, Callable, Dict, Optional, Union, List, Tuple
+from types import MappingProxyType
+from datetime import timedelta
+from ipaddress import IPv4Address, IPv6Address
+from pathlib import Path
+from urllib.parse import urlparse, ParseResult
+import enum
+import hashlib
+import re
+import struct
+import sys
+import weakref
+
+from .exception import LoaderError
+from .model import Model, ModelDefinition
+
+__all__ = [
+    'dump_to_binary',
+    'load_from_binary',
+]
+
+
+M = TypeVar('M', bound=Model)
+Buffer = Union[bytes, bytearray, memoryview]
+
+_MAGIC = b'CFGB'
+_VERSION = 1
+# Magic, format version, flags and the first 8 bytes of the schema digest.
+_HEADER = struct.Struct('<4sBB8s')
+_FLOAT = struct.Struct('<d')
+
+_SNAPSHOT_FLAG = 0x01
+
+_NONE = 0x00
+_FALSE = 0x01
+_TRUE = 0x02
+_INT = 0x03
+_FLOAT_TAG = 0x04
+_STR = 0x05
+_BYTES = 0x06
+_LIST = 0x07
+_TUPLE = 0x08
+_DICT = 0x09
+_FROZEN_DICT = 0x0a
+_SET = 0x0b
+_FROZEN_SET = 0x0c
+_PATH = 0x10
+_IPV4 = 0x11
+_IPV6 = 0x12
+_URL = 0x13
+_ENUM = 0x14
+_TIMEDELTA = 0x15
+_PATTERN = 0x16
+_PATTERN_SET = 0x17
+_MODEL = 0x20
+
+_SCHEMA_DIGESTS: 'weakref.WeakKeyDictionary[Type[Model], bytes]' = weakref.WeakKeyDictionary()
+_LAYOUTS: 'weakref.WeakKeyDictionary[Type[Model], List[Tuple[str, Optional[Type[Model]]]]]' = weakref.WeakKeyDictionary()
+
+
+def _get_schema_digest(model: Type[Model]) -> bytes:
+    # Values are stored by position, a payload can only be read by a model with the same fields.
+    digest = _SCHEMA_DIGESTS.get(model)
+
+    if digest is None:
+        digest = _SCHEMA_DIGESTS[model] = hashlib.sha256(
+            _describe_schema(model).encode('utf-8'),
+        ).digest()[:8]
+
+    return digest
+
+
+def _get_layout(model: Type[Model]) -> List[Tuple[str, Optional[Type[Model]]]]:
+    # Field keys with the model types of nested model fields, in field order.
+    layout = _LAYOUTS.get(model)
+
+    if layout is None:
+        layout = _LAYOUTS[model] = [
+            (key, field.model_type if isinstance(field, ModelDefinition) else None)
+            for key, field in model.iter_fields()
+        ]
+
+    return layout
+
+
+def _describe_schema(model: Type[Model]) -> str:
+    return '{}({})'.format(
+        model.__qualname__,
+        ','.join(
+            f"{key}:{_describe_schema(field.model_type) if isinstance(field, ModelDefinition) else field.return_type!r}"
+            for key, field in model.iter_fields()
+        ),
+    )
+
+
+def _write_varint(out: bytearray, value: int) -> None:
+    while value > 0x7f:
+        out.append(value & 0x7f | 0x80)
+        value >>= 7
+
+    out.append(value)
+
+
+def _write_sized(out: bytearray, tag: int, value: Buffer) -> None:
+    out.append(tag)
+    _write_varint(out, len(value))
+    out += value
+
+
+def _write_str(out: bytearray, tag: int, value: str) -> None:
+    _write_sized(out, tag, value.encode('utf-8'))
+
+
+def _write_int(out: bytearray, value: int) -> None:
+    out.append(_INT)
+    # Zigzag, small negative numbers stay short.
+    _write_varint(out, value << 1 if value >= 0 else (-value << 1) - 1)
+
+
+def _write_float(out: bytearray, value: float) -> None:
+    out.append(_FLOAT_TAG)
+    out += _FLOAT.pack(value)
+
+
+def _write_items(out: bytearray, tag: int, value: Any) -> None:
+    out.append(tag)
+    _write_varint(out, len(value))
+
+    for item in value:
+        _write_value(out, item)
+
+
+def _write_mapping(out: bytearray, tag: int, value: Any) -> None:
+    out.append(tag)
+    _write_varint(out, len(value))
+
+    for key, item in value.items():
+        _write_value(out, key)
+        _write_value(out, item)
+
+
+def _write_enum(out: bytearray, value: enum.Enum) -> None:
+    out.append(_ENUM)
+    _write_str(out, _STR, f"{type(value).__module__}:{type(value).__qualname__}")
+    _write_str(out, _STR, value.name)
+
+
+def _write_timedelta(out: bytearray, value: timedelta) -> None:
+    out.append(_TIMEDELTA)
+    _write_int(out, value.days)
+    _write_int(out, value.seconds)
+    _write_int(out, value.microseconds)
+
+
+def _write_pattern(out: bytearray, value: re.Pattern) -> None:
+    out.append(_PATTERN)
+    _write_value(out, value.pattern)
+    _write_int(out, value.flags)
+
+
+def _write_pattern_set(out: bytearray, value: Any) -> None:
+    out.append(_PATTERN_SET)
+    _write_items(out, _TUPLE, value.patterns)
+    _write_int(out, value.flags)
+
+
+def _write_model(out: bytearray, value: Model) -> None:
+    out.append(_MODEL)
+    _write_values(out, value)
+
+
+def _write_values(out: bytearray, value: Model) -> None:
+    # Values are read back by position, they are written in field order whatever the data order.
+    data = dict(value)
+
+    for key, _ in _get_layout(type(value)):
+        _write_value(out, data.get(key))
+
+
+_WRITERS: Dict[type, Callable[[bytearray, Any], None]] = {
+    type(None): lambda out, value: out.append(_NONE),
+    bool: lambda out, value: out.append(_TRUE if value else _FALSE),
+    int: _write_int,
+    float: _write_float,
+    str: lambda out, value: _write_str(out, _STR, value),
+    bytes: lambda out, value: _write_sized(out, _BYTES, value),
+    list: lambda out, value: _write_items(out, _LIST, value),
+    tuple: lambda out, value: _write_items(out, _TUPLE, value),
+    dict: lambda out, value: _write_mapping(out, _DICT, value),
+    MappingProxyType: lambda out, value: _write_mapping(out, _FROZEN_DICT, value),
+    set: lambda out, value: _write_items(out, _SET, value),
+    frozenset: lambda out, value: _write_items(out, _FROZEN_SET, value),
+    Path: lambda out, value: _write_str(out, _PATH, str(value)),
+    IPv4Address: lambda out, value: _write_sized(out, _IPV4, value.packed),
+    IPv6Address: lambda out, value: _write_sized(out, _IPV6, value.packed),
+    ParseResult: lambda out, value: _write_str(out, _URL, value.geturl()),
+    enum.Enum: _write_enum,
+    timedelta: _write_timedelta,
+    re.Pattern: _write_pattern,
+    Model: _write_model,
+}
+
+
+def _get_writer(value_type: type) -> Callable[[bytearray, Any], None]:
+    writer = _WRITERS.get(value_type)
+
+    if writer is None:
+        # Enum members of int or str enums must not be written as their plain values.
+        bases = (enum.Enum,) if issubclass(value_type, enum.Enum) else value_type.__mro__
+        writer = next(
+            (_WRITERS[base] for base in bases if base in _WRITERS),
+            None,
+        ) or _get_field_type_writer(value_type)
+
+        if writer is None:
+            raise TypeError("Value type can not be encoded!", value_type)
+
+        # Subclasses (e.g. PosixPath, enum members) resolve once.
+        _WRITERS[value_type] = writer
+
+    return writer
+
+
+def _get_field_type_writer(value_type: type) -> Optional[Callable[[bytearray, Any], None]]:
+    # Types of lazily imported field modules, they are only looked up when already loaded.
+    regex_field = sys.modules.get('configoo.field.regex_field')
+    if regex_field is not None and issubclass(value_type, regex_field.PatternSet):
+        return _write_pattern_set
+
+    bytes_field = sys.modules.get('configoo.field.bytes_field')
+    if bytes_field is not None and issubclass(value_type, bytes_field.LazyBytes):
+        return lambda out, value: _write_sized(out, _BYTES, value.bytes)
+
+    return None
+
+
+def _write_value(out: bytearray, value: Any) -> None:
+    (_WRITERS.get(type(value)) or _get_writer(type(value)))(out, value)
+
+
+class _Reader:
+    __slots__ = (
+        '__view',
+        '__offset',
+    )
+
+    def __init__(self, view: memoryview, offset: int) -> None:
+        self.__view = view
+        self.__offset = offset
+
+    @property
+    def offset(self) -> int:
+        return self.__offset
+
+    def read_varint(self) -> int:
+        view = self.__view
+        offset = self.__offset
+        value = shift = 0
+
+        while True:
+            byte = view[offset]
+            offset += 1
+            value |= (byte & 0x7f) << shift
+
+            if byte < 0x80:
+                self.__offset = offset
+                return value
+
+            shift += 7
+
+    def read_view(self) -> memoryview:
+        size = self.read_varint()
+        offset = self.__offset
+        self.__offset = offset + size
+
+        if self.__offset > len(self.__view):
+            raise LoaderError("Binary config is truncated!")
+
+        return self.__view[offset:self.__offset]
+
+    def read_str(self) -> str:
+        # Decoded straight from the buffer, no intermediate bytes object.
+        return str(self.read_view(), 'utf-8')
+
+    def read_float(self) -> float:
+        value, = _FLOAT.unpack_from(self.__view, self.__offset)
+        self.__offset += _FLOAT.size
+        return value
+
+    def read_tag(self) -> int:
+        tag = self.__view[self.__offset]
+        self.__offset += 1
+        return tag
+
+    def read_value(self) -> Any:
+        view = self.__view
+        offset = self.__offset
+        tag = view[offset]
+
+        # Short scalars are the most common values, they are read without further calls.
+        if tag == _STR or tag == _INT:
+            size = view[offset + 1]
+
+            if size < 0x80:
+                end = self.__offset = offset + 2 + size if tag == _STR else offset + 2
+
+                if tag == _INT:
+                    return size >> 1 if not size & 1 else -((size + 1) >> 1)
+                if end > len(view):
+                    raise LoaderError("Binary config is truncated!")
+
+                return str(view[offset + 2:end], 'utf-8')
+
+        elif tag == _NONE:
+            self.__offset = offset + 1
+            return None
+
+        reader = _READERS.get(tag)
+        if reader is None:
+            raise LoaderError("Unknown binary config value tag!", tag)
+
+        self.__offset = offset + 1
+        return reader(self)
+
+    def read_model(self, model: Type[M], snapshot: bool) -> M:
+        data = {}
+
+        for key, model_type in _get_layout(model):
+            if model_type is not None and self.__view[self.__offset] == _MODEL:
+                self.__offset += 1
+                data[key] = self.read_model(model_type, snapshot)
+            else:
+                data[key] = self.read_value()
+
+        # Values are trusted as written, frozen containers of snapshots are stored as such.
+        return model.from_trusted_data(data, snapshot)
+
+
+def _read_int(reader: _Reader) -> int:
+    value = reader.read_varint()
+    return value >> 1 if not value & 1 else -((value + 1) >> 1)
+
+
+def _read_items(reader: _Reader) -> list:
+    return [reader.read_value() for _ in range(reader.read_varint())]
+
+
+def _read_mapping(reader: _Reader) -> dict:
+    # Keys and values are read in separate statements, comprehensions evaluate
+    # the value before the key on Python 3.7.
+    data = {}
+
+    for _ in range(reader.read_varint()):
+        key = reader.read_value()
+        data[key] = reader.read_value()
+
+    return data
+
+
+def _read_enum(reader: _Reader) -> enum.Enum:
+    reference = reader.read_value()
+    name = reader.read_value()
+    module_name, _, qualname = reference.partition(':')
+
+    # Only enums of already imported modules are resolved, the payload never triggers imports.
+    value = sys.modules.get(module_name)
+    for part in qualname.split('.'):
+        value = getattr(value, part, None)
+
+    if not isinstance(value, enum.EnumMeta):
+        raise LoaderError("Unknown binary config enum!", reference)
+
+    return value[name]
+
+
+def _read_pattern(reader: _Reader) -> re.Pattern:
+    from .field.regex_field import compile_pattern
+
+    pattern = reader.read_value()
+    return compile_pattern(pattern, reader.read_value())
+
+
+def _read_pattern_set(reader: _Reader) -> Any:
+    from .field.regex_field import PatternSet
+
+    patterns = reader.read_value()
+    return PatternSet(patterns, reader.read_value())
+
+
+def _read_value_int(reader: _Reader) -> int:
+    if reader.read_tag() != _INT:
+        raise LoaderError("Invalid binary config integer!")
+
+    return _read_int(reader)
+
+
+def _read_model(reader: _Reader) -> Any:
+    raise LoaderError("Nested model value outside of a model field!")
+
+
+_READERS: Dict[int, Callable[[_Reader], Any]] = {
+    _NONE: lambda reader: None,
+    _FALSE: lambda reader: False,
+    _TRUE: lambda reader: True,
+    _INT: _read_int,
+    _FLOAT_TAG: lambda reader: reader.read_float(),
+    _STR: lambda reader: reader.read_str(),
+    _BYTES: lambda reader: bytes(reader.read_view()),
+    _LIST: _read_items,
+    _TUPLE: lambda reader: tuple(_read_items(reader)),
+    _DICT: _read_mapping,
+    _FROZEN_DICT: lambda reader: MappingProxyType(_read_mapping(reader)),
+    _SET: lambda reader: set(_read_items(reader)),
+    _FROZEN_SET: lambda reader: frozenset(_read_items(reader)),
+    _PATH: lambda reader: Path(reader.read_str()),
+    _IPV4: lambda reader: IPv4Address(bytes(reader.read_view())),
+    _IPV6: lambda reader: IPv6Address(bytes(reader.read_view())),
+    _URL: lambda reader: urlparse(reader.read_str()),
+    _ENUM: _read_enum,
+    _TIMEDELTA: lambda reader: timedelta(_read_value_int(reader), _read_value_int(reader), _read_value_int(reader)),
+    _PATTERN: _read_pattern,
+    _PATTERN_SET: _read_pattern_set,
+    _MODEL: _read_model,
+}
+
+
+def dump_to_binary(config: Model) -> bytes:
+    out = bytearray(_HEADER.pack(
+        _MAGIC,
+        _VERSION,
+        _SNAPSHOT_FLAG if config.is_snapshot else 0,
+        _get_schema_digest(type(config)),
+    ))
+
+    _write_values(out, config)
+
+    return bytes(out)
+
+
+def load_from_binary(
+        model: Type[M],
+        data: Buffer,
+) -> M:
+    view = memoryview(data).cast('B')
+
+    if len(view) < _HEADER.size:
+        raise LoaderError("Binary config is truncated!")
+
+    magic, version, flags, digest = _HEADER.unpack_from(view, 0)
+
+    if magic != _MAGIC or version != _VERSION:
+        raise LoaderError("Unsupported binary config format!", magic, version)
+
+    if digest != _get_schema_digest(model):
+        raise LoaderError("Binary config was written for other model fields!", model)
+
+    reader = _Reader(view, _HEADER.size)
+
+    try:
+        config = reader.read_model(model, bool(flags & _SNAPSHOT_FLAG))
+
+    except (IndexError, KeyError, TypeError, ValueError, struct.error) as err:
+        raise LoaderError("Binary config is corrupted!") from err
+
+    if reader.offset != len(view):
+        raise LoaderError("Binary config has trailing data!")
+
+    return config
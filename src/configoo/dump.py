@@ -0,0 +1,145 @@
+from typing import Any, Callable, Dict, Iterable, Iterator, Tuple, Optional, TYPE_CHECKING
+import json
+
+from .exception import FieldValueError
+from .field import FieldDefinition
+from .model import Model, ModelDefinition
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+__all__ = [
+    'dump_to_env',
+    'dump_to_dotenv',
+    'dump_to_json',
+]
+
+
+_DOTENV_ESCAPES = str.maketrans({
+    '\\': '\\\\',
+    "'": "\\'",
+})
+
+
+def _iter_values(
+        fields: Iterable[Tuple[str, FieldDefinition]],
+        config: Model,
+) -> Iterator[Tuple[FieldDefinition, Any]]:
+    for key, definition in fields:
+        value = getattr(config, key)
+
+        if isinstance(definition, ModelDefinition):
+            # Loaders read nested models from the prefixed (or scoped) definitions of their fields.
+            if value is not None:
+                yield from _iter_values(definition.fields.items(), value)
+
+            continue
+
+        if value is None:
+            # A missing value is loaded as the default, an unset field can only be dumped without one.
+            if definition.default is not None:
+                raise FieldValueError(
+                    "Unset value of a field with a default can not be dumped!",
+                    definition,
+                )
+
+            continue
+
+        yield definition, value
+
+
+def _escape_file_reference(value: Any, prefix: Optional[str]) -> Any:
+    # Loaders with a file reference prefix read a doubled prefix as a literal one.
+    if prefix is not None and isinstance(value, str) and value.startswith(prefix):
+        return prefix + value
+
+    return value
+
+
+def _serialize(
+        definition: FieldDefinition,
+        serializer: Callable[[Any], Any],
+        value: Any,
+) -> Any:
+    try:
+        return serializer(value)
+
+    except FieldValueError as err:
+        raise FieldValueError(
+            "Field value can not be dumped!",
+            definition,
+        ) from err
+
+
+def dump_to_env(
+        config: Model,
+        file_reference_prefix: str = None,
+) -> Dict[str, str]:
+    env = {}
+
+    for definition, value in _iter_values(type(config).iter_fields(), config):
+        clean_value = _serialize(definition, definition.serializer, value)
+
+        if '\0' in clean_value:
+            raise FieldValueError(
+                "Environment values can not contain null characters!",
+                definition,
+            )
+
+        clean_value = _escape_file_reference(clean_value, file_reference_prefix)
+
+        # Nested models without a prefix read the names of other fields, they must agree on the value.
+        if env.setdefault(definition.name, clean_value) != clean_value:
+            raise FieldValueError(
+                "Fields sharing the environment name have different values!",
+                definition,
+            )
+
+    return env
+
+
+def dump_to_dotenv(
+        config: Model,
+        path: 'Path' = None,
+        file_reference_prefix: str = None,
+) -> str:
+    # Single quoted values are read literally, only quotes and backslashes are escaped.
+    content = ''.join(
+        f"{key}='{value.translate(_DOTENV_ESCAPES)}'\n"
+        for key, value in dump_to_env(config, file_reference_prefix).items()
+    )
+
+    if path is not None:
+        with open(path, 'w') as fd:
+            fd.write(content)
+
+    return content
+
+
+def dump_to_json(
+        config: Model,
+        path: 'Path' = None,
+        file_reference_prefix: str = None,
+        indent: int = None,
+) -> str:
+    data = {}
+
+    for definition, value in _iter_values(type(config).iter_fields(), config):
+        *parents, key = definition.accessor
+        node = data
+
+        for parent in parents:
+            node = node.setdefault(parent, {})
+
+        node[key] = _escape_file_reference(
+            _serialize(definition, definition.json_serializer, value),
+            file_reference_prefix,
+        )
+
+    content = json.dumps(data, indent=indent)
+
+    if path is not None:
+        with open(path, 'w') as fd:
+            fd.write(content)
+
+    return content
@@ -1,11 +1,25 @@
-from .base import *
-from .int_field import *
-from .float_field import *
-from .num_field import *
-from .str_field import *
-from .enum_field import *
-from .log import *
-from .path_field import *
-from .url import *
-from .list_field import *
-from .dict_field import *
+from .._lazy import lazy_exports
+
+_names, __getattr__, __dir__ = lazy_exports(__name__, {
+    '.base': ('Field', 'FieldDefinition', 'ParserCache', 'PT', 'RT', 'compile_field_path', 'defer_default'),
+    '.coercion': (
+        'CoercionRegistry', 'COERCIONS', 'register_coercion', 'resolve_coercion', 'is_identity', 'coerce',
+        'Canonical', 'pack_canonical', 'encode_canonical',
+    ),
+    '.int_field': ('IntField',),
+    '.float_field': ('FloatField',),
+    '.num_field': ('NumField',),
+    '.str_field': ('StrField',),
+    '.enum_field': ('EnumField',),
+    '.log': ('LoggingLevelField', 'LoggingFormatField', 'LoggingBracketFormatField'),
+    '.path_field': ('PathField', 'FilePathField', 'DirectoryPathField'),
+    '.url': ('UrlField', 'RouteField', 'IpField', 'PortField'),
+    '.unit_field': ('ByteSizeField', 'DurationField', 'parse_byte_size', 'parse_duration'),
+    '.list_field': ('ListField',),
+    '.dict_field': ('DictField',),
+    '.regex_field': ('RegexField', 'RegexListField', 'PatternSet', 'compile_pattern'),
+    '.resource_field': ('CpuCountField', 'MemoryLimitField', 'get_cpu_count', 'get_memory_limit'),
+    '.bytes_field': ('BytesField', 'LazyBytes'),
+})
+
+__all__ = _names
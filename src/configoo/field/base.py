@@ -1,10 +1,20 @@
-from typing import Optional, Any, TypeVar, Type, Generic, Callable
+from typing import Optional, Any, TypeVar, Type, Generic, Callable, TextIO, Tuple, Dict, Mapping, Hashable, Iterable
+from functools import partial
+from collections import abc
+import copy
+import enum
+import threading
+
+from .coercion import COERCIONS, resolve_coercion
 
 __all__ = [
     'Field',
     'FieldDefinition',
+    'ParserCache',
     'PT',
     'RT',
+    'compile_field_path',
+    'defer_default',
 ]
 
 
@@ -13,7 +23,215 @@ PT = TypeVar('PT')
 RT = TypeVar('RT')
 
 
+class _LazyDefault:
+    # Shared by prefixed copies of a definition, so the factory is called once per model class.
+    __LOCK = threading.RLock()
+
+    __slots__ = (
+        '__factory',
+        '__value',
+    )
+
+    def __init__(self, factory: Callable[[], Any]) -> None:
+        self.__factory = factory
+        self.__value = None
+
+    def get(self) -> Any:
+        if self.__factory is not None:
+            with self.__LOCK:
+                if self.__factory is not None:
+                    self.__value = self.__factory()
+                    self.__factory = None
+
+        return self.__value
+
+
+class _ParserTable(Generic[RT]):
+    # Parsers specialized per value type, shared by all copies of a definition.
+    __slots__ = (
+        '__factory',
+        '__parsers',
+        '__generation',
+    )
+
+    def __init__(self, factory: Callable[[type], Callable[[Any], RT]]) -> None:
+        self.__factory = factory
+        self.__parsers: Optional[Dict[type, Callable[[Any], RT]]] = None
+        self.__generation = 0
+
+    def get(self, value_type: type) -> Callable[[Any], RT]:
+        # Most fields never see typed values, the dict is only created on first use.
+        # It is recreated when coercions are registered after the parsers were built.
+        if self.__parsers is None or self.__generation != COERCIONS.generation:
+            self.__parsers = {}
+            self.__generation = COERCIONS.generation
+
+        parser = self.__parsers.get(value_type)
+
+        if parser is None:
+            parser = self.__parsers[value_type] = self.__factory(value_type)
+
+        return parser
+
+
+class ParserCache(_ParserTable[RT]):
+    __slots__ = (
+        '__field',
+    )
+
+    def __init__(self, field: 'Field[Any, RT]') -> None:
+        super().__init__(self.__create_parser)
+        self.__field = field
+
+    @property
+    def field(self) -> 'Field[Any, RT]':
+        return self.__field
+
+    def __create_parser(self, value_type: type) -> Callable[[Any], RT]:
+        return self.__field.create_parser(value_type)
+
+
+def _get_spec_slots(cls: type) -> Optional[Tuple[str, ...]]:
+    slots = _SPEC_SLOTS.get(cls)
+
+    if slots is None:
+        slots = []
+
+        for base in cls.__mro__:
+            if base is not object and '__slots__' not in base.__dict__:
+                # Attributes stored in an instance dict can not be compared reliably.
+                slots = None
+                break
+
+            prefix = '_' + base.__name__.lstrip('_')
+            slots.extend(
+                prefix + slot if slot.startswith('__') else slot
+                for slot in base.__dict__.get('__slots__', ())
+                if slot != '__weakref__'
+            )
+
+        _SPEC_SLOTS[cls] = slots = tuple(slots) if slots is not None else ()
+
+    return slots or None
+
+
+_SPEC_SCALARS = frozenset((type(None), bool, int, float, str, bytes))
+
+
+def _freeze_spec_values(values: Iterable[Any]) -> Tuple[Hashable, ...]:
+    # Frozen values followed by their types in one flat tuple, equal values like 1 and True
+    # or [] and () must not share a definition. Scalars are taken as they are.
+    values = tuple(values)
+
+    return tuple(
+        value if type(value) in _SPEC_SCALARS else _freeze_spec_value(value)
+        for value in values
+    ) + tuple(map(type, values))
+
+
+def _freeze_spec_value(value: Any) -> Hashable:
+    if isinstance(value, (type, enum.Enum)):
+        return value
+
+    if isinstance(value, Field):
+        spec = value.get_spec()
+        if spec is None:
+            raise TypeError("Field spec is not hashable!", value)
+
+        return spec
+
+    if isinstance(value, ParserCache):
+        # Parser caches are built from a dtype of the field, which is a part of the spec already.
+        return None
+
+    if isinstance(value, (list, tuple)):
+        return _freeze_spec_values(value)
+    if isinstance(value, abc.Mapping):
+        return _freeze_spec_values(value.keys()) + _freeze_spec_values(value.values())
+    if isinstance(value, (set, frozenset)):
+        return frozenset(value)
+
+    hash(value)
+    return value
+
+
+_SPEC_SLOTS: Dict[type, Tuple[str, ...]] = {}
+
+
+def compile_field_path(path: str) -> Tuple[str, ...]:
+    # JSON pointer (RFC 6901): "/db/pool/max_size", dotted path otherwise: "db.pool.max_size".
+    if path.startswith('/'):
+        return tuple(
+            part.replace('~1', '/').replace('~0', '~')
+            for part in path[1:].split('/')
+        )
+
+    return tuple(path.split('.'))
+
+
+def defer_default(
+        parser: Callable[[Any], Any],
+        default: Any,
+        default_factory: Optional[Callable[[], Any]],
+) -> Tuple[None, Callable[[], Any]]:
+    # Raw defaults are parsed on first use, a factory passed as well would be silently dropped.
+    if default_factory is not None:
+        raise ValueError(
+            "Field must have either a default value or a default factory!",
+        )
+
+    return None, partial(parser, default)
+
+
 class Field(Generic[PT, RT]):
+    class Merge(enum.Enum):
+        REPLACE = 'replace'
+        DEEP_MERGE = 'deep_merge'
+        APPEND = 'append'
+
+        def apply(self, base: Any, override: Any) -> Any:
+            if self is self.REPLACE or base is None or override is None:
+                return override
+            if self is self.APPEND:
+                return self._append(base, override)
+
+            return self._deep_merge(base, override)
+
+        @staticmethod
+        def _append(base: Any, override: Any) -> Any:
+            if isinstance(base, Mapping) and isinstance(override, Mapping):
+                return {**base, **override}
+
+            if isinstance(base, (list, tuple)) and isinstance(override, (list, tuple)):
+                return base + type(base)(override)
+
+            return override
+
+        @staticmethod
+        def _deep_merge(base: Any, override: Any) -> Any:
+            if not isinstance(base, Mapping) or not isinstance(override, Mapping):
+                return override
+
+            # Only the mappings on the way to overridden keys are rebuilt, untouched subtrees are shared.
+            merged = dict(base)
+
+            for key, value in override.items():
+                merged[key] = Field.Merge._deep_merge(merged[key], value) if key in merged else value
+
+            return merged
+
+    __slots__ = (
+        '__name',
+        '__required',
+        '__default',
+        '__default_factory',
+        '__description',
+        '__path',
+        '__parse_type',
+        '__return_type',
+        '__merge',
+    )
+
     def __init__(
             self,
             name: str = None,
@@ -22,13 +240,20 @@ class Field(Generic[PT, RT]):
             description: str = None,
             parse_type: Type[PT] = None,
             return_type: Type[RT] = None,
+            merge: 'Field.Merge' = None,
+            *,
+            path: str = None,
+            default_factory: Callable[[], Any] = None,
     ) -> None:
         self.__name = name
         self.__required = required
         self.__default = default
+        self.__default_factory = default_factory
         self.__description = description
+        self.__path = path
         self.__parse_type = parse_type
         self.__return_type = return_type
+        self.__merge = merge or self.Merge.REPLACE
     
     @property
     def name(self) -> Optional[str]:
@@ -54,6 +279,14 @@ class Field(Generic[PT, RT]):
     def default(self, value: Any) -> None:
         self.__default = value
     
+    @property
+    def default_factory(self) -> Optional[Callable[[], Any]]:
+        return self.__default_factory
+    
+    @default_factory.setter
+    def default_factory(self, value: Optional[Callable[[], Any]]) -> None:
+        self.__default_factory = value
+    
     @property
     def description(self) -> Optional[str]:
         return self.__description
@@ -62,6 +295,14 @@ class Field(Generic[PT, RT]):
     def description(self, value: Optional[str]) -> None:
         self.__description = value
     
+    @property
+    def path(self) -> Optional[str]:
+        return self.__path
+    
+    @path.setter
+    def path(self, value: Optional[str]) -> None:
+        self.__path = value
+    
     @property
     def parse_type(self) -> Type[PT]:
         return self.__parse_type
@@ -78,8 +319,53 @@ class Field(Generic[PT, RT]):
     def return_type(self, value: Type[RT]) -> None:
         self.__return_type = value
     
+    @property
+    def merge(self) -> 'Field.Merge':
+        return self.__merge
+    
+    @merge.setter
+    def merge(self, value: 'Field.Merge') -> None:
+        self.__merge = value or self.Merge.REPLACE
+    
     def parse(self, value: PT) -> RT:
         raise NotImplementedError
+
+    def parse_file(self, fd: TextIO) -> RT:
+        return self.parse(fd.read().rstrip('\r\n'))
+
+    def serialize(self, value: RT) -> str:
+        # Inverse of parse, the string is parsed back to an equal value.
+        return str(value)
+
+    def serialize_json(self, value: RT) -> Any:
+        # Typed sources take native values, fields of JSON types return them unchanged.
+        return self.serialize(value)
+
+    def get_spec(self) -> Optional[Hashable]:
+        # Fields with equal specs define interchangeable definitions, None when the spec is not comparable.
+        slots = _get_spec_slots(type(self))
+        if slots is None:
+            return None
+
+        try:
+            return (type(self),) + _freeze_spec_values(
+                getattr(self, slot, None)
+                for slot in slots
+            )
+
+        except TypeError:
+            return None
+
+    def get_coercion(self, value_type: type, target_type: Any = None) -> Callable[[Any], Any]:
+        return resolve_coercion(value_type, self.return_type if target_type is None else target_type)
+
+    def coerce(self, value: Any, target_type: Any = None) -> Any:
+        return self.get_coercion(type(value), target_type)(value)
+
+    def create_parser(self, value_type: type) -> Callable[[Any], RT]:
+        # Specializations for already typed values must fall back to parse when a
+        # subclass overrides it, otherwise its conversion would be skipped.
+        return self.parse
     
     def define(
             self,
@@ -89,6 +375,28 @@ class Field(Generic[PT, RT]):
 
 
 class FieldDefinition(Generic[PT, RT]):
+    __slots__ = (
+        '__model',
+        '__name',
+        '__required',
+        '__default',
+        '__default_factory',
+        '__lazy_default',
+        '__description',
+        '__path',
+        '__accessor',
+        '__parse_type',
+        '__return_type',
+        '__parser',
+        '__file_parser',
+        '__parser_factory',
+        '__parsers',
+        '__serializer',
+        '__json_serializer',
+        '__merge',
+        '__weakref__',
+    )
+
     @classmethod
     def create_from_model_field(
             cls,
@@ -100,10 +408,17 @@ class FieldDefinition(Generic[PT, RT]):
             name=field.name,
             required=field.required,
             default=field.default,
+            default_factory=field.default_factory,
             description=field.description,
+            path=field.path,
             parse_type=field.parse_type,
             return_type=field.return_type,
             parser=field.parse,
+            file_parser=field.parse_file,
+            parser_factory=field.create_parser,
+            serializer=field.serialize,
+            json_serializer=field.serialize_json,
+            merge=field.merge,
         )
 
     def __init__(
@@ -113,31 +428,76 @@ class FieldDefinition(Generic[PT, RT]):
             name: str,
             required: bool,
             default: Any,
+            default_factory: Callable[[], Any] = None,
             description: Optional[str],
+            path: Optional[str],
             parse_type: Type[PT],
             return_type: Type[RT],
             parser: Callable[[PT], RT],
+            file_parser: Callable[[TextIO], RT] = None,
+            parser_factory: Callable[[type], Callable[[Any], RT]] = None,
+            serializer: Callable[[RT], str] = None,
+            json_serializer: Callable[[RT], Any] = None,
+            merge: Field.Merge = None,
     ) -> None:
-        if required and default is not None:
+        if required and (default is not None or default_factory is not None):
             raise ValueError(
                 "Field must be either required or has a default value!",
             )
 
+        if default is not None and default_factory is not None:
+            raise ValueError(
+                "Field must have either a default value or a default factory!",
+            )
+
         self.__model = model
         self.__name = name
         self.__required = required
         self.__default = default
+        self.__default_factory = default_factory
+        self.__lazy_default = _LazyDefault(default_factory) if default_factory is not None else None
         self.__description = description
+        self.__path = path
+        self.__accessor = compile_field_path(path) if path else (name,)
         
         self.__parse_type = parse_type
         self.__return_type = return_type
         self.__parser = parser
+        self.__file_parser = file_parser or self.__parse_file
+        self.__parser_factory = parser_factory
+        self.__parsers = _ParserTable(parser_factory or self.__get_default_parser)
+        self.__serializer = serializer or str
+        self.__json_serializer = json_serializer or self.__serializer
+        self.__merge = merge or Field.Merge.REPLACE
     
     def __str__(self) -> str:
         return f"{self.model.__name__}.{self.name}"
     
     __repr__ = __str__
+
+    def prefixed(
+            self,
+            prefix: str,
+            scope: Tuple[str, ...] = (),
+    ) -> 'FieldDefinition[PT, RT]':
+        # Nested path scope keeps the original keys, flat name spaces use prefixed names.
+        definition = copy.copy(self)
+        definition.__name = prefix + self.__name
+
+        if scope:
+            definition.__accessor = scope + self.__accessor
+        elif not self.__path:
+            definition.__accessor = (definition.__name,)
+
+        return definition
     
+    def bound(self, model: 'Model') -> 'FieldDefinition[PT, RT]':
+        # Copies owned by another model share the parsers and the lazy default.
+        definition = copy.copy(self)
+        definition.__model = model
+
+        return definition
+
     @property
     def model(self) -> 'Model':
         return self.__model
@@ -152,12 +512,27 @@ class FieldDefinition(Generic[PT, RT]):
     
     @property
     def default(self) -> Any:
+        if self.__lazy_default is not None:
+            return self.__lazy_default.get()
+
         return self.__default
     
+    @property
+    def default_factory(self) -> Optional[Callable[[], Any]]:
+        return self.__default_factory
+    
     @property
     def description(self) -> Optional[str]:
         return self.__description
     
+    @property
+    def path(self) -> Optional[str]:
+        return self.__path
+    
+    @property
+    def accessor(self) -> Tuple[str, ...]:
+        return self.__accessor
+    
     @property
     def parse_type(self) -> Type[PT]:
         return self.__parse_type
@@ -166,6 +541,35 @@ class FieldDefinition(Generic[PT, RT]):
     def return_type(self) -> Type[RT]:
         return self.__return_type
     
+    @property
+    def merge(self) -> Field.Merge:
+        return self.__merge
+    
     @property
     def parser(self) -> Callable[[PT], RT]:
         return self.__parser
+    
+    @property
+    def file_parser(self) -> Callable[[TextIO], RT]:
+        return self.__file_parser
+
+    @property
+    def serializer(self) -> Callable[[RT], str]:
+        return self.__serializer
+
+    @property
+    def json_serializer(self) -> Callable[[RT], Any]:
+        return self.__json_serializer
+
+    def get_parser(self, value_type: type) -> Callable[[Any], RT]:
+        # Typed sources (e.g. JSON) pick a specialized conversion once per value type.
+        return self.__parsers.get(value_type)
+
+    def __get_default_parser(self, value_type: type) -> Callable[[Any], RT]:
+        return self.__parser
+
+    def merge_values(self, base: RT, override: RT) -> RT:
+        return self.__merge.apply(base, override)
+
+    def __parse_file(self, fd: TextIO) -> RT:
+        return self.__parser(fd.read().rstrip('\r\n'))
@@ -0,0 +1,202 @@
+from typing import Union, Optional, Callable
+import enum
+import re
+import base64
+import binascii
+
+from .base import Field, PT, RT
+from .coercion import register_coercion, encode_canonical, Canonical
+from ..exception import FieldValueError
+
+__all__ = [
+    'BytesField',
+    'LazyBytes',
+]
+
+
+class LazyBytes:
+    __slots__ = (
+        '__encoded',
+        '__encoding',
+        '__length',
+        '__value',
+    )
+
+    def __init__(
+            self,
+            encoded: str,
+            encoding: 'BytesField.Encoding',
+    ) -> None:
+        self.__encoded = encoded
+        self.__encoding = encoding
+        self.__length = encoding.get_decoded_length(encoded)
+        self.__value: Optional[bytes] = None
+
+    def __bytes__(self) -> bytes:
+        return self.bytes
+
+    def __len__(self) -> int:
+        return self.__length
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, LazyBytes):
+            return self.bytes == other.bytes
+
+        if isinstance(other, (bytes, bytearray, memoryview)):
+            return self.bytes == other
+
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash(self.bytes)
+
+    def __str__(self) -> str:
+        # Secrets should never be rendered into logs with the model.
+        return f"{self.__class__.__name__}(<{self.__length} bytes>)"
+
+    __repr__ = __str__
+
+    @property
+    def decoded(self) -> bool:
+        return self.__value is not None
+
+    @property
+    def bytes(self) -> bytes:
+        if self.__value is None:
+            self.__value = self.__encoding.decode(self.__encoded)
+            self.__encoded = None
+
+        return self.__value
+
+    @property
+    def view(self) -> memoryview:
+        return memoryview(self.bytes)
+
+
+# Encoded as the decoded bytes, the same as the eager field value.
+register_coercion(LazyBytes, Canonical, lambda value: encode_canonical(value.bytes))
+
+
+class BytesField(Field[str, bytes]):
+    class Encoding(enum.Enum):
+        BASE64 = 'base64'
+        URLSAFE_BASE64 = 'urlsafe_base64'
+        HEX = 'hex'
+
+        def normalize(self, value: str) -> str:
+            value = ''.join(value.split())
+
+            if self is not self.HEX:
+                value += '=' * (-len(value) % 4)
+
+            return value
+
+        def check(self, value: str) -> bool:
+            return _ALPHABETS[self].fullmatch(value) is not None
+
+        def decode(self, value: str) -> bytes:
+            if self is self.HEX:
+                return bytes.fromhex(value)
+            if self is self.URLSAFE_BASE64:
+                return base64.b64decode(value, altchars=b'-_', validate=True)
+
+            return base64.b64decode(value, validate=True)
+
+        def encode(self, value: bytes) -> str:
+            if self is self.HEX:
+                return value.hex()
+            if self is self.URLSAFE_BASE64:
+                return base64.urlsafe_b64encode(value).decode('ascii')
+
+            return base64.b64encode(value).decode('ascii')
+
+        def get_decoded_length(self, value: str) -> int:
+            if self is self.HEX:
+                return len(value) // 2
+
+            return len(value) * 3 // 4 - (len(value) - len(value.rstrip('=')))
+
+    __slots__ = (
+        '__encoding',
+        '__length',
+        '__lazy',
+    )
+
+    def __init__(
+            self,
+            name: str = None,
+            required: bool = False,
+            default: bytes = None,
+            description: str = None,
+            encoding: Encoding = None,
+            length: int = None,
+            lazy: bool = False,
+            *,
+            path: str = None,
+            default_factory: Callable[[], bytes] = None,
+    ) -> None:
+        super().__init__(
+            name=name,
+            required=required,
+            default=default,
+            default_factory=default_factory,
+            description=description,
+            path=path,
+            parse_type=str,
+            return_type=LazyBytes if lazy else bytes,
+        )
+
+        self.__encoding = encoding or self.Encoding.BASE64
+        self.__length = length
+        self.__lazy = lazy
+
+    @property
+    def encoding(self) -> Encoding:
+        return self.__encoding
+
+    @encoding.setter
+    def encoding(self, value: Encoding) -> None:
+        self.__encoding = value
+
+    @property
+    def lazy(self) -> bool:
+        return self.__lazy
+
+    def parse(self, value: str) -> Union[bytes, LazyBytes]:
+        if isinstance(value, (bytes, LazyBytes)):
+            return value
+
+        try:
+            clean_value = self.__encoding.normalize(value)
+            if not self.__encoding.check(clean_value):
+                raise ValueError("Invalid encoded bytes alphabet!")
+
+            if self.__lazy:
+                clean_value = LazyBytes(clean_value, self.__encoding)
+            else:
+                clean_value = self.__encoding.decode(clean_value)
+
+        except (TypeError, AttributeError, ValueError, binascii.Error) as err:
+            raise FieldValueError(
+                "Invalid encoded bytes value!",
+                self.__encoding,
+            ) from err
+
+        if self.__length is not None and len(clean_value) != self.__length:
+            raise FieldValueError(
+                "Bytes length is invalid!",
+                len(clean_value),
+                self.__length,
+            )
+
+        return clean_value
+
+    def serialize(self, value: Union[bytes, LazyBytes]) -> str:
+        return self.__encoding.encode(bytes(value))
+
+
+_ALPHABETS = {
+    BytesField.Encoding.BASE64: re.compile(r'[A-Za-z0-9+/]*={0,2}'),
+    BytesField.Encoding.URLSAFE_BASE64: re.compile(r'[A-Za-z0-9_-]*={0,2}'),
+    BytesField.Encoding.HEX: re.compile(r'(?:[0-9a-fA-F]{2})*'),
+}
@@ -0,0 +1,198 @@
+from typing import Any, Callable, Dict, Tuple, Optional, Union, Iterator, Mapping, NewType, AbstractSet
+import enum
+import threading
+
+__all__ = [
+    'CoercionRegistry',
+    'COERCIONS',
+    'register_coercion',
+    'resolve_coercion',
+    'is_identity',
+    'coerce',
+    'Canonical',
+    'pack_canonical',
+    'encode_canonical',
+]
+
+
+Coercion = Callable[[Any], Any]
+Num = Union[int, float]
+# Target of coercions producing a stable byte encoding of values, equal across processes and hosts.
+Canonical = NewType('Canonical', bytes)
+
+
+def _identity(value: Any) -> Any:
+    return value
+
+
+def is_identity(coercion: Coercion) -> bool:
+    # Values passed through unchanged only need the field checks.
+    return coercion is _identity
+
+
+class CoercionRegistry:
+    def __init__(self) -> None:
+        self.__lock = threading.Lock()
+        self.__coercions: Dict[Tuple[type, Any], Coercion] = {}
+        self.__resolved: Dict[Tuple[type, Any], Coercion] = {}
+        self.__generation = 0
+
+    @property
+    def generation(self) -> int:
+        return self.__generation
+
+    def register(
+            self,
+            source_type: type,
+            target_type: Any,
+            coercion: Coercion = None,
+    ) -> Coercion:
+        if coercion is None:
+            return lambda func: self.register(source_type, target_type, func)
+
+        with self.__lock:
+            self.__coercions[(source_type, target_type)] = coercion
+            self.__resolved = {}
+            # Parser caches compare the generation and drop parsers built with earlier coercions.
+            self.__generation += 1
+
+        return coercion
+
+    def resolve(
+            self,
+            source_type: type,
+            target_type: Any,
+    ) -> Coercion:
+        key = (source_type, target_type)
+        coercion = self.__resolved.get(key)
+
+        if coercion is None:
+            coercion = self.__find(source_type, target_type) or self.__missing(source_type, target_type)
+            self.__resolved[key] = coercion
+
+        return coercion
+
+    def coerce(
+            self,
+            value: Any,
+            target_type: Any,
+    ) -> Any:
+        return self.resolve(type(value), target_type)(value)
+
+    def __find(self, source_type: type, target_type: Any) -> Optional[Coercion]:
+        coercions = self.__coercions
+        for base in source_type.__mro__[:-1]:
+            coercion = coercions.get((base, target_type))
+            if coercion is not None:
+                return coercion
+
+        # Abstract sources (e.g. Iterator, Mapping) do not appear in the MRO of their implementations.
+        for (registered_type, registered_target), coercion in list(coercions.items()):
+            if (
+                    registered_target == target_type
+                    and registered_type is not object
+                    and issubclass(source_type, registered_type)
+            ):
+                return coercion
+
+        return coercions.get((object, target_type))
+
+    @staticmethod
+    def __missing(source_type: type, target_type: Any) -> Coercion:
+        def coercion(value: Any) -> Any:
+            raise TypeError("Value type can not be coerced!", source_type, target_type)
+
+        return coercion
+
+
+def _str_to_num(value: str) -> Num:
+    # Integers are parsed exactly, going through float would round values above 2**53.
+    try:
+        return int(value)
+
+    except ValueError:
+        return _float_to_num(float(value))
+
+
+def _float_to_num(value: float) -> Num:
+    return int(value) if value.is_integer() else value
+
+
+def _object_to_num(value: Any) -> Num:
+    return _float_to_num(float(value))
+
+
+COERCIONS = CoercionRegistry()
+
+register_coercion = COERCIONS.register
+resolve_coercion = COERCIONS.resolve
+coerce = COERCIONS.coerce
+
+
+register_coercion(object, str, str)
+register_coercion(str, str, _identity)
+
+register_coercion(object, int, int)
+register_coercion(int, int, _identity)
+register_coercion(bool, int, int)
+
+register_coercion(object, float, float)
+register_coercion(float, float, _identity)
+
+register_coercion(object, Num, _object_to_num)
+register_coercion(str, Num, _str_to_num)
+register_coercion(int, Num, _identity)
+register_coercion(bool, Num, int)
+register_coercion(float, Num, _float_to_num)
+
+register_coercion(list, list, _identity)
+register_coercion(tuple, list, _identity)
+register_coercion(Iterator, list, _identity)
+
+register_coercion(dict, dict, dict.items)
+register_coercion(Mapping, dict, lambda value: value.items())
+register_coercion(list, dict, _identity)
+register_coercion(Iterator, dict, _identity)
+
+
+def pack_canonical(tag: str, *parts: Union[str, bytes]) -> Canonical:
+    # Parts are length prefixed, nested encodings can not run into each other.
+    packed = b''.join(
+        b'%d:%s' % (len(part), part)
+        for part in (
+            part.encode('utf-8') if isinstance(part, str) else part
+            for part in parts
+        )
+    )
+
+    return Canonical(b'%s(%s)' % (tag.encode('ascii'), packed))
+
+
+def encode_canonical(value: Any) -> Canonical:
+    return coerce(value, Canonical)
+
+
+def _sorted_canonical(tag: str, encoded: Iterator[bytes]) -> Canonical:
+    return pack_canonical(tag, *sorted(encoded))
+
+
+register_coercion(type(None), Canonical, lambda value: pack_canonical('none'))
+register_coercion(bool, Canonical, lambda value: pack_canonical('bool', str(int(value))))
+register_coercion(int, Canonical, lambda value: pack_canonical('int', str(value)))
+register_coercion(float, Canonical, lambda value: pack_canonical('float', repr(value)))
+register_coercion(str, Canonical, lambda value: pack_canonical('str', value))
+register_coercion(bytes, Canonical, lambda value: pack_canonical('bytes', value))
+register_coercion(enum.Enum, Canonical, lambda value: pack_canonical(
+    'enum',
+    f"{type(value).__module__}.{type(value).__qualname__}",
+    value.name,
+))
+
+# Frozen containers encode as the mutable ones, a snapshot and its source have the same digest.
+register_coercion(list, Canonical, lambda value: pack_canonical('seq', *map(encode_canonical, value)))
+register_coercion(tuple, Canonical, lambda value: pack_canonical('seq', *map(encode_canonical, value)))
+register_coercion(Mapping, Canonical, lambda value: _sorted_canonical('map', (
+    pack_canonical('item', encode_canonical(key), encode_canonical(item))
+    for key, item in value.items()
+)))
+register_coercion(AbstractSet, Canonical, lambda value: _sorted_canonical('set', map(encode_canonical, value)))
@@ -1,8 +1,10 @@
-from typing import Type, TypeVar, Dict, Callable, Tuple, List, Any
+from typing import Optional, Type, TypeVar, Dict, Mapping, Union, Callable, Tuple, List, Any, Iterable, Iterator, TextIO
+from functools import partial
+from types import MappingProxyType
 
 from ..exception import FieldValueError
 
-from .base import Field, PT, RT, FieldDefinition
+from .base import Field, PT, RT, FieldDefinition, ParserCache
 
 __all__ = [
     'DictField',
@@ -17,6 +19,16 @@ V = TypeVar('V')
 class DictField(Field[str, T]):
     __SEPARATOR = (':', ',')
 
+    __slots__ = (
+        '__key_dtype',
+        '__value_dtype',
+        '__separator',
+        '__not_empty',
+        '__frozen',
+        '__key_parsers',
+        '__value_parsers',
+    )
+
     def __init__(
             self,
             key_dtype: Field[str, K],
@@ -27,20 +39,31 @@ class DictField(Field[str, T]):
             description: str = None,
             separator: Tuple[str, str] = None,
             not_empty: bool = False,
+            merge: Field.Merge = None,
+            frozen: bool = False,
+            *,
+            path: str = None,
+            default_factory: Callable[[], Dict[K, V]] = None,
     ) -> None:
         super().__init__(
             name=name,
             required=required,
             default=default,
+            default_factory=default_factory,
             description=description,
+            path=path,
             parse_type=str,
-            return_type=Dict[K, V],
+            return_type=Mapping[K, V] if frozen else Dict[K, V],
+            merge=merge,
         )
 
         self.__key_dtype = key_dtype
         self.__value_dtype = value_dtype
         self.__separator = separator or self.__SEPARATOR
         self.__not_empty = not_empty
+        self.__frozen = frozen
+        self.__key_parsers = ParserCache(key_dtype)
+        self.__value_parsers = ParserCache(value_dtype)
     
     @property
     def key_dtype(self) -> Field[str, K]:
@@ -49,6 +72,7 @@ class DictField(Field[str, T]):
     @key_dtype.setter
     def key_dtype(self, value: Field[str, K]) -> None:
         self.__key_dtype = value
+        self.__key_parsers = ParserCache(value)
     
     @property
     def value_dtype(self) -> Field[str, K]:
@@ -57,36 +81,75 @@ class DictField(Field[str, T]):
     @value_dtype.setter
     def value_dtype(self, value: Field[str, K]) -> None:
         self.__value_dtype = value
+        self.__value_parsers = ParserCache(value)
+
+    @property
+    def frozen(self) -> bool:
+        return self.__frozen
 
     def parse(self, value: str) -> Dict[K, V]:
-        try:
-            clean_pairs: List[Tuple[Any, Any]] = None
+        return self.__parse(self.get_coercion(type(value)), value)
 
-            if isinstance(value, str):
-                key_value_separator, pair_separator = self.__separator
-                clean_pairs = [
-                    pair.split(key_value_separator, 1)
-                    for pair in (value.split(pair_separator) if len(value) else [])
-                ]
+    def create_parser(self, value_type: type) -> Callable[[Any], Dict[K, V]]:
+        if type(self).parse is not DictField.parse:
+            return self.parse
 
-            elif isinstance(value, list):
-                clean_pairs = value
+        return partial(self.__parse, self.get_coercion(value_type))
 
-            elif isinstance(value, dict):
-                clean_pairs = list(value.items())
+    def get_coercion(self, value_type: type, target_type: Any = None) -> Callable[[Any], Iterable[Any]]:
+        # Dict coercions produce key-value pairs, strings are split by the field separators.
+        if target_type is None and issubclass(value_type, str):
+            return self.__split
+
+        return super().get_coercion(value_type, dict if target_type is None else target_type)
+
+    def __split(self, value: str) -> List[List[str]]:
+        key_value_separator, pair_separator = self.__separator
+
+        return [
+            pair.split(key_value_separator, 1)
+            for pair in (value.split(pair_separator) if len(value) else [])
+        ]
+
+    def __parse(self, coercion: Callable[[Any], Iterable[Any]], value: str) -> Dict[K, V]:
+        try:
+            clean_pairs = coercion(value)
         
         except (TypeError, ValueError) as err:
             raise FieldValueError(
                 "Invalid dict value!",
                 value,
             )
-        
+
+        return self.__parse_pairs(value, clean_pairs)
+
+    def __parse_pairs(self, value: Any, pairs: Iterable[Any]) -> Dict[K, V]:
         clean_dict = {}
+        key_type = key_parser = value_type = value_parser = None
 
-        for i, (key, value) in enumerate(clean_pairs):
+        for i, pair in enumerate(pairs):
             try:
-                clean_key = self.key_dtype.parse(key)
-                clean_value = self.value_dtype.parse(value)
+                key, pair_value = pair
+
+            except (TypeError, ValueError) as err:
+                raise FieldValueError(
+                    "Invalid dict pair!",
+                    i,
+                    pair,
+                ) from err
+
+            # Keys and values mostly share one type each, parsers are looked up on type changes only.
+            if type(key) is not key_type:
+                key_type = type(key)
+                key_parser = self.__key_parsers.get(key_type)
+
+            if type(pair_value) is not value_type:
+                value_type = type(pair_value)
+                value_parser = self.__value_parsers.get(value_type)
+
+            try:
+                clean_key = key_parser(key)
+                clean_value = value_parser(pair_value)
 
                 clean_dict[clean_key] = clean_value
     
@@ -95,7 +158,7 @@ class DictField(Field[str, T]):
                     "Invalid dict pair value!",
                     i,
                     key,
-                    value,
+                    pair_value,
                 ) from err
 
         if self.__not_empty and not clean_dict:
@@ -105,7 +168,44 @@ class DictField(Field[str, T]):
                 self.__separator,
             )
         
-        return clean_dict
+        return MappingProxyType(clean_dict) if self.__frozen else clean_dict
+
+    def serialize(self, value: Mapping[K, V]) -> str:
+        key_value_separator, pair_separator = self.__separator
+        pairs = []
+
+        for key, item in value.items():
+            clean_key = self.__key_dtype.serialize(key)
+            clean_item = self.__value_dtype.serialize(item)
+
+            # Values are split off at the first key separator, only keys must not contain it.
+            if key_value_separator in clean_key or pair_separator in clean_key + clean_item:
+                raise FieldValueError(
+                    "Dict pair contains a separator!",
+                    clean_key,
+                    clean_item,
+                    self.__separator,
+                )
+
+            pairs.append(f"{clean_key}{key_value_separator}{clean_item}")
+
+        return pair_separator.join(pairs)
+
+    def serialize_json(self, value: Mapping[K, V]) -> Dict[str, Any]:
+        # JSON object keys are strings, keys are written as for the env and parsed back by the key field.
+        return {
+            self.__key_dtype.serialize(key): self.__value_dtype.serialize_json(item)
+            for key, item in value.items()
+        }
+
+    def parse_file(self, fd: TextIO) -> Dict[K, V]:
+        key_value_separator, _ = self.__separator
+
+        return self.parse(
+            line.rstrip('\r\n').split(key_value_separator, 1)
+            for line in fd
+            if line.strip()
+        )
 
     def define(
             self,
@@ -115,6 +215,12 @@ class DictField(Field[str, T]):
 
 
 class DictDefinition(FieldDefinition[PT, RT]):
+    __slots__ = (
+        '__key_dtype',
+        '__value_dtype',
+        '__frozen',
+    )
+
     @classmethod
     def create_from_model_field(
             cls,
@@ -125,13 +231,21 @@ class DictDefinition(FieldDefinition[PT, RT]):
             model=model,
             key_dtype=field.key_dtype,
             value_dtype=field.value_dtype,
+            frozen=field.frozen,
             name=field.name,
             required=field.required,
             default=field.default,
+            default_factory=field.default_factory,
             description=field.description,
+            path=field.path,
             parse_type=field.parse_type,
             return_type=field.return_type,
             parser=field.parse,
+            file_parser=field.parse_file,
+            parser_factory=field.create_parser,
+            serializer=field.serialize,
+            json_serializer=field.serialize_json,
+            merge=field.merge,
         )
     
     def __init__(
@@ -140,27 +254,48 @@ class DictDefinition(FieldDefinition[PT, RT]):
             model: 'Model',
             key_dtype: Field[PT, K],
             value_dtype: Field[PT, V],
+            frozen: bool = False,
             name: str,
             required: bool,
             default: Dict[K, V],
+            default_factory: Callable[[], Dict[K, V]] = None,
             description: str,
+            path: Optional[str],
             parse_type: Type[PT],
             return_type: Type[RT],
             parser: Callable[[PT], Dict[K, V]],
+            file_parser: Callable[[TextIO], Dict[K, V]] = None,
+            parser_factory: Callable[[type], Callable[[Any], Dict[K, V]]] = None,
+            serializer: Callable[[Dict[K, V]], str] = None,
+            json_serializer: Callable[[Dict[K, V]], Any] = None,
+            merge: Field.Merge = None,
     ) -> None:
+        if frozen and default is not None:
+            default = MappingProxyType(dict(default))
+        if frozen and default_factory is not None:
+            default_factory = self.__freeze_factory(default_factory)
+
         super().__init__(
             model=model,
             name=name,
             required=required,
             default=default,
+            default_factory=default_factory,
             description=description,
+            path=path,
             parse_type=parse_type,
             return_type=return_type,
             parser=parser,
+            file_parser=file_parser,
+            parser_factory=parser_factory,
+            serializer=serializer,
+            json_serializer=json_serializer,
+            merge=merge,
         )
 
         self.__key_dtype = key_dtype
         self.__value_dtype = value_dtype
+        self.__frozen = frozen
     
     @property
     def key_dtype(self) -> Field[str, K]:
@@ -171,5 +306,18 @@ class DictDefinition(FieldDefinition[PT, RT]):
         return self.__value_dtype
 
     @property
-    def default(self) -> Dict[K, V]:
-        return super().default.copy()
+    def frozen(self) -> bool:
+        return self.__frozen
+
+    @property
+    def default(self) -> Union[Dict[K, V], Mapping[K, V]]:
+        default = super().default
+        return default.copy() if default is not None and not self.__frozen else default
+
+    @staticmethod
+    def __freeze_factory(factory: Callable[[], Dict[K, V]]) -> Callable[[], Mapping[K, V]]:
+        return lambda: MappingProxyType(dict(factory()))
+
+    def merge_values(self, base: Dict[K, V], override: Dict[K, V]) -> Union[Dict[K, V], Mapping[K, V]]:
+        merged = super().merge_values(base, override)
+        return MappingProxyType(merged) if self.__frozen and isinstance(merged, dict) else merged
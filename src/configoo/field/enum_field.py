@@ -1,4 +1,4 @@
-from typing import Type, TypeVar, Union
+from typing import Type, TypeVar, Union, Callable, Any
 import enum
 
 from .base import Field, PT, RT
@@ -13,6 +13,10 @@ T = TypeVar('T')
 
 
 class EnumField(Field[str, T]):
+    __slots__ = (
+        '__dtype',
+    )
+
     def __init__(
             self,
             dtype: Union[Type[T], Type[enum.Enum]],
@@ -20,14 +24,19 @@ class EnumField(Field[str, T]):
             required: bool = False,
             default: Union[T, enum.Enum] = None,
             description: str = None,
+            *,
+            path: str = None,
+            default_factory: Callable[[], T] = None,
     ) -> None:
         super().__init__(
             name=name,
             required=required,
             default=default,
+            default_factory=default_factory,
             parse_type=str,
             return_type=str,
             description=description,
+            path=path,
         )
 
         self.__dtype = dtype
@@ -52,3 +61,9 @@ class EnumField(Field[str, T]):
             ) from err
 
         return clean_value
+
+    def serialize(self, value: T) -> str:
+        return str(self.serialize_json(value))
+
+    def serialize_json(self, value: T) -> Any:
+        return value.value if isinstance(value, enum.Enum) else value
@@ -1,6 +1,8 @@
-from typing import Type
+from typing import Type, Callable, Any
+from functools import partial
 
 from .base import Field, PT, RT
+from .coercion import is_identity
 from ..exception import FieldValueError
 
 __all__ = [
@@ -9,6 +11,11 @@ __all__ = [
 
 
 class FloatField(Field[str, float]):
+    __slots__ = (
+        '__min_value',
+        '__max_value',
+    )
+
     def __init__(
             self,
             name: str = None,
@@ -17,12 +24,17 @@ class FloatField(Field[str, float]):
             description: str = None,
             min_value: float = None,
             max_value: float = None,
+            *,
+            path: str = None,
+            default_factory: Callable[[], float] = None,
     ) -> None:
         super().__init__(
             name=name,
             required=required,
             default=default,
+            default_factory=default_factory,
             description=description,
+            path=path,
             parse_type=str,
             return_type=float,
         )
@@ -31,8 +43,28 @@ class FloatField(Field[str, float]):
         self.__max_value = max_value
     
     def parse(self, value: str) -> float:
+        return self.__parse(self.get_coercion(type(value)), value)
+
+    def create_parser(self, value_type: type) -> Callable[[Any], float]:
+        if type(self).parse is not FloatField.parse:
+            return self.parse
+
+        coercion = self.get_coercion(value_type)
+
+        if is_identity(coercion):
+            return self.__check_value
+
+        return partial(self.__parse, coercion)
+
+    def serialize(self, value: float) -> str:
+        return repr(float(value))
+
+    def serialize_json(self, value: float) -> float:
+        return float(value)
+
+    def __parse(self, coercion: Callable[[Any], float], value: str) -> float:
         try:
-            clean_value = float(value)
+            clean_value = coercion(value)
         
         except (TypeError, ValueError) as err:
             raise FieldValueError(
@@ -40,9 +72,12 @@ class FloatField(Field[str, float]):
                 value,
             )
 
+        return self.__check_value(clean_value)
+
+    def __check_value(self, value: float) -> float:
         if (
                 self.__min_value is not None
-                and clean_value < self.__min_value
+                and value < self.__min_value
         ):
             raise FieldValueError(
                 "Float exceeds min value!",
@@ -52,7 +87,7 @@ class FloatField(Field[str, float]):
         
         if (
                 self.__max_value is not None
-                and clean_value > self.__max_value
+                and value > self.__max_value
         ):
             raise FieldValueError(
                 "Float exceeds max value!",
@@ -60,4 +95,4 @@ class FloatField(Field[str, float]):
                 self.__max_value,
             )
         
-        return clean_value
+        return value
@@ -1,8 +1,10 @@
-from typing import Type
+from typing import Type, Callable, Any
+from functools import partial
 
 from ..exception import FieldValueError
 
 from .base import Field, PT, RT
+from .coercion import is_identity
 
 __all__ = [
     'IntField',
@@ -10,6 +12,11 @@ __all__ = [
 
 
 class IntField(Field[str, int]):
+    __slots__ = (
+        '__min_value',
+        '__max_value',
+    )
+
     def __init__(
             self,
             name: str = None,
@@ -18,12 +25,17 @@ class IntField(Field[str, int]):
             description: str = None,
             min_value: int = None,
             max_value: int = None,
+            *,
+            path: str = None,
+            default_factory: Callable[[], int] = None,
     ) -> None:
         super().__init__(
             name=name,
             required=required,
             default=default,
+            default_factory=default_factory,
             description=description,
+            path=path,
             parse_type=str,
             return_type=int,
         )
@@ -32,19 +44,24 @@ class IntField(Field[str, int]):
         self.__max_value = max_value
     
     def parse(self, value: str) -> int:
-        try:
-            clean_value = int(value)
-        
-        except (TypeError, ValueError) as err:
-            raise FieldValueError(
-                "Invalid integer value!",
-                value,
-            )
-        
-        self.check_min_value(clean_value)
-        self.check_max_value(clean_value)
+        return self.__parse(self.get_coercion(type(value)), value)
 
-        return clean_value
+    def create_parser(self, value_type: type) -> Callable[[Any], int]:
+        if type(self).parse is not IntField.parse:
+            return self.parse
+
+        coercion = self.get_coercion(value_type)
+
+        if is_identity(coercion):
+            return self.__check_value
+
+        return partial(self.__parse, coercion)
+
+    def serialize(self, value: int) -> str:
+        return str(int(value))
+
+    def serialize_json(self, value: int) -> int:
+        return int(value)
 
     def check_min_value(self, value: int) -> bool:
         if (
@@ -71,3 +88,24 @@ class IntField(Field[str, int]):
             )
         
         return True
+
+    def __parse(self, coercion: Callable[[Any], int], value: str) -> int:
+        try:
+            clean_value = coercion(value)
+        
+        except (TypeError, ValueError) as err:
+            raise FieldValueError(
+                "Invalid integer value!",
+                value,
+            )
+        
+        self.check_min_value(clean_value)
+        self.check_max_value(clean_value)
+
+        return clean_value
+
+    def __check_value(self, value: int) -> int:
+        self.check_min_value(value)
+        self.check_max_value(value)
+
+        return value
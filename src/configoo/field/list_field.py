@@ -1,6 +1,7 @@
-from typing import Type, TypeVar, List, Callable
+from typing import Optional, Type, TypeVar, List, Tuple, Union, Dict, Callable, Iterable, Iterator, TextIO, Any
+from functools import partial
 
-from .base import Field, PT, RT, FieldDefinition
+from .base import Field, PT, RT, FieldDefinition, ParserCache
 from ..exception import FieldValueError
 
 __all__ = [
@@ -14,6 +15,16 @@ T = TypeVar('T')
 class ListField(Field[str, T]):
     __SEPARATOR = ','
 
+    __slots__ = (
+        '__dtype',
+        '__separator',
+        '__not_empty',
+        '__skip_empty_parts',
+        '__length',
+        '__frozen',
+        '__item_parsers',
+    )
+
     def __init__(
             self,
             dtype: Field[str, T],
@@ -25,14 +36,22 @@ class ListField(Field[str, T]):
             not_empty: bool = False,
             skip_empty_parts: bool = None,
             length: int = None,
+            merge: Field.Merge = None,
+            frozen: bool = False,
+            *,
+            path: str = None,
+            default_factory: Callable[[], List[T]] = None,
     ) -> None:
         super().__init__(
             name=name,
             required=required,
             default=default,
+            default_factory=default_factory,
             description=description,
+            path=path,
             parse_type=str,
-            return_type=List[T],
+            return_type=Tuple[T, ...] if frozen else List[T],
+            merge=merge,
         )
 
         self.__dtype = dtype
@@ -40,6 +59,8 @@ class ListField(Field[str, T]):
         self.__not_empty = not_empty
         self.__skip_empty_parts = skip_empty_parts
         self.__length = length
+        self.__frozen = frozen
+        self.__item_parsers = ParserCache(dtype)
     
     @property
     def dtype(self) -> Field[str, T]:
@@ -48,25 +69,55 @@ class ListField(Field[str, T]):
     @dtype.setter
     def dtype(self, value: Field[str, T]) -> None:
         self.__dtype = value
+        self.__item_parsers = ParserCache(value)
+
+    @property
+    def frozen(self) -> bool:
+        return self.__frozen
     
     def parse(self, value: str) -> List[T]:
+        return self.__parse(self.get_coercion(type(value)), value)
+
+    def create_parser(self, value_type: type) -> Callable[[Any], List[T]]:
+        if type(self).parse is not ListField.parse:
+            return self.parse
+
+        return partial(self.__parse, self.get_coercion(value_type))
+
+    def get_coercion(self, value_type: type, target_type: Any = None) -> Callable[[Any], Iterable[Any]]:
+        # Splitting depends on the field separator, other sources are coerced to parts by the registry.
+        if target_type is None and issubclass(value_type, str):
+            return self.__split
+
+        return super().get_coercion(value_type, list if target_type is None else target_type)
+
+    def __split(self, value: str) -> List[str]:
+        return value.split(self.__separator) if len(value) else []
+
+    def __parse(self, coercion: Callable[[Any], Iterable[Any]], value: str) -> List[T]:
         try:
-            if not isinstance(value, list):
-                parts = value.split(self.__separator) if len(value) else []
-            else:
-                parts = value
+            parts = coercion(value)
         
         except (TypeError, ValueError) as err:
             raise FieldValueError(
                 "Invalid list value!",
                 value,
             )
-        
+
+        return self.__parse_parts(value, parts)
+
+    def __parse_parts(self, value: Any, parts: Iterable[Any]) -> List[T]:
         clean_list = []
+        part_type = part_parser = None
 
         for i, part in enumerate(parts):
+            # Parts mostly share one type, parsers are looked up on type changes only.
+            if type(part) is not part_type:
+                part_type = type(part)
+                part_parser = self.__item_parsers.get(part_type)
+
             try:
-                clean_part = self.__dtype.parse(part)
+                clean_part = part_parser(part)
     
             except FieldValueError as err:
                 raise FieldValueError(
@@ -92,7 +143,38 @@ class ListField(Field[str, T]):
                 self.__length,
             )
         
-        return clean_list
+        return tuple(clean_list) if self.__frozen else clean_list
+
+    def serialize(self, value: Iterable[T]) -> str:
+        parts = [self.__dtype.serialize(item) for item in value]
+
+        for i, part in enumerate(parts):
+            if self.__separator in part:
+                raise FieldValueError(
+                    "List item contains the separator!",
+                    i,
+                    part,
+                    self.__separator,
+                )
+
+        # A single empty item would be parsed back as an empty list.
+        if parts == ['']:
+            raise FieldValueError(
+                "List with a single empty item can not be serialized!",
+                value,
+            )
+
+        return self.__separator.join(parts)
+
+    def serialize_json(self, value: Iterable[T]) -> List[Any]:
+        return [self.__dtype.serialize_json(item) for item in value]
+
+    def parse_file(self, fd: TextIO) -> List[T]:
+        return self.parse(
+            line.rstrip('\r\n')
+            for line in fd
+            if line.strip()
+        )
 
     def define(
             self,
@@ -102,6 +184,11 @@ class ListField(Field[str, T]):
 
 
 class ListDefinition(FieldDefinition[PT, RT]):
+    __slots__ = (
+        '__dtype',
+        '__frozen',
+    )
+
     @classmethod
     def create_from_model_field(
             cls,
@@ -111,13 +198,21 @@ class ListDefinition(FieldDefinition[PT, RT]):
         return cls(
             model=model,
             dtype=field.dtype,
+            frozen=field.frozen,
             name=field.name,
             required=field.required,
             default=field.default,
+            default_factory=field.default_factory,
             description=field.description,
+            path=field.path,
             parse_type=field.parse_type,
             return_type=field.return_type,
             parser=field.parse,
+            file_parser=field.parse_file,
+            parser_factory=field.create_parser,
+            serializer=field.serialize,
+            json_serializer=field.serialize_json,
+            merge=field.merge,
         )
     
     def __init__(
@@ -125,27 +220,62 @@ class ListDefinition(FieldDefinition[PT, RT]):
             *,
             model: 'Model',
             dtype: Field[PT, RT],
+            frozen: bool = False,
             name: str,
             required: bool,
             default: List[RT],
+            default_factory: Callable[[], List[RT]] = None,
             description: str,
+            path: Optional[str],
             parse_type: Type[PT],
             return_type: Type[RT],
             parser: Callable[[PT], List[RT]],
+            file_parser: Callable[[TextIO], List[RT]] = None,
+            parser_factory: Callable[[type], Callable[[Any], List[RT]]] = None,
+            serializer: Callable[[List[RT]], str] = None,
+            json_serializer: Callable[[List[RT]], Any] = None,
+            merge: Field.Merge = None,
     ) -> None:
+        # Frozen defaults are built once and shared by every load and model instance.
+        if frozen and default is not None:
+            default = tuple(default)
+        if frozen and default_factory is not None:
+            default_factory = self.__freeze_factory(default_factory)
+
         super().__init__(
             model=model,
             name=name,
             required=required,
             default=default,
+            default_factory=default_factory,
             description=description,
+            path=path,
             parse_type=parse_type,
             return_type=return_type,
             parser=parser,
+            file_parser=file_parser,
+            parser_factory=parser_factory,
+            serializer=serializer,
+            json_serializer=json_serializer,
+            merge=merge,
         )
 
         self.__dtype = dtype
+        self.__frozen = frozen
+
+    @property
+    def frozen(self) -> bool:
+        return self.__frozen
     
     @property
-    def default(self) -> List[RT]:
-        return super().default.copy()
+    def default(self) -> Union[List[RT], Tuple[RT, ...]]:
+        default = super().default
+        return default.copy() if default is not None and not self.__frozen else default
+
+    @staticmethod
+    def __freeze_factory(factory: Callable[[], List[RT]]) -> Callable[[], Tuple[RT, ...]]:
+        return lambda: tuple(factory())
+
+    def merge_values(self, base: List[RT], override: List[RT]) -> Union[List[RT], Tuple[RT, ...]]:
+        merged = super().merge_values(base, override)
+        return tuple(merged) if self.__frozen and merged is not None else merged
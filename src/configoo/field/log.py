@@ -1,5 +1,6 @@
-from typing import List
+from typing import List, Callable
 import logging
+import re
 
 from .base import Field, PT, RT
 from ..exception import FieldValueError
@@ -15,18 +16,25 @@ __all__ = [
 
 
 class LoggingLevelField(Field[str, str]):
+    __slots__ = ()
+
     def __init__(
             self,
             name: str = None,
             required: bool = False,
             default: str = None,
             description: str = None,
+            *,
+            path: str = None,
+            default_factory: Callable[[], str] = None,
     ) -> None:
         super().__init__(
             name=name,
             required=required,
             default=default,
+            default_factory=default_factory,
             description=description,
+            path=path,
             parse_type=str,
             return_type=str,
         )
@@ -42,6 +50,17 @@ class LoggingLevelField(Field[str, str]):
 
         return clean_value
 
+    def serialize(self, value: int) -> str:
+        name = logging.getLevelName(value)
+
+        if logging._nameToLevel.get(name) != value:
+            raise FieldValueError(
+                "Logging level has no name!",
+                value,
+            )
+
+        return name
+
 
 class LoggingFormatField(Field[str, str]):
     __ALLOWED_RECORD_FIELDS = {
@@ -68,6 +87,8 @@ class LoggingFormatField(Field[str, str]):
         'message': 'message',
     }
 
+    __RECORD_FIELD_FORMAT = re.compile(r'%\((\w+)\)s')
+
     __DEFAULT_RECORD_FIELDS = (
         'at',
         'level',
@@ -75,6 +96,10 @@ class LoggingFormatField(Field[str, str]):
         'message',
     )
 
+    __slots__ = (
+        '__dtype',
+    )
+
     def __init__(
             self,
             name: str = None,
@@ -82,12 +107,17 @@ class LoggingFormatField(Field[str, str]):
             default: List[str] = None,
             description: str = None,
             parse_field_separator: str = None,
+            *,
+            path: str = None,
+            default_factory: Callable[[], List[str]] = None,
     ) -> None:
         super().__init__(
             name=name,
             required=required,
             default=default,
+            default_factory=default_factory,
             description=description,
+            path=path,
             parse_type=str,
             return_type=str,
         )
@@ -115,7 +145,13 @@ class LoggingFormatField(Field[str, str]):
         self.__dtype = value
     
     def parse(self, value: str) -> str:
-        names = self.dtype.parse(value) if value else self.dtype.default
+        if not value:
+            names = self.dtype.default
+        elif isinstance(value, str) and self.__RECORD_FIELD_FORMAT.search(value):
+            # An already built format, e.g. passed back to `Model.replace`.
+            names = self.__RECORD_FIELD_FORMAT.findall(value)
+        else:
+            names = self.dtype.parse(value)
         formatted_fields = []
 
         for name in names:
@@ -132,6 +168,10 @@ class LoggingFormatField(Field[str, str]):
         clean_value = self.join_field_formats(formatted_fields)
         return clean_value
     
+    def serialize(self, value: str) -> str:
+        # Record field names are read back from the format, the decoration comes from the field class.
+        return self.dtype.serialize(self.__RECORD_FIELD_FORMAT.findall(value))
+
     def apply_field_format(self, name: str) -> str:
         return f"%({name})s"
     
@@ -140,6 +180,8 @@ class LoggingFormatField(Field[str, str]):
 
 
 class LoggingBracketFormatField(LoggingFormatField):
+    __slots__ = ()
+
     def apply_field_format(self, name: str) -> str:
         if name == 'message':
             return f"%({name})s"
@@ -1,6 +1,8 @@
-from typing import Union
+from typing import Union, Callable, Any
+from functools import partial
 
 from .base import Field, PT, RT
+from .coercion import Num, is_identity
 from ..exception import FieldValueError
 
 __all__ = [
@@ -8,10 +10,12 @@ __all__ = [
 ]
 
 
-Num = Union[int, float]
-
-
 class NumField(Field[str, Num]):
+    __slots__ = (
+        '__min_value',
+        '__max_value',
+    )
+
     def __init__(
             self,
             name: str = None,
@@ -20,12 +24,17 @@ class NumField(Field[str, Num]):
             description: str = None,
             min_value: Num = None,
             max_value: Num = None,
+            *,
+            path: str = None,
+            default_factory: Callable[[], Num] = None,
     ) -> None:
         super().__init__(
             name=name,
             required=required,
             default=default,
+            default_factory=default_factory,
             description=description,
+            path=path,
             parse_type=str,
             return_type=Num,
         )
@@ -34,35 +43,68 @@ class NumField(Field[str, Num]):
         self.__max_value = max_value
     
     def parse(self, value: str) -> Num:
-        try:
-            clean_value = float(value)
-            if clean_value.is_integer():
-                clean_value = int(clean_value)
-        
-        except (TypeError, ValueError) as err:
-            raise FieldValueError(
-                "Invalid number value!",
-                value,
-            )
+        return self.__parse(self.get_coercion(type(value)), value)
+
+    def create_parser(self, value_type: type) -> Callable[[Any], Num]:
+        if type(self).parse is not NumField.parse:
+            return self.parse
+
+        coercion = self.get_coercion(value_type)
+
+        if is_identity(coercion):
+            return self.__check_value
+
+        return partial(self.__parse, coercion)
+
+    def serialize(self, value: Num) -> str:
+        return repr(value)
+
+    def serialize_json(self, value: Num) -> Num:
+        return value
 
+    def check_min_value(self, value: Num) -> bool:
         if (
                 self.__min_value is not None
-                and clean_value < self.__min_value
+                and value < self.__min_value
         ):
             raise FieldValueError(
                 "Number exceeds min value!",
                 value,
                 self.__min_value,
             )
-        
+
+        return True
+
+    def check_max_value(self, value: Num) -> bool:
         if (
                 self.__max_value is not None
-                and clean_value > self.__max_value
+                and value > self.__max_value
         ):
             raise FieldValueError(
                 "Number exceeds max value!",
                 value,
                 self.__max_value,
             )
+
+        return True
+
+    def __parse(self, coercion: Callable[[Any], Num], value: str) -> Num:
+        try:
+            clean_value = coercion(value)
         
+        except (TypeError, ValueError, OverflowError) as err:
+            raise FieldValueError(
+                "Invalid number value!",
+                value,
+            )
+
+        self.check_min_value(clean_value)
+        self.check_max_value(clean_value)
+
         return clean_value
+
+    def __check_value(self, value: Num) -> Num:
+        self.check_min_value(value)
+        self.check_max_value(value)
+
+        return value
@@ -1,8 +1,9 @@
-from typing import Union
+from typing import Union, Callable
 from os import access, R_OK, W_OK, X_OK
 from pathlib import Path as _Path
 
 from .base import Field, PT, RT
+from .coercion import register_coercion, pack_canonical, Canonical
 from ..exception import FieldValueError
 
 __all__ = [
@@ -13,8 +14,19 @@ __all__ = [
 
 AnyPath = Union[_Path, str]
 
+# Registered here, so pathlib is only imported together with the path fields.
+register_coercion(object, _Path, _Path)
+register_coercion(_Path, Canonical, lambda value: pack_canonical('path', str(value)))
+
 
 class PathField(Field[str, _Path]):
+    __slots__ = (
+        '__exists',
+        '__readable',
+        '__writable',
+        '__executable',
+    )
+
     def __init__(
             self,
             name: str = None,
@@ -25,12 +37,18 @@ class PathField(Field[str, _Path]):
             readable: bool = None,
             writable: bool = None,
             executable: bool = None,
+            *,
+            field_path: str = None,
+            default_factory: Callable[[], _Path] = None,
     ) -> None:
         super().__init__(
             name=name,
             required=required,
             default=default,
+            default_factory=default_factory,
             description=description,
+            # The key path of the value in the source, not a filesystem path.
+            path=field_path,
             parse_type=str,
             return_type=_Path,
         )
@@ -42,7 +60,7 @@ class PathField(Field[str, _Path]):
     
     def parse(self, value: str) -> _Path:
         try:
-            clean_value = _Path(value)
+            clean_value = self.coerce(value)
         
         except TypeError as err:
             raise FieldValueError(
@@ -135,6 +153,8 @@ class PathField(Field[str, _Path]):
 
 
 class FilePathField(PathField):
+    __slots__ = ()
+
     def parse(self, value: str) -> _Path:
         clean_value = super().parse(value)
 
@@ -148,6 +168,8 @@ class FilePathField(PathField):
 
 
 class DirectoryPathField(PathField):
+    __slots__ = ()
+
     def parse(self, value: str) -> _Path:
         clean_value = super().parse(value)
 
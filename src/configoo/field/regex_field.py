@@ -0,0 +1,278 @@
+from typing import Union, Optional, Iterable, Iterator, Tuple, List, Callable, TextIO
+from functools import lru_cache
+import re
+from re import Pattern
+
+from .base import Field, PT, RT, defer_default
+from .coercion import register_coercion, pack_canonical, encode_canonical, Canonical
+from ..exception import FieldValueError
+
+from .str_field import StrField
+from .list_field import ListField
+
+__all__ = [
+    'RegexField',
+    'RegexListField',
+    'PatternSet',
+    'compile_pattern',
+]
+
+
+# Bounded, pattern sets compile a new combined alternation for every changed pattern list.
+@lru_cache(maxsize=256)
+def compile_pattern(pattern: str, flags: int = 0) -> Pattern:
+    return re.compile(pattern, flags)
+
+
+class PatternSet:
+    __GROUP_NAME = '_p{}'
+    __NUMERIC_BACKREFERENCE = re.compile(r'(?<!\\)\\[1-9]')
+
+    def __init__(
+            self,
+            patterns: Iterable[Pattern],
+            flags: int = 0,
+    ) -> None:
+        self.__patterns = tuple(patterns)
+        self.__flags = flags
+        self.__combined = self.__combine(self.__patterns, flags)
+
+    def __iter__(self) -> Iterator[Pattern]:
+        return iter(self.__patterns)
+
+    def __len__(self) -> int:
+        return len(self.__patterns)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, PatternSet):
+            return self.__patterns == other.__patterns and self.__flags == other.__flags
+
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash((self.__patterns, self.__flags))
+
+    def __str__(self) -> str:
+        return f"{self.__class__.__name__}({[p.pattern for p in self.__patterns]})"
+
+    __repr__ = __str__
+
+    @property
+    def patterns(self) -> Tuple[Pattern, ...]:
+        return self.__patterns
+
+    @property
+    def flags(self) -> int:
+        return self.__flags
+
+    @property
+    def combined(self) -> Optional[Pattern]:
+        return self.__combined
+
+    def search(self, string: str) -> Optional[Pattern]:
+        return self.__find(string, 'search')
+
+    def match(self, string: str) -> Optional[Pattern]:
+        return self.__find(string, 'match')
+
+    def fullmatch(self, string: str) -> Optional[Pattern]:
+        return self.__find(string, 'fullmatch')
+
+    def __find(self, string: str, method: str) -> Optional[Pattern]:
+        if self.__combined is not None:
+            found = getattr(self.__combined, method)(string)
+            if found is None:
+                return None
+
+            return self.__patterns[int(found.lastgroup[2:])]
+
+        # Fallback for patterns which can not be merged into one alternation:
+        # keep the same semantics (leftmost match wins, then declaration order).
+        best: Optional[Tuple[int, int]] = None
+
+        for i, pattern in enumerate(self.__patterns):
+            found = getattr(pattern, method)(string)
+            if found is not None and (best is None or found.start() < best[0]):
+                best = (found.start(), i)
+
+        return self.__patterns[best[1]] if best is not None else None
+
+    @classmethod
+    def __combine(cls, patterns: Tuple[Pattern, ...], flags: int) -> Optional[Pattern]:
+        if not patterns:
+            return None
+
+        if any(
+                pattern.flags & ~re.UNICODE != flags & ~re.UNICODE
+                or cls.__NUMERIC_BACKREFERENCE.search(pattern.pattern)
+                for pattern in patterns
+        ):
+            return None
+
+        combined = '|'.join(
+            f"(?P<{cls.__GROUP_NAME.format(i)}>{pattern.pattern})"
+            for i, pattern in enumerate(patterns)
+        )
+
+        try:
+            return compile_pattern(combined, flags)
+
+        except re.error:
+            return None
+
+
+register_coercion(Pattern, Canonical, lambda value: pack_canonical('pattern', value.pattern, str(value.flags)))
+register_coercion(PatternSet, Canonical, lambda value: pack_canonical(
+    'patterns',
+    encode_canonical(value.patterns),
+    str(value.flags),
+))
+
+
+class RegexField(Field[str, Pattern]):
+    __slots__ = (
+        '__flags',
+    )
+
+    def __init__(
+            self,
+            name: str = None,
+            required: bool = False,
+            default: Union[str, Pattern] = None,
+            description: str = None,
+            flags: int = 0,
+            *,
+            path: str = None,
+            default_factory: Callable[[], Pattern] = None,
+    ) -> None:
+        self.__flags = flags
+
+        if isinstance(default, str):
+            default, default_factory = defer_default(self.parse, default, default_factory)
+
+        super().__init__(
+            name=name,
+            required=required,
+            default=default,
+            default_factory=default_factory,
+            description=description,
+            path=path,
+            parse_type=str,
+            return_type=Pattern,
+        )
+
+    @property
+    def flags(self) -> int:
+        return self.__flags
+
+    @flags.setter
+    def flags(self, value: int) -> None:
+        self.__flags = value
+
+    def parse(self, value: str) -> Pattern:
+        if isinstance(value, Pattern):
+            return value
+
+        try:
+            clean_value = compile_pattern(value, self.__flags)
+
+        except (TypeError, re.error) as err:
+            raise FieldValueError(
+                "Invalid regular expression!",
+                value,
+            ) from err
+
+        return clean_value
+
+    def serialize(self, value: Pattern) -> str:
+        return value.pattern
+
+
+class RegexListField(Field[str, PatternSet]):
+    __slots__ = (
+        '__flags',
+        '__pattern',
+        '__dtype',
+    )
+
+    def __init__(
+            self,
+            name: str = None,
+            required: bool = False,
+            default: Union[List[str], PatternSet] = None,
+            description: str = None,
+            flags: int = 0,
+            separator: str = None,
+            not_empty: bool = False,
+            *,
+            path: str = None,
+            default_factory: Callable[[], PatternSet] = None,
+    ) -> None:
+        self.__flags = flags
+        self.__pattern = RegexField(
+            flags=flags,
+        )
+        self.__dtype = ListField(
+            dtype=StrField(),
+            separator=separator,
+            not_empty=not_empty,
+            skip_empty_parts=True,
+        )
+
+        if isinstance(default, (list, tuple)):
+            default, default_factory = defer_default(self.parse, list(default), default_factory)
+
+        super().__init__(
+            name=name,
+            required=required,
+            default=default,
+            default_factory=default_factory,
+            description=description,
+            path=path,
+            parse_type=str,
+            return_type=PatternSet,
+        )
+
+    @property
+    def flags(self) -> int:
+        return self.__flags
+
+    @property
+    def dtype(self) -> ListField[str]:
+        return self.__dtype
+
+    def parse(self, value: str) -> PatternSet:
+        if isinstance(value, PatternSet):
+            return value
+
+        patterns = []
+
+        for i, part in enumerate(self.__dtype.parse(value)):
+            try:
+                patterns.append(self.__pattern.parse(part))
+
+            except FieldValueError as err:
+                raise FieldValueError(
+                    "Invalid regular expression list item!",
+                    i,
+                    part,
+                ) from err
+
+        return PatternSet(
+            patterns=patterns,
+            flags=self.__flags,
+        )
+
+    def parse_file(self, fd: TextIO) -> PatternSet:
+        # One pattern per line, patterns may contain the list separator.
+        return self.parse(
+            line.rstrip('\r\n')
+            for line in fd
+            if line.strip()
+        )
+
+    def serialize(self, value: PatternSet) -> str:
+        return self.__dtype.serialize([pattern.pattern for pattern in value])
+
+    def serialize_json(self, value: PatternSet) -> List[str]:
+        return self.__dtype.serialize_json([pattern.pattern for pattern in value])
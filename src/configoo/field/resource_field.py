@@ -0,0 +1,230 @@
+from typing import Optional, Union, Callable
+import os
+import re
+import math
+from pathlib import Path as _Path
+
+from ..exception import FieldValueError
+
+from .base import defer_default
+from .int_field import IntField
+from .unit_field import parse_byte_size
+
+__all__ = [
+    'CpuCountField',
+    'MemoryLimitField',
+    'get_cpu_count',
+    'get_memory_limit',
+]
+
+
+CGROUP_ROOT = _Path('/sys/fs/cgroup')
+
+# cgroup v1 reports "no limit" as a huge page-aligned number instead of "max".
+__CGROUP_V1_UNLIMITED = 2**62
+
+
+def __read_cgroup_value(path: _Path) -> Optional[str]:
+    try:
+        with path.open('r') as fd:
+            return fd.read().strip()
+
+    except OSError:
+        return None
+
+
+def __get_cgroup_cpu_limit(root: _Path) -> Optional[float]:
+    # cgroup v2: "<quota> <period>" or "max <period>"
+    value = __read_cgroup_value(root / 'cpu.max')
+    if value is not None:
+        quota, _, period = value.partition(' ')
+        if quota == 'max' or not period:
+            return None
+
+        return int(quota) / int(period)
+
+    # cgroup v1: quota is -1 if there is no limit.
+    for name in ('cpu', 'cpu,cpuacct'):
+        quota = __read_cgroup_value(root / name / 'cpu.cfs_quota_us')
+        period = __read_cgroup_value(root / name / 'cpu.cfs_period_us')
+        if quota is not None and period is not None:
+            if int(quota) <= 0:
+                return None
+
+            return int(quota) / int(period)
+
+    return None
+
+
+def __get_cgroup_memory_limit(root: _Path) -> Optional[int]:
+    value = __read_cgroup_value(root / 'memory.max')
+    if value is not None:
+        return None if value == 'max' else int(value)
+
+    value = __read_cgroup_value(root / 'memory' / 'memory.limit_in_bytes')
+    if value is not None:
+        limit = int(value)
+        return None if limit >= __CGROUP_V1_UNLIMITED else limit
+
+    return None
+
+
+def get_cpu_count(cgroup_root: _Path = None) -> int:
+    if hasattr(os, 'sched_getaffinity'):
+        count = len(os.sched_getaffinity(0))
+    else:
+        count = os.cpu_count() or 1
+
+    limit = __get_cgroup_cpu_limit(cgroup_root or CGROUP_ROOT)
+    if limit is not None:
+        count = min(count, max(1, math.ceil(limit)))
+
+    return count
+
+
+def get_memory_limit(cgroup_root: _Path = None) -> int:
+    try:
+        memory = os.sysconf('SC_PAGE_SIZE') * os.sysconf('SC_PHYS_PAGES')
+
+    except (AttributeError, ValueError, OSError):
+        memory = None
+
+    limit = __get_cgroup_memory_limit(cgroup_root or CGROUP_ROOT)
+    if limit is not None:
+        memory = min(memory, limit) if memory else limit
+
+    if memory is None:
+        raise OSError("Can not detect memory limit!")
+
+    return memory
+
+
+class ResourceField(IntField):
+    __EXPRESSION = re.compile(
+        r'^\s*(?:'
+        r'auto(?:\s*(?P<op>[*/])\s*(?P<factor>\d+(?:\.\d+)?))?'
+        r'|(?P<percent>\d+(?:\.\d+)?)\s*%'
+        r')\s*$',
+        re.IGNORECASE,
+    )
+
+    _MIN_RESOLVED_VALUE = 0
+
+    __slots__ = (
+        '__cgroup_root',
+    )
+
+    def __init__(
+            self,
+            name: str = None,
+            required: bool = False,
+            default: Union[int, str] = None,
+            description: str = None,
+            min_value: int = None,
+            max_value: int = None,
+            cgroup_root: _Path = None,
+            *,
+            path: str = None,
+            default_factory: Callable[[], int] = None,
+    ) -> None:
+        super().__init__(
+            name=name,
+            required=required,
+            default=None,
+            default_factory=default_factory,
+            description=description,
+            path=path,
+            min_value=min_value,
+            max_value=max_value,
+        )
+
+        self.__cgroup_root = cgroup_root
+
+        # Expressions are resolved against the host only when the default is needed.
+        if isinstance(default, str):
+            _, self.default_factory = defer_default(self.parse, default, default_factory)
+        else:
+            self.default = default
+
+    @property
+    def cgroup_root(self) -> _Path:
+        return self.__cgroup_root or CGROUP_ROOT
+
+    @cgroup_root.setter
+    def cgroup_root(self, value: _Path) -> None:
+        self.__cgroup_root = value
+
+    def get_available(self) -> int:
+        raise NotImplementedError
+
+    def parse_literal(self, value: Union[int, str]) -> int:
+        return super().parse(value)
+
+    def parse(self, value: Union[int, str]) -> int:
+        expression = self.__EXPRESSION.match(value) if isinstance(value, str) else None
+        if expression is None:
+            return self.parse_literal(value)
+
+        try:
+            available = self.get_available()
+
+        except (OSError, ValueError) as err:
+            raise FieldValueError(
+                "Can not detect available resource!",
+                value,
+            ) from err
+
+        op, factor, percent = expression.group('op', 'factor', 'percent')
+
+        if percent is not None:
+            clean_value = available * float(percent) / 100
+        elif op == '*':
+            clean_value = available * float(factor)
+        elif op == '/':
+            if not float(factor):
+                raise FieldValueError(
+                    "Resource expression divides by zero!",
+                    value,
+                )
+
+            clean_value = available / float(factor)
+        else:
+            clean_value = available
+
+        clean_value = max(int(clean_value), self._MIN_RESOLVED_VALUE)
+
+        self.check_min_value(clean_value)
+        self.check_max_value(clean_value)
+
+        return clean_value
+
+
+class CpuCountField(ResourceField):
+    _MIN_RESOLVED_VALUE = 1
+
+    __slots__ = ()
+
+    def get_available(self) -> int:
+        return get_cpu_count(self.cgroup_root)
+
+
+class MemoryLimitField(ResourceField):
+    __slots__ = ()
+
+    def get_available(self) -> int:
+        return get_memory_limit(self.cgroup_root)
+
+    def parse_literal(self, value: Union[int, str]) -> int:
+        try:
+            clean_value = parse_byte_size(value)
+
+        except (TypeError, ValueError) as err:
+            raise FieldValueError(
+                "Invalid memory limit value!",
+                value,
+            ) from err
+
+        self.check_min_value(clean_value)
+        self.check_max_value(clean_value)
+
+        return clean_value
@@ -1,4 +1,5 @@
-from typing import Optional
+from typing import Optional, Callable, Any
+from functools import partial
 import enum
 
 from .base import Field, PT, RT
@@ -28,6 +29,10 @@ class StrField(Field[str, str]):
             
             return value
 
+    __slots__ = (
+        '__modifyer',
+    )
+
     def __init__(
             self,
             name: str = None,
@@ -35,12 +40,17 @@ class StrField(Field[str, str]):
             default: int = None,
             description: str = None,
             modifyer: Modifyer = None,
+            *,
+            path: str = None,
+            default_factory: Callable[[], str] = None,
     ) -> None:
         super().__init__(
             name=name,
             required=required,
             default=default,
+            default_factory=default_factory,
             description=description,
+            path=path,
             parse_type=str,
             return_type=str,
         )
@@ -56,8 +66,20 @@ class StrField(Field[str, str]):
         self.__modifyer = value
     
     def parse(self, value: str) -> str:
+        return self.__parse(self.get_coercion(type(value)), value)
+
+    def create_parser(self, value_type: type) -> Callable[[Any], str]:
+        if type(self).parse is not StrField.parse:
+            return self.parse
+
+        if value_type is str and self.modifyer in (None, self.Modifyer.NONE):
+            return self.get_coercion(value_type)
+
+        return partial(self.__parse, self.get_coercion(value_type))
+
+    def __parse(self, coercion: Callable[[Any], str], value: str) -> str:
         try:
-            clean_value = str(value)
+            clean_value = coercion(value)
         
         except (TypeError, ValueError) as err:
             raise FieldValueError(
@@ -0,0 +1,260 @@
+from typing import Union, Dict, Callable, List, Tuple
+from datetime import timedelta
+import re
+
+from ..exception import FieldValueError
+
+from .num_field import NumField, Num
+from .coercion import register_coercion, pack_canonical, Canonical
+
+__all__ = [
+    'ByteSizeField',
+    'DurationField',
+    'parse_byte_size',
+    'parse_duration',
+]
+
+
+register_coercion(timedelta, Canonical, lambda value: pack_canonical(
+    'timedelta',
+    str(value.days),
+    str(value.seconds),
+    str(value.microseconds),
+))
+
+
+__NUMBER = r'(\d+(?:\.\d*)?(?:[eE][+-]?\d+)?|\.\d+(?:[eE][+-]?\d+)?)'
+
+__BYTE_SIZE = re.compile(rf'^\s*{__NUMBER}\s*([a-zA-Z]*)\s*$')
+__BYTE_SIZE_UNITS: Dict[str, int] = {
+    '': 1,
+    'b': 1,
+    'byte': 1,
+    'bytes': 1,
+    **{
+        suffix: 1000**power
+        for power, prefix in enumerate('kmgtpe', 1)
+        for suffix in (prefix, f'{prefix}b')
+    },
+    **{
+        suffix: 1024**power
+        for power, prefix in enumerate('kmgtpe', 1)
+        for suffix in (f'{prefix}i', f'{prefix}ib')
+    },
+}
+
+__DURATION_PART = re.compile(rf'{__NUMBER}\s*([a-zA-Zµ]*)')
+__DURATION_UNITS: Dict[str, float] = {
+    'ns': 1e-9,
+    'us': 1e-6,
+    'µs': 1e-6,
+    'ms': 1e-3,
+    's': 1.0,
+    'sec': 1.0,
+    'm': 60.0,
+    'min': 60.0,
+    'h': 3600.0,
+    'hr': 3600.0,
+    'd': 86400.0,
+    'w': 604800.0,
+}
+
+
+def __to_number(value: str) -> Num:
+    if value.isdigit():
+        return int(value)
+
+    return float(value)
+
+
+def __split_duration(value: str) -> List[Tuple[str, str]]:
+    # Parts are scanned one by one, a single pattern repeating parts with optional units
+    # backtracks exponentially on long invalid values.
+    parts = []
+    position = 0
+
+    for match in __DURATION_PART.finditer(value):
+        if value[position:match.start()].strip():
+            raise ValueError("Invalid duration!", value)
+
+        parts.append(match.groups())
+        position = match.end()
+
+    if not parts or value[position:].strip():
+        raise ValueError("Invalid duration!", value)
+
+    return parts
+
+
+def parse_byte_size(value: Union[int, float, str]) -> int:
+    if isinstance(value, bool):
+        raise ValueError("Invalid byte size!", value)
+
+    if isinstance(value, (int, float)):
+        number, multiplier = value, 1
+    else:
+        match = __BYTE_SIZE.match(value)
+        if match is None:
+            raise ValueError("Invalid byte size!", value)
+
+        number = __to_number(match.group(1))
+        multiplier = __BYTE_SIZE_UNITS.get(match.group(2).lower())
+        if multiplier is None:
+            raise ValueError("Invalid byte size unit!", value)
+
+    size = number * multiplier
+    if isinstance(size, float):
+        if not size.is_integer():
+            raise ValueError("Byte size is not a whole number of bytes!", value)
+
+        size = int(size)
+
+    return size
+
+
+def parse_duration(value: Union[int, float, str, timedelta], unit: str = 's') -> float:
+    if isinstance(value, timedelta):
+        return value.total_seconds()
+
+    if isinstance(value, bool):
+        raise ValueError("Invalid duration!", value)
+
+    if isinstance(value, (int, float)):
+        return value * __DURATION_UNITS[unit]
+
+    parts = __split_duration(value)
+    if len(parts) > 1 and not all(suffix for _, suffix in parts):
+        raise ValueError("Compound duration requires units!", value)
+
+    seconds = 0.0
+
+    for number, suffix in parts:
+        multiplier = __DURATION_UNITS.get(suffix.lower() if suffix else unit)
+        if multiplier is None:
+            raise ValueError("Invalid duration unit!", value)
+
+        seconds += __to_number(number) * multiplier
+
+    return seconds
+
+
+class ByteSizeField(NumField):
+    __slots__ = ()
+
+    def __init__(
+            self,
+            name: str = None,
+            required: bool = False,
+            default: Union[int, str] = None,
+            description: str = None,
+            min_value: Union[int, str] = None,
+            max_value: Union[int, str] = None,
+            *,
+            path: str = None,
+            default_factory: Callable[[], int] = None,
+    ) -> None:
+        super().__init__(
+            name=name,
+            required=required,
+            default=parse_byte_size(default) if default is not None else None,
+            default_factory=default_factory,
+            description=description,
+            path=path,
+            min_value=parse_byte_size(min_value) if min_value is not None else None,
+            max_value=parse_byte_size(max_value) if max_value is not None else None,
+        )
+
+        self.return_type = int
+
+    def parse(self, value: Union[int, str]) -> int:
+        try:
+            clean_value = parse_byte_size(value)
+
+        except (TypeError, ValueError) as err:
+            raise FieldValueError(
+                "Invalid byte size value!",
+                value,
+            ) from err
+
+        self.check_min_value(clean_value)
+        self.check_max_value(clean_value)
+
+        return clean_value
+
+
+class DurationField(NumField):
+    __slots__ = (
+        '__unit',
+        '__as_timedelta',
+    )
+
+    def __init__(
+            self,
+            name: str = None,
+            required: bool = False,
+            default: Union[float, str, timedelta] = None,
+            description: str = None,
+            min_value: Union[float, str, timedelta] = None,
+            max_value: Union[float, str, timedelta] = None,
+            unit: str = None,
+            as_timedelta: bool = False,
+            *,
+            path: str = None,
+            default_factory: Callable[[], Union[float, timedelta]] = None,
+    ) -> None:
+        self.__unit = unit or 's'
+        self.__as_timedelta = as_timedelta
+
+        super().__init__(
+            name=name,
+            required=required,
+            default=None,
+            default_factory=default_factory,
+            description=description,
+            path=path,
+            min_value=self.__to_seconds(min_value),
+            max_value=self.__to_seconds(max_value),
+        )
+
+        self.default = self.__convert(self.__to_seconds(default))
+        self.return_type = timedelta if as_timedelta else float
+
+    @property
+    def unit(self) -> str:
+        return self.__unit
+
+    @property
+    def as_timedelta(self) -> bool:
+        return self.__as_timedelta
+
+    def parse(self, value: Union[float, str, timedelta]) -> Union[float, timedelta]:
+        try:
+            clean_value = parse_duration(value, self.__unit)
+
+        except (TypeError, ValueError, KeyError) as err:
+            raise FieldValueError(
+                "Invalid duration value!",
+                value,
+            ) from err
+
+        self.check_min_value(clean_value)
+        self.check_max_value(clean_value)
+
+        return self.__convert(clean_value)
+
+    def serialize(self, value: Union[float, timedelta]) -> str:
+        # The unit is always written, the value does not depend on the unit of the field.
+        seconds = value.total_seconds() if isinstance(value, timedelta) else float(value)
+        return f"{seconds!r}s"
+
+    def serialize_json(self, value: Union[float, timedelta]) -> str:
+        return self.serialize(value)
+
+    def __to_seconds(self, value: Union[float, str, timedelta, None]) -> float:
+        return parse_duration(value, self.__unit) if value is not None else None
+
+    def __convert(self, seconds: float) -> Union[float, timedelta]:
+        if seconds is None or not self.__as_timedelta:
+            return seconds
+
+        return timedelta(seconds=seconds)
@@ -1,9 +1,10 @@
-from typing import Union
+from typing import Union, Callable
 
 from ipaddress import ip_address, IPv4Address, IPv6Address
 from urllib.parse import urlparse, ParseResult as Url
 
-from .base import Field, PT, RT
+from .base import Field, PT, RT, defer_default
+from .coercion import register_coercion, pack_canonical, Canonical
 from ..exception import FieldValueError
 
 from .int_field import IntField
@@ -18,47 +19,71 @@ __all__ = [
 
 IP = Union[IPv4Address, IPv6Address]
 
+register_coercion(Url, Canonical, lambda value: pack_canonical('url', value.geturl()))
+register_coercion(IPv4Address, Canonical, lambda value: pack_canonical('ip', str(value)))
+register_coercion(IPv6Address, Canonical, lambda value: pack_canonical('ip', str(value)))
+
 
 class UrlField(Field[str, Url]):
+    __slots__ = ()
+
     def __init__(
             self,
             name: str = None,
             required: bool = False,
             default: Union[str, Url] = None,
             description: str = None,
+            *,
+            path: str = None,
+            default_factory: Callable[[], Url] = None,
     ) -> None:
         if isinstance(default, str):
-            default = self.parse(default)
+            default, default_factory = defer_default(self.parse, default, default_factory)
 
         super().__init__(
             name=name,
             required=required,
             default=default,
+            default_factory=default_factory,
             description=description,
+            path=path,
             parse_type=str,
             return_type=Url,
         )
     
     def parse(self, value: str) -> Url:
+        if isinstance(value, Url):
+            return value
+
         return urlparse(value)
 
+    def serialize(self, value: Url) -> str:
+        return value.geturl()
+
 
 class RouteField(Field[str, str]):
+    __slots__ = ()
+
     def __init__(
             self,
             name: str = None,
             required: bool = False,
             default: Union[str, Url] = None,
             description: str = None,
+            *,
+            path: str = None,
+            default_factory: Callable[[], str] = None,
     ) -> None:
         if isinstance(default, str):
-            default = self.parse(default)
+            default, default_factory = defer_default(self.parse, default, default_factory)
 
         super().__init__(
             name=name,
             required=required,
             default=default,
+            default_factory=default_factory,
             description=description,
+            path=path,
             parse_type=str,
             return_type=str,
         )
@@ -68,23 +93,30 @@ class RouteField(Field[str, str]):
 
 
 class IpField(Field[str, IP]):
+    __slots__ = ()
+
     def __init__(
             self,
             name: str = None,
             required: bool = False,
             default: Union[str, IP] = None,
             description: str = None,
+            *,
+            path: str = None,
+            default_factory: Callable[[], IP] = None,
     ) -> None:
         if isinstance(default, str):
-            default = self.parse(default)
+            default, default_factory = defer_default(self.parse, default, default_factory)
         
         super().__init__(
             name=name,
             required=required,
             default=default,
+            default_factory=default_factory,
             parse_type=str,
             return_type=IP,
             description=description,
+            path=path,
         )
     
     def parse(self, value: str) -> IP:
@@ -104,6 +136,8 @@ class PortField(IntField):
     __MIN_VALUE = 0
     __MAX_VALUE = 2**16 - 1
 
+    __slots__ = ()
+
     def __init__(
             self,
             name: str = None,
@@ -112,12 +146,17 @@ class PortField(IntField):
             description: str = None,
             min_value: int = None,
             max_value: int = None,
+            *,
+            path: str = None,
+            default_factory: Callable[[], int] = None,
     ) -> None:
         super().__init__(
             name=name,
             required=required,
             default=default,
+            default_factory=default_factory,
             description=description,
+            path=path,
             min_value=max(min_value or self.__MIN_VALUE, self.__MIN_VALUE),
             max_value=min(max_value or self.__MAX_VALUE, self.__MAX_VALUE),
         )
@@ -1,3 +1,10 @@
-from .base import *
-from .env import *
-from .json import *
+from .._lazy import lazy_exports
+
+_names, __getattr__, __dir__ = lazy_exports(__name__, {
+    '.base': ('LoaderContext', 'LoaderDriver', 'Loader', 'BaseLoaderContext', 'BaseLoaderDriver', 'BaseLoader'),
+    '.env': ('EnvLoaderDriver', 'EnvLoader'),
+    '.json': ('JsonLoaderContext', 'JsonLoaderDriver', 'JsonLoader', 'JsonDirectoryLoaderDriver', 'JsonDirectoryLoader'),
+    '.directory': ('DirectoryLoaderContext', 'DirectoryLoaderDriver', 'DirectoryLoader'),
+})
+
+__all__ = _names
@@ -1,8 +1,11 @@
-from typing import TypeVar, Type, Generic, Optional, Iterable, Tuple, ClassVar, Any, Dict
+from typing import TypeVar, Type, Generic, Optional, Iterable, Tuple, ClassVar, Any, Dict, Set, TYPE_CHECKING
 
 from ..exception import LoaderError, FieldValueError
 from ..field import FieldDefinition, PT, RT
-from ..model import Model
+from ..model import Model, ModelDefinition, LazyModel
+
+if TYPE_CHECKING:
+    from pathlib import Path
 
 __all__ = [
     'LoaderContext',
@@ -63,12 +66,21 @@ class LoaderDriver(Generic[PT]):
     def check_field_required_value(self, context: LoaderContext[PT, M]) -> bool:
         raise NotImplementedError
     
+    def check_field_value_present(self, context: LoaderContext[PT, M]) -> bool:
+        raise NotImplementedError
+    
     def get_field_value(self, context: LoaderContext[PT, M]) -> PT:
         raise NotImplementedError
     
     def parse_field_value(self, context: LoaderContext[PT, M]) -> RT:
         raise NotImplementedError
     
+    def check_field_file_reference(self, context: LoaderContext[PT, M]) -> bool:
+        raise NotImplementedError
+    
+    def parse_field_file_reference(self, context: LoaderContext[PT, M]) -> RT:
+        raise NotImplementedError
+    
     def raise_invalid_field_parsing_type(self, context: LoaderContext[PT, M]) -> None:
         raise NotImplementedError
     
@@ -96,6 +108,7 @@ class BaseLoaderContext(LoaderContext[PT, M]):
             driver: 'LoaderDriver[PT]',
             model: Type[M],
             field: FieldDefinition[PT, RT] = None,
+            defer_defaults: bool = False,
     ) -> None:
         super().__init__(
             driver=driver,
@@ -103,8 +116,11 @@ class BaseLoaderContext(LoaderContext[PT, M]):
             field=field,
         )
 
+        self.__defer_defaults = defer_defaults
         self.__value = None
         self.__clean_value = None
+        self.__models: Dict[Tuple[Type[Model], str, Tuple[str, ...]], Tuple[ModelDefinition, LazyModel]] = {}
+        self.__loaded: Set[FieldDefinition] = set()
     
     def __enter__(self) -> 'LoaderContext[PT, M]':
         self.driver.start_loading(self)
@@ -132,9 +148,28 @@ class BaseLoaderContext(LoaderContext[PT, M]):
     def clean_value(self, value: RT) -> None:
         self.__clean_value = value
 
+    @property
+    def models(self) -> Dict[Tuple[Type[Model], str, Tuple[str, ...]], Tuple[ModelDefinition, LazyModel]]:
+        return self.__models
+
+    @property
+    def loaded(self) -> Set[FieldDefinition]:
+        # Fields having a value in the source, the rest of the loaded data are defaults.
+        return self.__loaded
+
+    @property
+    def defer_defaults(self) -> bool:
+        # Layered loads resolve factory defaults once, after all the sources are merged.
+        return self.__defer_defaults
+
+    @defer_defaults.setter
+    def defer_defaults(self, value: bool) -> None:
+        self.__defer_defaults = value
+
 
 class BaseLoaderDriver(LoaderDriver[PT]):
     _NONE: ClassVar[Any] = object()
+    _DEFERRED_DEFAULT: ClassVar[Any] = object()
     _PARSING_TYPE: ClassVar[Any] = None     # PT
     
     _LOADER_ERROR: ClassVar[Type[LoaderError]] = None
@@ -149,6 +184,16 @@ class BaseLoaderDriver(LoaderDriver[PT]):
         cls._INVALID_FIELD_PARSING_TYPE_ERROR = cls._INVALID_FIELD_PARSING_TYPE_ERROR or cls._LOADER_ERROR
         cls._REQUIRED_FIELD_VALUE_ERROR = cls._REQUIRED_FIELD_VALUE_ERROR or cls._LOADER_ERROR
         cls._FIELD_VALUE_ERROR = cls._FIELD_VALUE_ERROR or cls._LOADER_ERROR
+
+    def __init__(
+            self,
+            file_reference_prefix: str = None,
+    ) -> None:
+        self.__file_reference_prefix = file_reference_prefix
+
+    @property
+    def file_reference_prefix(self) -> Optional[str]:
+        return self.__file_reference_prefix
     
     def create_context(self, model: Type[M]) -> BaseLoaderContext[PT, M]:
         return BaseLoaderContext(
@@ -166,17 +211,61 @@ class BaseLoaderDriver(LoaderDriver[PT]):
     def check_field_required_value(self, context: BaseLoaderContext[PT, M]) -> bool:
         return not context.field.required or context.value is not self._NONE
     
+    def check_field_value_present(self, context: BaseLoaderContext[PT, M]) -> bool:
+        return context.value is not self._NONE
+    
     def get_field_value(self, context: BaseLoaderContext[PT, M]) -> PT:
         raise NotImplementedError
     
     def parse_field_value(self, context: BaseLoaderContext[PT, M]) -> RT:
         if context.value is self._NONE:
+            if context.defer_defaults and context.field.default_factory is not None:
+                return self._DEFERRED_DEFAULT
+
             return context.field.default
 
-        clean_value = context.field.parser(context.value)
+        if self.check_field_file_reference(context):
+            return self.parse_field_file_reference(context)
+
+        parser = context.field.get_parser(type(context.value))
+        clean_value = parser(context.value)
 
         return clean_value
     
+    def check_field_file_reference(self, context: BaseLoaderContext[PT, M]) -> bool:
+        prefix = self.__file_reference_prefix
+
+        return (
+            prefix is not None
+            and isinstance(context.value, str)
+            and context.value.startswith(prefix)
+        )
+    
+    def parse_field_file_reference(self, context: BaseLoaderContext[PT, M]) -> RT:
+        prefix = self.__file_reference_prefix
+        reference = context.value[len(prefix):]
+
+        # A doubled prefix escapes a literal value, e.g. "@@foo" -> "@foo".
+        if reference.startswith(prefix):
+            return context.field.parser(reference)
+
+        # File references are rare in plain env setups, pathlib is only loaded for them.
+        from pathlib import Path
+
+        return self.parse_field_file(context, Path(reference))
+    
+    def parse_field_file(self, context: BaseLoaderContext[PT, M], path: 'Path') -> RT:
+        try:
+            with path.open('r') as fd:
+                return context.field.file_parser(fd)
+
+        # Parsers read the file lazily, undecodable content is raised while parsing.
+        except (OSError, UnicodeDecodeError) as err:
+            raise FieldValueError(
+                "Can not read field value file!",
+                path,
+            ) from err
+    
     def raise_invalid_field_parsing_type(self, context: BaseLoaderContext[PT, M]) -> None:
         raise self._INVALID_FIELD_PARSING_TYPE_ERROR(
             f"Field '{context.field}' parser can not be used with {self._PARSING_TYPE} type!",
@@ -197,7 +286,7 @@ class BaseLoaderDriver(LoaderDriver[PT]):
             exc_stack: Any,
     ) -> bool:
         if isinstance(exc_value, FieldValueError):
-            message, value = exc_value.args
+            message, value, *_ = exc_value.args
             raise self._FIELD_VALUE_ERROR(
                 f"Field '{context.field}' has invalid value!",
                 context.field,
@@ -240,10 +329,16 @@ class BaseLoader(Loader[PT]):
         return data
     
     def load_field(self, context: BaseLoaderContext[PT, M]) -> RT:
+        if isinstance(context.field, ModelDefinition):
+            return self.load_model_field(context)
+
         if not self.driver.check_field_parsing_type(context):
             self.driver.raise_invalid_field_parsing_type(context)
 
         context.value = self.driver.get_field_value(context)
+
+        if self.driver.check_field_value_present(context):
+            context.loaded.add(context.field)
         
         if not self.driver.check_field_required_value(context):
             self.driver.raise_required_field_value_error(context)
@@ -251,6 +346,51 @@ class BaseLoader(Loader[PT]):
         context.clean_value = self.driver.parse_field_value(context)
 
         return context.clean_value
+
+    def load_model_field(self, context: BaseLoaderContext[PT, M]) -> LazyModel:
+        definition = context.field
+        key = (definition.model_type, definition.prefix, definition.scope)
+
+        # The same sub-model name space referenced from several parents is loaded once.
+        cached = context.models.get(key)
+        if cached is not None:
+            loaded_definition, value = cached
+            self._mark_loaded_model_field(context, definition, loaded_definition)
+            return value
+
+        data = {}
+
+        for field_key, field in definition.fields.items():
+            context.field = field
+            data[field_key] = self.load_field(context)
+
+            if field in context.loaded:
+                context.loaded.add(definition)
+
+        context.field = definition
+        value = LazyModel(definition.model_type, data)
+        context.models[key] = (definition, value)
+
+        return value
+
+    def _mark_loaded_model_field(
+            self,
+            context: BaseLoaderContext[PT, M],
+            definition: ModelDefinition,
+            loaded_definition: ModelDefinition,
+    ) -> None:
+        if loaded_definition not in context.loaded:
+            return
+
+        context.loaded.add(definition)
+
+        for key, field in definition.fields.items():
+            loaded_field = loaded_definition.fields[key]
+
+            if isinstance(field, ModelDefinition):
+                self._mark_loaded_model_field(context, field, loaded_field)
+            elif loaded_field in context.loaded:
+                context.loaded.add(field)
     
     def _iter_model_fields(self, context: BaseLoaderContext[PT, M]) -> Iterable[Tuple[str, FieldDefinition[PT, RT]]]:
         for key, field in context.model.iter_fields():
@@ -0,0 +1,130 @@
+from typing import Type, Any, Optional, Dict
+import os
+from pathlib import Path
+
+from ..field import FieldDefinition
+
+from .base import BaseLoader, BaseLoaderDriver, BaseLoaderContext, PT, RT, M
+
+__all__ = [
+    'DirectoryLoaderContext',
+    'DirectoryLoaderDriver',
+    'DirectoryLoader',
+]
+
+
+class DirectoryLoaderContext(BaseLoaderContext[str, M]):
+    def __init__(
+            self,
+            driver: 'LoaderDriver[PT]',
+            model: Type[M],
+            field: FieldDefinition[PT, RT] = None,
+            path: Path = None,
+            index: Dict[str, Path] = None,
+    ) -> None:
+        super().__init__(
+            driver=driver,
+            model=model,
+            field=field,
+        )
+
+        self.__path = path
+        self.__index = index
+
+    @property
+    def path(self) -> Optional[Path]:
+        return self.__path
+
+    @path.setter
+    def path(self, value: Path) -> None:
+        self.__path = value
+
+    @property
+    def index(self) -> Optional[Dict[str, Path]]:
+        return self.__index
+
+    @index.setter
+    def index(self, value: Dict[str, Path]) -> None:
+        self.__index = value
+
+
+class DirectoryLoaderDriver(BaseLoaderDriver[str]):
+    # Kubernetes mounts configmaps and secrets as "<key> -> ..data/<key>" symlinks
+    # where "..data" is swapped atomically to a new "..<timestamp>" generation.
+    __DATA_LINK = '..data'
+
+    _PARSING_TYPE = str
+
+    def create_context(
+            self,
+            model: Type[M],
+            path: Path = None,
+    ) -> DirectoryLoaderContext[M]:
+        return DirectoryLoaderContext(
+            driver=self,
+            model=model,
+            path=path,
+        )
+
+    def start_loading(self, context: DirectoryLoaderContext[M]) -> None:
+        root = self.get_generation_path(Path(context.path))
+        names = {
+            self.get_field_file_name(field)
+            for field in context.model.walk_fields()
+        }
+
+        with os.scandir(root) as entries:
+            context.index = {
+                entry.name: Path(entry.path)
+                for entry in entries
+                if entry.name in names and entry.is_file()
+            }
+
+    def get_generation_path(self, path: Path) -> Path:
+        data = path / self.__DATA_LINK
+        if data.is_dir():
+            # Resolve the symlink once, so every file is read from the same generation.
+            return Path(os.path.realpath(data))
+
+        return path
+
+    def get_field_file_name(self, field: FieldDefinition[PT, RT]) -> str:
+        return field.name
+
+    def get_field_value(self, context: DirectoryLoaderContext[M]) -> Any:
+        return context.index.get(self.get_field_file_name(context.field), self._NONE)
+
+    def parse_field_value(self, context: DirectoryLoaderContext[M]) -> RT:
+        if context.value is self._NONE:
+            return context.field.default
+
+        return self.parse_field_file(context, context.value)
+
+
+class DirectoryLoader(BaseLoader[str]):
+    _DRIVER = DirectoryLoaderDriver()
+
+    def __init__(
+            self,
+            driver: DirectoryLoaderDriver = None,
+    ) -> None:
+        super().__init__(
+            driver=driver,
+        )
+
+    @property
+    def driver(self) -> DirectoryLoaderDriver:
+        return self._driver
+
+    def load_model(
+            self,
+            model: Type[M],
+            path: Path,
+    ) -> M:
+        context = self.driver.create_context(model, path)
+
+        data = self.load(context)
+
+        config = model(data)
+
+        return config
@@ -1,7 +1,11 @@
-from typing import Type, Any, Union, Optional, Dict
+from typing import Type, Any, Union, Optional, Dict, List, Tuple
 
+import os
 import json
+import threading
+from collections import OrderedDict
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 
 from ..exception import LoaderError, FieldValueError
 from ..field import FieldDefinition
@@ -12,9 +16,25 @@ __all__ = [
     'JsonLoaderContext',
     'JsonLoaderDriver',
     'JsonLoader',
+    'JsonDirectoryLoaderDriver',
+    'JsonDirectoryLoader',
 ]
 
 
+FileSignature = Tuple[int, int]
+AccessorTree = Dict[Optional[str], Any]
+
+
+def _copy_document(data: Any) -> Any:
+    if isinstance(data, dict):
+        return {key: _copy_document(value) for key, value in data.items()}
+
+    if isinstance(data, list):
+        return [_copy_document(value) for value in data]
+
+    return data
+
+
 class JsonLoaderContext(BaseLoaderContext[Any, M]):
     def __init__(
             self,
@@ -23,6 +43,8 @@ class JsonLoaderContext(BaseLoaderContext[Any, M]):
             field: FieldDefinition[PT, RT] = None,
             path: Path = None,
             data: Dict = None,
+            values: Dict[FieldDefinition, Any] = None,
+            document: Any = None,
     ) -> None:
         super().__init__(
             driver=driver,
@@ -32,6 +54,8 @@ class JsonLoaderContext(BaseLoaderContext[Any, M]):
 
         self.__path = path
         self.__data = data
+        self.__values = values
+        self.__document = document
     
     @property
     def path(self) -> Optional[Path]:
@@ -43,11 +67,34 @@ class JsonLoaderContext(BaseLoaderContext[Any, M]):
     
     @property
     def data(self) -> Optional[Dict[str, Any]]:
+        # The document may be shared with the driver cache, callers get their own copy on first access.
+        if self.__data is None and self.__document is not None:
+            self.__data = _copy_document(self.__document)
+
         return self.__data
     
     @data.setter
     def data(self, value: Dict[str, Any]) -> None:
         self.__data = value
+        self.__document = None
+
+    @property
+    def document(self) -> Any:
+        # Read only, fields are resolved from the shared document or from the data set by the caller.
+        return self.__document if self.__document is not None else self.__data
+
+    @document.setter
+    def document(self, value: Any) -> None:
+        self.__document = value
+        self.__data = None
+    
+    @property
+    def values(self) -> Optional[Dict[FieldDefinition, Any]]:
+        return self.__values
+    
+    @values.setter
+    def values(self, value: Dict[FieldDefinition, Any]) -> None:
+        self.__values = value
 
 
 class JsonLoaderDriver(BaseLoaderDriver[Any]):
@@ -60,8 +107,30 @@ class JsonLoaderDriver(BaseLoaderDriver[Any]):
         dict,
     )
 
+    __INCLUDE_KEY = '$include'
+    __ACCESSOR_TREE = '_json_accessor_tree'
+
     _PARSING_TYPE = Union[None, int, float, str, list, dict]
 
+    __CACHE_SIZE = 128
+
+    def __init__(
+            self,
+            file_reference_prefix: str = None,
+            cache_size: int = None,
+    ) -> None:
+        super().__init__(
+            file_reference_prefix=file_reference_prefix,
+        )
+
+        self.__cache_size = self.__CACHE_SIZE if cache_size is None else cache_size
+        self.__lock = threading.Lock()
+        self.__files: Dict[Path, Tuple[FileSignature, Any]] = OrderedDict()
+
+    @property
+    def cache_size(self) -> int:
+        return self.__cache_size
+
     def create_context(
             self,
             model: Type[M],
@@ -74,14 +143,171 @@ class JsonLoaderDriver(BaseLoaderDriver[Any]):
         )
     
     def start_loading(self, context: JsonLoaderContext[M]) -> None:
-        with context.path.open('r') as fd:
-            context.data = json.load(fd)
+        context.document = self.read_data(context)
+        context.values = self.resolve_field_values(context)
+
+    def read_data(self, context: JsonLoaderContext[M]) -> Any:
+        # Documents are shared with the cache and must not be modified, see JsonLoaderContext.data.
+        data, _ = self.load_document(Path(context.path))
+        return data
+
+    def store_cached(self, cache: Dict[Path, Any], key: Path, value: Any) -> None:
+        # Least recently used entries are dropped once the cache is full,
+        # a cache size of zero disables caching.
+        if self.__cache_size <= 0:
+            return
+
+        with self.__lock:
+            cache[key] = value
+            cache.move_to_end(key)
+
+            while len(cache) > self.__cache_size:
+                cache.popitem(last=False)
+
+    def get_cached(self, cache: Dict[Path, Any], key: Path) -> Any:
+        with self.__lock:
+            value = cache.get(key)
+
+            if value is not None:
+                cache.move_to_end(key)
+
+            return value
     
     def check_field_parsing_type(self, context: JsonLoaderContext[M]) -> bool:
         return issubclass(context.field.parse_type, self.__JSON_TYPES)
 
     def get_field_value(self, context: JsonLoaderContext[M]) -> Union[int, str]:
-        return context.data.get(context.field.name, self._NONE)
+        return context.values.get(context.field, self._NONE)
+
+    def get_accessor_tree(self, model: Type[M]) -> AccessorTree:
+        # The tree holds definitions referencing the model, it is kept on the model class so
+        # both are released together. Subclasses get their own tree.
+        tree = model.__dict__.get(self.__ACCESSOR_TREE)
+
+        if tree is None:
+            tree = {}
+
+            for field in model.walk_fields():
+                node = tree
+                for key in field.accessor:
+                    node = node.setdefault(key, {})
+
+                # None can never be a JSON object key, so it marks fields ending at the node.
+                node.setdefault(None, []).append(field)
+
+            setattr(model, self.__ACCESSOR_TREE, tree)
+
+        return tree
+
+    def resolve_field_values(self, context: JsonLoaderContext[M]) -> Dict[FieldDefinition, Any]:
+        values = {}
+        stack = [(self.get_accessor_tree(context.model), context.document)]
+
+        while stack:
+            node, data = stack.pop()
+
+            for key, child in node.items():
+                if key is None:
+                    values.update((field, data) for field in child)
+
+                elif isinstance(data, dict):
+                    if key in data:
+                        stack.append((child, data[key]))
+
+                elif isinstance(data, list) and key.isdigit() and int(key) < len(data):
+                    stack.append((child, data[int(key)]))
+
+        return values
+
+    def get_file_signature(self, path: Path) -> FileSignature:
+        stat = path.stat()
+        return stat.st_mtime_ns, stat.st_size
+
+    def parse_json_file(self, path: Path) -> Any:
+        with path.open('r') as fd:
+            return json.load(fd)
+
+    def read_json_file(self, path: Path) -> Tuple[Any, FileSignature]:
+        signature = self.get_file_signature(path)
+
+        cached = self.get_cached(self.__files, path)
+
+        if cached is not None and cached[0] == signature:
+            return cached[1], signature
+
+        data = self.parse_json_file(path)
+
+        self.store_cached(self.__files, path, (signature, data))
+
+        return data, signature
+
+    def load_document(
+            self,
+            path: Path,
+            includes: Tuple[Path, ...] = (),
+    ) -> Tuple[Any, Tuple[Tuple[Path, FileSignature], ...]]:
+        # Included paths are relative to the including file and its own keys
+        # override the included ones. Signatures of every file read are returned
+        # so callers can tell when a cached document becomes stale.
+        path = Path(os.path.realpath(path))
+        if path in includes:
+            raise self._LOADER_ERROR(
+                "JSON include cycle detected!",
+                includes + (path,),
+            )
+
+        data, signature = self.read_json_file(path)
+
+        return self.resolve_includes(path, data, signature, includes)
+
+    def resolve_includes(
+            self,
+            path: Path,
+            data: Any,
+            signature: FileSignature,
+            includes: Tuple[Path, ...] = (),
+    ) -> Tuple[Any, Tuple[Tuple[Path, FileSignature], ...]]:
+        dependencies = ((path, signature),)
+
+        if not isinstance(data, dict) or self.__INCLUDE_KEY not in data:
+            return data, dependencies
+
+        include_paths = data[self.__INCLUDE_KEY]
+        if isinstance(include_paths, str):
+            include_paths = [include_paths]
+
+        if not isinstance(include_paths, list) or not all(isinstance(p, str) for p in include_paths):
+            raise self._LOADER_ERROR(
+                "Invalid JSON include value!",
+                path,
+                include_paths,
+            )
+
+        document = {}
+
+        for include_path in include_paths:
+            included, included_dependencies = self.load_document(
+                path.parent / include_path,
+                includes + (path,),
+            )
+
+            if not isinstance(included, dict):
+                raise self._LOADER_ERROR(
+                    "Included JSON document must contain an object!",
+                    path,
+                    include_path,
+                )
+
+            document.update(included)
+            dependencies += included_dependencies
+
+        document.update(
+            (key, value)
+            for key, value in data.items()
+            if key != self.__INCLUDE_KEY
+        )
+
+        return document, dependencies
 
 
 class JsonLoader(BaseLoader[Any]):
@@ -111,3 +337,90 @@ class JsonLoader(BaseLoader[Any]):
         config = model(data)
 
         return config
+
+
+class JsonDirectoryLoaderDriver(JsonLoaderDriver):
+    __PATTERN = '*.json'
+
+    def __init__(
+            self,
+            pattern: str = None,
+            max_workers: int = None,
+            file_reference_prefix: str = None,
+            cache_size: int = None,
+    ) -> None:
+        super().__init__(
+            file_reference_prefix=file_reference_prefix,
+            cache_size=cache_size,
+        )
+
+        self.__pattern = pattern or self.__PATTERN
+        self.__max_workers = max_workers
+        self.__documents: Dict[Path, Tuple[List[Path], Tuple[Tuple[Path, FileSignature], ...], Dict[str, Any]]] = OrderedDict()
+
+    def read_data(self, context: JsonLoaderContext[M]) -> Dict[str, Any]:
+        directory = Path(context.path)
+        paths = [
+            path
+            for path in sorted(directory.glob(self.__pattern))
+            if path.is_file()
+        ]
+
+        cached = self.get_cached(self.__documents, directory)
+
+        if cached is not None and cached[0] == paths and self.__is_fresh(cached[1]):
+            return cached[2]
+
+        data = {}
+        dependencies = ()
+
+        for path, (resolved_path, (fragment, signature)) in zip(paths, self.__read_json_files(paths)):
+            fragment, fragment_dependencies = self.resolve_includes(resolved_path, fragment, signature)
+            if not isinstance(fragment, dict):
+                raise self._LOADER_ERROR(
+                    "JSON fragment must contain an object!",
+                    path,
+                )
+
+            data.update(fragment)
+            dependencies += fragment_dependencies
+
+        self.store_cached(self.__documents, directory, (paths, dependencies, data))
+
+        return data
+
+    def __is_fresh(self, dependencies: Tuple[Tuple[Path, FileSignature], ...]) -> bool:
+        try:
+            return all(
+                self.get_file_signature(path) == signature
+                for path, signature in dependencies
+            )
+
+        except OSError:
+            return False
+
+    def __read_json_files(self, paths: List[Path]) -> List[Tuple[Path, Tuple[Any, FileSignature]]]:
+        # Fragments are read in parallel and merged in lexical order. The cache is keyed by resolved paths.
+        paths = [Path(os.path.realpath(path)) for path in paths]
+
+        if len(paths) < 2 or self.__max_workers == 1:
+            return [(path, self.read_json_file(path)) for path in paths]
+
+        with ThreadPoolExecutor(max_workers=self.__max_workers) as executor:
+            return list(zip(paths, executor.map(self.read_json_file, paths)))
+
+
+class JsonDirectoryLoader(JsonLoader):
+    _DRIVER = JsonDirectoryLoaderDriver()
+
+    def __init__(
+            self,
+            driver: JsonDirectoryLoaderDriver = None,
+    ) -> None:
+        super().__init__(
+            driver=driver,
+        )
+
+    @property
+    def driver(self) -> JsonDirectoryLoaderDriver:
+        return self._driver
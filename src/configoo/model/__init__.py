@@ -1 +1,8 @@
-from .base import *
+from .._lazy import lazy_exports
+
+_names, __getattr__, __dir__ = lazy_exports(__name__, {
+    '.base': ('Model',),
+    '.model_field': ('ModelField', 'ModelDefinition', 'LazyModel'),
+})
+
+__all__ = _names
@@ -1,50 +1,201 @@
-from typing import TypeVar, Type, Iterable, Tuple, Any, ClassVar, Dict
+from typing import TypeVar, Type, Iterable, Tuple, Any, ClassVar, Dict, Hashable, Optional, Mapping
+from types import MappingProxyType
+from collections import ChainMap
+import sys
+import weakref
 
-from ..field import Field, FieldDefinition
+from ..exception import UndefinedFieldError, FieldValueError
+from ..field import Field, FieldDefinition, register_coercion, pack_canonical, encode_canonical, Canonical
+
+from .model_field import ModelDefinition, LazyModel
 
 __all__ = [
     'Model',
 ]
 
 
+M = TypeVar('M', bound='Model')
+
+_SHARED_DEFINITIONS: 'weakref.WeakValueDictionary[Hashable, FieldDefinition]' = weakref.WeakValueDictionary()
+
+
+def _forget_declaration(declaration: '_Declaration') -> None:
+    if _DECLARATIONS.get(declaration.key) is declaration:
+        del _DECLARATIONS[declaration.key]
+
+
+class _Declaration(weakref.ref):
+    # The first definition of a field name, with the field until it is shared.
+    __slots__ = (
+        'key',
+        'field',
+    )
+
+
+# Only fields declared under the same name more than once can share a definition,
+# specs are not computed for the others.
+_DECLARATIONS: Dict[str, _Declaration] = {}
+
+
+def _freeze_value(value: Any, intern: bool = False) -> Any:
+    # Only plain containers are rebuilt, tuple based values (e.g. parsed URLs) keep their type.
+    if isinstance(value, Model):
+        return value.snapshot(intern=intern)
+    if type(value) in (list, tuple):
+        return tuple(_freeze_value(item, intern) for item in value)
+    if type(value) in (dict, MappingProxyType):
+        return MappingProxyType({
+            _freeze_value(key, intern): _freeze_value(item, intern)
+            for key, item in value.items()
+        })
+    if type(value) in (set, frozenset):
+        return frozenset(_freeze_value(item, intern) for item in value)
+    if intern and type(value) is str:
+        return sys.intern(value)
+
+    return value
+
+
+def _reduce_value(value: Any) -> Any:
+    # Frozen containers are the only values which can not be pickled as they are.
+    if isinstance(value, MappingProxyType):
+        return _FrozenMapping({key: _reduce_value(item) for key, item in value.items()})
+    if isinstance(value, tuple) and type(value) is tuple:
+        return tuple(_reduce_value(item) for item in value)
+
+    return value
+
+
+def _restore_frozen_mapping(data: Dict[Any, Any]) -> Mapping[Any, Any]:
+    return MappingProxyType(data)
+
+
+def _restore_model(model: Type[M], values: Tuple[Any, ...], snapshot: bool) -> M:
+    return model.from_trusted_data(dict(zip((key for key, _ in model.iter_fields()), values)), snapshot)
+
+
+class _FrozenMapping:
+    __slots__ = (
+        '__data',
+    )
+
+    def __init__(self, data: Dict[Any, Any]) -> None:
+        self.__data = data
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return _restore_frozen_mapping, (self.__data,)
+
+
+def _hash_value(value: Any) -> int:
+    if isinstance(value, Mapping):
+        return hash(frozenset((key, _hash_value(item)) for key, item in value.items()))
+    if isinstance(value, tuple):
+        return hash(tuple(_hash_value(item) for item in value))
+
+    return hash(value)
+
+
 class Model:
     __annotations__: Dict[str, Type] = {}
     
     __FIELDS: ClassVar[Dict[str, FieldDefinition]]
 
     __data: Dict[str, Any]
+    __snapshot: bool = False
+    __hash: Optional[int] = None
+    __fingerprint: Optional[str] = None
 
     def __init_subclass__(cls, *args, **kwargs) -> None:
-        cls.__FIELDS = {}
+        cls.__FIELDS = cls._collect_inherited_fields(cls)
 
         for key, value in cls._iter_attributes(cls):
-            if not key.startswith('_') and isinstance(value, Field):
+            if key.startswith('_'):
+                continue
+
+            if isinstance(value, Field):
                 field = cls._create_field_definition(key, value)
                 cls._append_field(key, field)
+
+            elif key in cls.__FIELDS:
+                # A plain attribute in the subclass hides the inherited field.
+                del cls.__FIELDS[key]
+    
+    @classmethod
+    def _collect_inherited_fields(cls, model: Type['Model']) -> Dict[str, FieldDefinition]:
+        # Parent definitions and their properties are reused as is, in MRO order.
+        fields = {}
+
+        for base in reversed(model.__mro__[1:]):
+            base_fields = base.__dict__.get('_Model__FIELDS')
+            if base_fields:
+                fields.update(base_fields)
+
+        return fields
     
     @classmethod
     def _iter_attributes(cls, model: Type['Model']) -> Iterable[Tuple[str, Any]]:
-        return (
-            (
-                key,
-                getattr(model, key)
-            )
-            for key in dir(model)
-        )
+        return list(model.__dict__.items())
  
     @classmethod
     def _create_field_definition(cls, name: str, field: Field) -> FieldDefinition:
         field.name = field.name or name
-        return field.define(
+
+        # Identical fields declared in many models share the parsers and the default of one definition,
+        # every model owns a bound copy. Factory defaults are built once per definition and stay private.
+        if field.default_factory is not None:
+            return field.define(
+                model=cls,
+            )
+
+        key = field.name
+        declaration = _DECLARATIONS.get(key)
+
+        if declaration is None:
+            definition = field.define(
+                model=cls,
+            )
+            declaration = _DECLARATIONS[key] = _Declaration(definition, _forget_declaration)
+            declaration.key = key
+            declaration.field = field
+
+            return definition
+
+        if declaration.field is not None:
+            # The name is declared again, the first definition is shared from now on.
+            first_spec = declaration.field.get_spec()
+            first = declaration()
+            declaration.field = None
+
+            if first_spec is not None and first is not None:
+                _SHARED_DEFINITIONS.setdefault(first_spec, first)
+
+        spec = field.get_spec()
+        definition = _SHARED_DEFINITIONS.get(spec) if spec is not None else None
+
+        if definition is not None:
+            return definition.bound(cls)
+
+        definition = field.define(
             model=cls,
         )
 
+        if spec is not None:
+            _SHARED_DEFINITIONS[spec] = definition
+
+        return definition
+
     @classmethod
     def _append_field(cls, key: str, field: FieldDefinition) -> None:
         cls.__FIELDS[key] = field
 
-        def field_value_getter(self) -> field.return_type:
-            return self.__data[key]
+        if isinstance(field, ModelDefinition):
+            def field_value_getter(self) -> field.return_type:
+                value = self.__data[key]
+                return value.get() if isinstance(value, LazyModel) else value
+
+        else:
+            def field_value_getter(self) -> field.return_type:
+                return self.__data[key]
         
         field_property = property(
             fget=field_value_getter,
@@ -63,12 +214,38 @@ class Model:
             )
             for key, field in cls.__FIELDS.items()
         )
+
+    @classmethod
+    def walk_fields(cls) -> Iterable[FieldDefinition]:
+        for _, field in cls.iter_fields():
+            if isinstance(field, ModelDefinition):
+                yield from cls._walk_model_definition(field)
+            else:
+                yield field
+
+    @classmethod
+    def _walk_model_definition(cls, definition: ModelDefinition) -> Iterable[FieldDefinition]:
+        for field in definition.fields.values():
+            if isinstance(field, ModelDefinition):
+                yield from cls._walk_model_definition(field)
+            else:
+                yield field
     
     def __init__(
             self,
             data: Dict[str, Any],
     ) -> None:
         self.__data = data
+
+    @classmethod
+    def from_trusted_data(cls: Type[M], data: Dict[str, Any], snapshot: bool = False) -> M:
+        # Constructor hook for decoders of already parsed values (pickle, binary format).
+        # The field parsers are not called, a snapshot must hold frozen values only.
+        instance = cls.__new__(cls)
+        instance.__data = data
+        instance.__snapshot = snapshot
+
+        return instance
     
     def __str__(self) -> str:
         values = ', '.join(
@@ -82,11 +259,137 @@ class Model:
     
     __repr__ = __str__
 
+    def __reduce__(self) -> Tuple[Any, ...]:
+        # Only the class reference and the values in field order are pickled, unpickling
+        # trusts the values and skips the field parsers.
+        data = self.__data
+
+        return _restore_model, (
+            self.__class__,
+            tuple(
+                _reduce_value(value.get() if isinstance(value, LazyModel) else value)
+                for value in (data.get(key) for key in self.__FIELDS)
+            ),
+            self.__snapshot,
+        )
+
+    def __eq__(self, other: object) -> bool:
+        # Only snapshots compare by value, loaded models may hold mutable containers.
+        if not self.__snapshot or not isinstance(other, Model) or not other.__snapshot:
+            return NotImplemented
+
+        return self is other or (
+            type(self) is type(other)
+            and hash(self) == hash(other)
+            and self.__data == other.__data
+        )
+
+    def __hash__(self) -> int:
+        if not self.__snapshot:
+            return object.__hash__(self)
+
+        if self.__hash is None:
+            self.__hash = hash((
+                type(self),
+                # Field order, equal snapshots may be built from differently ordered dicts.
+                tuple(_hash_value(self.__data.get(key)) for key in self.__FIELDS),
+            ))
+
+        return self.__hash
+
+    @property
+    def is_snapshot(self) -> bool:
+        return self.__snapshot
+
+    @property
+    def fingerprint(self) -> str:
+        # Computed from the canonical field encodings, stable across processes and hosts.
+        if not self.__snapshot:
+            return self.snapshot().fingerprint
+
+        if self.__fingerprint is None:
+            import hashlib
+
+            self.__fingerprint = hashlib.sha256(encode_canonical(self)).hexdigest()
+
+        return self.__fingerprint
+
+    def snapshot(self: M, intern: bool = False) -> M:
+        if self.__snapshot and not intern:
+            return self
+
+        snapshot = self.__class__.__new__(self.__class__)
+        snapshot.__data = {
+            key: _freeze_value(value, intern)
+            for key, value in self
+        }
+        snapshot.__snapshot = True
+
+        return snapshot
+
+    def replace(self: M, **changes: Any) -> M:
+        overrides = {
+            key: self.__parse_replaced_value(key, value)
+            for key, value in changes.items()
+        }
+
+        # Derived models keep only the overridden values on top of the loaded data. Earlier overrides
+        # are folded into the new layer, so lookups stay two levels deep for any chain of replaces.
+        data = self.__data
+        if isinstance(data, ChainMap):
+            overrides = {**data.maps[0], **overrides}
+            data = data.maps[1]
+
+        derived = self.__class__.__new__(self.__class__)
+        derived.__data = ChainMap(overrides, data)
+        derived.__snapshot = self.__snapshot
+
+        return derived
+
+    def __parse_replaced_value(self, key: str, value: Any) -> Any:
+        field = self.__FIELDS.get(key)
+        if field is None:
+            raise UndefinedFieldError(
+                "Model field is not defined!",
+                key,
+            )
+
+        if value is None:
+            if field.required:
+                raise FieldValueError(
+                    f"Field '{field}' value is required!",
+                    field,
+                )
+
+            return None
+
+        try:
+            value = field.get_parser(type(value))(value)
+        except FieldValueError:
+            raise
+        except (TypeError, ValueError, AttributeError) as err:
+            raise FieldValueError(
+                f"Field '{field}' value is invalid!",
+                value,
+            ) from err
+
+        return _freeze_value(value) if self.__snapshot else value
+
     def __iter__(self) -> Iterable[Tuple[str, Any]]:
         return (
             (
                 key,
-                value,
+                value.get() if isinstance(value, LazyModel) else value,
             )
             for key, value in self.__data.items()
         )
+
+
+register_coercion(Model, Canonical, lambda value: pack_canonical(
+    'model',
+    f"{type(value).__module__}.{type(value).__qualname__}",
+    *(
+        pack_canonical('field', key, encode_canonical(item))
+        for key, item in value
+    ),
+))
@@ -0,0 +1,251 @@
+from typing import TypeVar, Type, Generic, Optional, Tuple, Dict, Any, Mapping, Callable, TextIO
+
+from ..exception import FieldValueError
+from ..field import Field, FieldDefinition, PT, RT
+
+__all__ = [
+    'ModelField',
+    'ModelDefinition',
+    'LazyModel',
+]
+
+
+M = TypeVar('M')
+
+
+class LazyModel(Generic[M]):
+    __slots__ = (
+        '__model',
+        '__data',
+        '__instance',
+    )
+
+    def __init__(
+            self,
+            model: Type[M],
+            data: Dict[str, Any],
+    ) -> None:
+        self.__model = model
+        self.__data = data
+        self.__instance: Optional[M] = None
+
+    def __str__(self) -> str:
+        return f"{self.__class__.__name__}({self.__model.__name__})"
+
+    __repr__ = __str__
+
+    @property
+    def model(self) -> Type[M]:
+        return self.__model
+
+    @property
+    def data(self) -> Dict[str, Any]:
+        return self.__data
+
+    @property
+    def built(self) -> bool:
+        return self.__instance is not None
+
+    def get(self) -> M:
+        if self.__instance is None:
+            self.__instance = self.__model(self.__data)
+
+        return self.__instance
+
+
+class ModelField(Field[dict, M]):
+    __slots__ = (
+        '__model',
+        '__prefix',
+    )
+
+    def __init__(
+            self,
+            model: Type[M],
+            name: str = None,
+            required: bool = False,
+            default: M = None,
+            description: str = None,
+            prefix: str = None,
+            merge: Field.Merge = None,
+            *,
+            path: str = None,
+            default_factory: Callable[[], M] = None,
+    ) -> None:
+        super().__init__(
+            name=name,
+            required=required,
+            default=default,
+            default_factory=default_factory,
+            description=description,
+            path=path,
+            parse_type=dict,
+            return_type=model,
+            merge=merge or Field.Merge.DEEP_MERGE,
+        )
+
+        self.__model = model
+        self.__prefix = prefix or ''
+
+    @property
+    def model(self) -> Type[M]:
+        return self.__model
+
+    @model.setter
+    def model(self, value: Type[M]) -> None:
+        self.__model = value
+
+    @property
+    def prefix(self) -> str:
+        return self.__prefix
+
+    @prefix.setter
+    def prefix(self, value: str) -> None:
+        self.__prefix = value or ''
+
+    def parse(self, value: Mapping[str, Any]) -> M:
+        if isinstance(value, self.__model):
+            return value
+
+        if isinstance(value, LazyModel):
+            return value.get()
+
+        if not isinstance(value, Mapping):
+            raise FieldValueError(
+                "Invalid model value!",
+                value,
+            )
+
+        data = {}
+
+        for key, field in self.__model.iter_fields():
+            if key in value:
+                data[key] = field.get_parser(type(value[key]))(value[key])
+            elif field.required:
+                raise FieldValueError(
+                    "Model field value is required!",
+                    key,
+                )
+            else:
+                data[key] = field.default
+
+        return self.__model(data)
+
+    def define(
+            self,
+            model: 'Model',
+    ) -> 'ModelDefinition[M]':
+        return ModelDefinition.create_from_model_field(model, self)
+
+
+class ModelDefinition(FieldDefinition[dict, M]):
+    __slots__ = (
+        '__model_type',
+        '__prefix',
+        '__scope',
+        '__fields',
+    )
+
+    @classmethod
+    def create_from_model_field(
+            cls,
+            model: 'Model',
+            field: ModelField[M],
+    ) -> 'ModelDefinition[M]':
+        return cls(
+            model=model,
+            model_type=field.model,
+            prefix=field.prefix,
+            name=field.name,
+            required=field.required,
+            default=field.default,
+            default_factory=field.default_factory,
+            description=field.description,
+            path=field.path,
+            parse_type=field.parse_type,
+            return_type=field.return_type,
+            parser=field.parse,
+            file_parser=field.parse_file,
+            parser_factory=field.create_parser,
+            serializer=field.serialize,
+            json_serializer=field.serialize_json,
+            merge=field.merge,
+        )
+
+    def __init__(
+            self,
+            *,
+            model: 'Model',
+            model_type: Type[M],
+            prefix: str,
+            name: str,
+            required: bool,
+            default: M,
+            default_factory: Callable[[], M] = None,
+            description: Optional[str],
+            path: Optional[str],
+            parse_type: Type[dict],
+            return_type: Type[M],
+            parser: Callable[[dict], M],
+            file_parser: Callable[[TextIO], M] = None,
+            parser_factory: Callable[[type], Callable[[Any], M]] = None,
+            serializer: Callable[[M], str] = None,
+            json_serializer: Callable[[M], Any] = None,
+            merge: Field.Merge = None,
+    ) -> None:
+        super().__init__(
+            model=model,
+            name=name,
+            required=required,
+            default=default,
+            default_factory=default_factory,
+            description=description,
+            path=path,
+            parse_type=parse_type,
+            return_type=return_type,
+            parser=parser,
+            file_parser=file_parser,
+            parser_factory=parser_factory,
+            serializer=serializer,
+            json_serializer=json_serializer,
+            merge=merge,
+        )
+
+        self.__model_type = model_type
+        self.__prefix = prefix
+        self.__scope = self.accessor if path else ()
+        self.__fields = self.__define_fields()
+
+    def prefixed(
+            self,
+            prefix: str,
+            scope: Tuple[str, ...] = (),
+    ) -> 'ModelDefinition[M]':
+        definition = super().prefixed(prefix, scope)
+        definition.__prefix = prefix + self.__prefix
+        definition.__scope = definition.accessor if self.path else scope
+        definition.__fields = definition.__define_fields()
+
+        return definition
+
+    @property
+    def model_type(self) -> Type[M]:
+        return self.__model_type
+
+    @property
+    def prefix(self) -> str:
+        return self.__prefix
+
+    @property
+    def scope(self) -> Tuple[str, ...]:
+        return self.__scope
+
+    @property
+    def fields(self) -> Dict[str, FieldDefinition]:
+        return self.__fields
+
+    def __define_fields(self) -> Dict[str, FieldDefinition]:
+        return {
+            key: field.prefixed(self.__prefix, self.__scope)
+            for key, field in self.__model_type.iter_fields()
+        }
@@ -0,0 +1,220 @@
+from typing import TypeVar, Generic, Optional, Tuple, TYPE_CHECKING
+import gc
+import pickle
+import struct
+import sys
+import threading
+import time
+
+from .exception import LoaderError
+
+if TYPE_CHECKING:
+    from multiprocessing import shared_memory
+
+__all__ = [
+    'SharedConfigPublisher',
+    'SharedConfigReader',
+    'freeze_for_fork',
+]
+
+
+M = TypeVar('M')
+
+# Sequence (odd while a config is written), generation and payload length.
+_HEADER = struct.Struct('<QQQ')
+
+
+def _attach(name: str) -> 'shared_memory.SharedMemory':
+    # Imported on use, multiprocessing.shared_memory is not available before Python 3.8.
+    from multiprocessing import shared_memory
+
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name=name, track=False)
+
+    from multiprocessing import resource_tracker
+
+    # Workers forked from the publisher share its resource tracker. A tracker started by any
+    # other process would unlink the segment owned by the publisher when that process exits.
+    inherited = getattr(resource_tracker._resource_tracker, '_fd', None) is not None
+    memory = shared_memory.SharedMemory(name=name)
+
+    if not inherited:
+        resource_tracker.unregister(memory._name, 'shared_memory')
+
+    return memory
+
+
+def freeze_for_fork(
+        config: M,
+        gc_freeze: bool = False,
+) -> M:
+    # Everything a worker would build lazily is built before fork, so the pages stay shared:
+    # frozen containers, interned strings and resolved default factories.
+    frozen = config.snapshot(intern=True)
+
+    for definition in type(config).walk_fields():
+        definition.default
+
+    if gc_freeze:
+        # Frozen objects are never scanned by the collector of a worker, which would touch their pages.
+        gc.collect()
+        gc.freeze()
+
+    return frozen
+
+
+class SharedConfigPublisher(Generic[M]):
+    __DEFAULT_SIZE = 1024 * 1024
+
+    def __init__(
+            self,
+            size: int = None,
+            name: str = None,
+    ) -> None:
+        from multiprocessing import shared_memory
+
+        self.__memory = shared_memory.SharedMemory(
+            name=name,
+            create=True,
+            size=_HEADER.size + (size or self.__DEFAULT_SIZE),
+        )
+        self.__sequence = 0
+        self.__generation = 0
+        self.__config: Optional[M] = None
+
+        _HEADER.pack_into(self.__memory.buf, 0, 0, 0, 0)
+
+    def __enter__(self) -> 'SharedConfigPublisher[M]':
+        return self
+
+    def __exit__(self, *err) -> None:
+        self.close()
+
+    @property
+    def name(self) -> str:
+        return self.__memory.name
+
+    @property
+    def capacity(self) -> int:
+        return self.__memory.size - _HEADER.size
+
+    @property
+    def generation(self) -> int:
+        return self.__generation
+
+    def publish(self, config: M) -> int:
+        # Models pickle as their class and field values, workers do not parse the sources again.
+        payload = pickle.dumps(config, protocol=pickle.HIGHEST_PROTOCOL)
+
+        if len(payload) > self.capacity:
+            raise ValueError(
+                "Config does not fit into the shared memory segment!",
+                len(payload),
+                self.capacity,
+            )
+
+        buffer = self.__memory.buf
+        generation = self.__generation + 1
+
+        # Seqlock, readers retry while the sequence is odd or changes during their copy.
+        self.__sequence += 1
+        _HEADER.pack_into(buffer, 0, self.__sequence, self.__generation, 0)
+
+        buffer[_HEADER.size:_HEADER.size + len(payload)] = payload
+
+        self.__sequence += 1
+        _HEADER.pack_into(buffer, 0, self.__sequence, generation, len(payload))
+        self.__generation = generation
+        self.__config = config
+
+        return generation
+
+    def reader(self) -> 'SharedConfigReader[M]':
+        # Python objects can not live in the segment, a worker unpickles its own copy of a new
+        # generation. Readers created after publish hold the published instance, workers forked
+        # with them share it with the master (see freeze_for_fork) until the next generation.
+        return SharedConfigReader(
+            self.name,
+            config=self.__config,
+            generation=self.__generation,
+        )
+
+    def close(self) -> None:
+        self.__memory.close()
+        self.__memory.unlink()
+
+
+class SharedConfigReader(Generic[M]):
+    __ATTEMPTS = 1000
+    __RETRY_DELAY = 0.001
+
+    def __init__(
+            self,
+            name: str,
+            config: M = None,
+            generation: int = 0,
+    ) -> None:
+        self.__name = name
+        self.__memory: Optional['shared_memory.SharedMemory'] = None
+        self.__generation = generation if config is not None else 0
+        self.__config = config
+        self.__lock = threading.Lock()
+
+    @property
+    def name(self) -> str:
+        return self.__name
+
+    @property
+    def generation(self) -> int:
+        return self.__generation
+
+    def get(self) -> M:
+        # Only the generation is read while the config stays the same.
+        memory = self.__memory or self.__attach()
+        _, generation, _ = _HEADER.unpack_from(memory.buf, 0)
+
+        if generation != self.__generation or self.__config is None:
+            with self.__lock:
+                if generation != self.__generation or self.__config is None:
+                    self.__generation, payload = self.__read(memory)
+                    self.__config = pickle.loads(payload)
+
+        return self.__config
+
+    def close(self) -> None:
+        if self.__memory is not None:
+            self.__memory.close()
+            self.__memory = None
+
+    def __attach(self) -> 'shared_memory.SharedMemory':
+        # Attached on first use, e.g. in a worker after fork.
+        with self.__lock:
+            if self.__memory is None:
+                self.__memory = _attach(self.__name)
+
+        return self.__memory
+
+    def __read(self, memory: 'shared_memory.SharedMemory') -> Tuple[int, bytes]:
+        buffer = memory.buf
+
+        for _ in range(self.__ATTEMPTS):
+            sequence, generation, length = _HEADER.unpack_from(buffer, 0)
+
+            if not sequence & 1:
+                payload = bytes(buffer[_HEADER.size:_HEADER.size + length])
+
+                if _HEADER.unpack_from(buffer, 0)[0] == sequence:
+                    if not generation:
+                        raise LoaderError(
+                            "Config is not published yet!",
+                            self.__name,
+                        )
+
+                    return generation, payload
+
+            time.sleep(self.__RETRY_DELAY)
+
+        raise LoaderError(
+            "Config is being published, can not read a consistent copy!",
+            self.__name,
+        )
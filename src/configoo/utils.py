@@ -1,19 +1,25 @@
-from typing import TypeVar, Type, Iterable, Tuple, Any, Union, List, Dict
+from typing import TypeVar, Type, Iterable, Iterator, Tuple, Any, Union, List, Dict, Set, TYPE_CHECKING
 
-from pathlib import Path
+from .field import Field, FieldDefinition
+from .model import ModelDefinition, LazyModel
 
 from .loader import (
     Loader,
     LoaderDriver,
+    BaseLoaderContext,
+    BaseLoaderDriver,
     EnvLoader,
     EnvLoaderDriver,
-    JsonLoader,
-    JsonLoaderDriver,
 )
 
+if TYPE_CHECKING:
+    from pathlib import Path
+
 __all__ = [
     'load_from_env',
     'load_from_json',
+    'load_from_json_directory',
+    'load_from_directory',
     'load_rewriting',
     'load_appending',
 ]
@@ -39,11 +45,49 @@ def load_from_env(
 
 def load_from_json(
         model: Type[T],
-        path: Path,
-        loader: Type[JsonLoader] = None,
-        driver: JsonLoaderDriver = None,
+        path: 'Path',
+        loader: Type['JsonLoader'] = None,
+        driver: 'JsonLoaderDriver' = None,
+) -> T:
+    from .loader import json
+
+    loader = (loader or json.JsonLoader)(
+        driver=driver,
+    )
+
+    return loader.load_model(
+        model=model,
+        path=path,
+    )
+
+
+def load_from_json_directory(
+        model: Type[T],
+        path: 'Path',
+        loader: Type['JsonDirectoryLoader'] = None,
+        driver: 'JsonDirectoryLoaderDriver' = None,
 ) -> T:
-    loader = (loader or JsonLoader)(
+    from .loader import json
+
+    loader = (loader or json.JsonDirectoryLoader)(
+        driver=driver,
+    )
+
+    return loader.load_model(
+        model=model,
+        path=path,
+    )
+
+
+def load_from_directory(
+        model: Type[T],
+        path: 'Path',
+        loader: Type['DirectoryLoader'] = None,
+        driver: 'DirectoryLoaderDriver' = None,
+) -> T:
+    from .loader import directory
+
+    loader = (loader or directory.DirectoryLoader)(
         driver=driver,
     )
 
@@ -55,7 +99,7 @@ def load_from_json(
 
 def load_from_dotenv(
         model: Type[T],
-        path: Path,
+        path: 'Path',
         loader: Type['DotenvLoader'] = None,
         driver: 'DotenvLoaderDriver' = None,
 ) -> T:
@@ -76,32 +120,113 @@ def __get_loader_args_kwargs(
         default_args: Any = None,
         default_kwargs: Any = None,
 ) -> Tuple[Loader, List[Any], Dict[str, Any]]:
+    if not isinstance(item, tuple):
+        item = (item,)
+
     return (
-        item[0] if isinstance(item, tuple) else item,
-        item[1] if isinstance(item, tuple) else default_args or [],
-        item[2] if isinstance(item, tuple) else default_kwargs or {},
+        item[0],
+        item[1] if len(item) > 1 else default_args or [],
+        item[2] if len(item) > 2 else default_kwargs or {},
     )
 
 
-def load_rewriting(
+def __load_layers(
         model: Type[T],
         loaders: Iterable[LoaderItem],
-) -> T:
-    data = {}
-
+) -> Iterator[Tuple[Dict[str, Any], Set[FieldDefinition]]]:
     for item in loaders:
         loader, args, kwargs = __get_loader_args_kwargs(item)
 
         context = loader.driver.create_context(
-            model=model,
+            model,
             *args,
             **kwargs,
         )
 
+        if isinstance(context, BaseLoaderContext):
+            context.defer_defaults = True
+
         context_data = loader.load(context)
-        data.update(context_data)
+
+        yield context_data, context.loaded
+
+
+def __merge_data(
+        fields: Iterable[Tuple[str, FieldDefinition]],
+        base: Dict[str, Any],
+        base_loaded: Set[FieldDefinition],
+        override: Dict[str, Any],
+        override_loaded: Set[FieldDefinition],
+) -> Dict[str, Any]:
+    # Only the values found in the overriding source are merged, its defaults never
+    # replace values loaded from the base one.
+    data = dict(base)
+
+    for key, field in fields:
+        if field not in override_loaded:
+            continue
+
+        if field in base_loaded:
+            data[key] = __merge_value(field, base[key], base_loaded, override[key], override_loaded)
+        else:
+            data[key] = override[key]
+
+    return data
+
+
+def __resolve_defaults(
+        fields: Iterable[Tuple[str, FieldDefinition]],
+        data: Dict[str, Any],
+) -> Dict[str, Any]:
+    # Factory defaults of fields missing from every source are only computed once the layers are merged.
+    for key, field in fields:
+        value = data.get(key)
+
+        if value is BaseLoaderDriver._DEFERRED_DEFAULT:
+            data[key] = field.default
+        elif isinstance(field, ModelDefinition) and isinstance(value, LazyModel):
+            __resolve_defaults(field.fields.items(), value.data)
+
+    return data
+
+
+def __merge_value(
+        field: FieldDefinition,
+        base: Any,
+        base_loaded: Set[FieldDefinition],
+        override: Any,
+        override_loaded: Set[FieldDefinition],
+) -> Any:
+    if (
+            isinstance(field, ModelDefinition)
+            and field.merge is Field.Merge.DEEP_MERGE
+            and isinstance(base, LazyModel)
+            and isinstance(override, LazyModel)
+    ):
+        return LazyModel(
+            field.model_type,
+            __merge_data(field.fields.items(), base.data, base_loaded, override.data, override_loaded),
+        )
+
+    return field.merge_values(base, override)
+
+
+def load_rewriting(
+        model: Type[T],
+        loaders: Iterable[LoaderItem],
+) -> T:
+    data = None
+    loaded = set()
+
+    for context_data, context_loaded in __load_layers(model, loaders):
+        if data is None:
+            data = context_data
+        else:
+            data = __merge_data(model.iter_fields(), data, loaded, context_data, context_loaded)
+
+        loaded |= context_loaded
     
-    return model(data)
+    return model(__resolve_defaults(model.iter_fields(), data or {}))
 
 
 def load_appending(
@@ -109,18 +234,10 @@ def load_appending(
         loaders: Iterable[LoaderItem],
 ) -> T:
     data = {}
+    loaded = set()
 
-    for item in loaders:
-        loader, args, kwargs = __get_loader_args_kwargs(item)
-        
-        context = loader.driver.create_context(
-            model=model,
-            *args,
-            **kwargs,
-        )
-
-        context_data = loader.load(context)
-        for key, value in context_data.items():
-            data.setdefault(key, value)
+    for context_data, context_loaded in __load_layers(model, loaders):
+        data = __merge_data(model.iter_fields(), context_data, context_loaded, data, loaded)
+        loaded |= context_loaded
     
-    return model(data)
+    return model(__resolve_defaults(model.iter_fields(), data))
@@ -0,0 +1,115 @@
+import enum
+import re
+from datetime import timedelta
+from ipaddress import ip_address
+from pathlib import Path
+from types import MappingProxyType
+
+import pytest
+
+from configoo import field, model, dump_to_binary, load_from_binary
+from configoo.exception import LoaderError
+
+
+class Level(enum.IntEnum):
+    LOW = 1
+    HIGH = 2
+
+
+class BinaryInner(model.Model):
+    NAME = field.StrField(default='inner')
+
+
+class BinaryConfig(model.Model):
+    COUNT = field.IntField()
+    RATIO = field.FloatField()
+    NAME = field.StrField()
+    ENABLED = field.StrField()
+    URL = field.UrlField()
+    PATH = field.PathField()
+    IP = field.IpField()
+    LEVEL = field.EnumField(Level)
+    TIMEOUT = field.DurationField(as_timedelta=True)
+    PATTERN = field.RegexField()
+    PATTERNS = field.RegexListField()
+    SECRET = field.BytesField(lazy=True)
+    PORTS = field.ListField(field.IntField())
+    LABELS = field.DictField(field.StrField(), field.StrField(), frozen=True)
+    INNER = model.ModelField(BinaryInner)
+    MISSING = model.ModelField(BinaryInner)
+
+
+class OtherConfig(model.Model):
+    COUNT = field.StrField()
+
+
+@pytest.fixture
+def config():
+    return BinaryConfig({
+        'COUNT': -300,
+        'RATIO': 0.25,
+        'NAME': 'näme' * 100,
+        'ENABLED': None,
+        'URL': field.UrlField().parse('https://example.com/a?b=1'),
+        'PATH': Path('/var/lib'),
+        'IP': ip_address('::1'),
+        'LEVEL': Level.HIGH,
+        'TIMEOUT': timedelta(days=-1, seconds=5),
+        'PATTERN': re.compile('a+', re.IGNORECASE),
+        'PATTERNS': field.RegexListField().parse('a,b'),
+        'SECRET': field.BytesField(lazy=True).parse('YWJj'),
+        'PORTS': [80, 2 ** 70, -1],
+        'LABELS': MappingProxyType({'a': 'b'}),
+        'INNER': BinaryInner({'NAME': 'x'}),
+        'MISSING': None,
+    })
+
+
+class TestBinaryFormat:
+    def test_roundtrip(self, config):
+        restored = load_from_binary(BinaryConfig, dump_to_binary(config))
+
+        assert restored.snapshot() == config.snapshot()
+        assert restored.fingerprint == config.fingerprint
+        assert type(restored.LEVEL) is Level
+        assert isinstance(restored.LABELS, MappingProxyType)
+        assert restored.INNER.NAME == 'x'
+        assert restored.MISSING is None
+        assert not restored.is_snapshot
+
+    def test_snapshot(self, config):
+        snapshot = config.snapshot()
+        restored = load_from_binary(BinaryConfig, memoryview(dump_to_binary(snapshot)))
+
+        assert restored.is_snapshot
+        assert restored.INNER.is_snapshot
+        assert restored == snapshot
+
+    def test_data_order(self):
+        restored = load_from_binary(BinaryInner, dump_to_binary(BinaryInner({})))
+        assert restored.NAME is None
+
+        config = BinaryConfig({'NAME': 'hello', 'COUNT': 5})
+        restored = load_from_binary(BinaryConfig, dump_to_binary(config))
+
+        assert (restored.COUNT, restored.NAME) == (5, 'hello')
+        assert restored.RATIO is None
+
+    def test_schema_mismatch(self, config):
+        with pytest.raises(LoaderError):
+            load_from_binary(OtherConfig, dump_to_binary(config))
+
+    @pytest.mark.parametrize('change', [
+        lambda data: b'XXXX' + data[4:],
+        lambda data: data[:4] + b'\x09' + data[5:],
+        lambda data: data[:-3],
+        lambda data: data + b'\x00',
+        lambda data: data[:14] + b'\x7f' + data[15:],
+    ])
+    def test_invalid_data(self, config, change):
+        with pytest.raises(LoaderError):
+            load_from_binary(BinaryConfig, change(dump_to_binary(config)))
+
+    def test_unsupported_value(self):
+        with pytest.raises(TypeError):
+            dump_to_binary(OtherConfig({'COUNT': object()}))
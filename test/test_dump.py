@@ -0,0 +1,159 @@
+import enum
+import json
+import logging
+import re
+from datetime import timedelta
+from ipaddress import ip_address
+from pathlib import Path
+
+import pytest
+
+from configoo import field, model, load_from_env, load_from_json, dump_to_env, dump_to_dotenv, dump_to_json
+from configoo.exception import FieldValueError
+
+
+class Mode(enum.Enum):
+    FAST = 'fast'
+    SAFE = 'safe'
+
+
+class DumpInner(model.Model):
+    NAME = field.StrField(default='inner')
+    RETRIES = field.IntField(default=3)
+
+
+class DumpConfig(model.Model):
+    COUNT = field.IntField()
+    RATIO = field.FloatField()
+    LIMIT = field.NumField()
+    NAME = field.StrField()
+    MISSING = field.StrField()
+    URL = field.UrlField()
+    PATH = field.PathField()
+    IP = field.IpField()
+    MODE = field.EnumField(Mode)
+    LEVEL = field.LoggingLevelField()
+    FORMAT = field.LoggingBracketFormatField()
+    TIMEOUT = field.DurationField(unit='ms', as_timedelta=True)
+    SIZE = field.ByteSizeField()
+    PATTERN = field.RegexField()
+    PATTERNS = field.RegexListField()
+    SECRET = field.BytesField(encoding=field.BytesField.Encoding.HEX, lazy=True)
+    PORTS = field.ListField(field.IntField(), frozen=True)
+    LABELS = field.DictField(field.StrField(), field.IntField())
+    INNER = model.ModelField(DumpInner, prefix='INNER_')
+    NESTED = model.ModelField(DumpInner, prefix='NESTED_', path='nested.inner')
+
+
+@pytest.fixture
+def config():
+    return DumpConfig({
+        'COUNT': 2 ** 70,
+        'RATIO': 0.1,
+        'LIMIT': 1.5,
+        'NAME': "it's a \"name\" \\ with\nlines",
+        'MISSING': None,
+        'URL': field.UrlField().parse('https://example.com/a?b=1'),
+        'PATH': Path('/var/lib'),
+        'IP': ip_address('::1'),
+        'MODE': Mode.SAFE,
+        'LEVEL': logging.WARNING,
+        'FORMAT': field.LoggingBracketFormatField().parse('level,message'),
+        'TIMEOUT': timedelta(seconds=1.5),
+        'SIZE': 1024 ** 3,
+        'PATTERN': re.compile('a+'),
+        'PATTERNS': field.RegexListField().parse('a,b+'),
+        'SECRET': field.BytesField(encoding=field.BytesField.Encoding.HEX, lazy=True).parse('00ff'),
+        'PORTS': (80, 443),
+        'LABELS': {'a': 1, 'b': 2},
+        'INNER': DumpInner({'NAME': 'x', 'RETRIES': 5}),
+        'NESTED': DumpInner({'NAME': 'y', 'RETRIES': 0}),
+    })
+
+
+def use_env(monkeypatch, env):
+    monkeypatch.setattr('configoo.loader.env.getenv', lambda name, default=None: env.get(name, default))
+
+
+class TestDumpToEnv:
+    def test_values(self, config):
+        env = dump_to_env(config)
+
+        assert env['COUNT'] == str(2 ** 70)
+        assert env['LEVEL'] == 'WARNING'
+        assert env['TIMEOUT'] == '1.5s'
+        assert env['PORTS'] == '80,443'
+        assert env['INNER_NAME'] == 'x'
+        assert env['NESTED_NAME'] == 'y'
+        assert 'MISSING' not in env
+
+    def test_roundtrip(self, config, monkeypatch):
+        use_env(monkeypatch, dump_to_env(config))
+
+        restored = load_from_env(DumpConfig)
+
+        assert restored.fingerprint == config.fingerprint
+        assert restored.INNER.RETRIES == 5
+
+    def test_file_reference_prefix(self, config):
+        env = dump_to_env(config.replace(NAME='@name'), file_reference_prefix='@')
+
+        assert env['NAME'] == '@@name'
+
+    def test_unset_field_with_default(self):
+        with pytest.raises(FieldValueError):
+            dump_to_env(DumpInner({'NAME': None, 'RETRIES': 1}))
+
+    def test_shared_name(self):
+        class Shared(model.Model):
+            NAME = field.StrField()
+            INNER = model.ModelField(DumpInner)
+
+        assert dump_to_env(Shared({'NAME': 'x', 'INNER': DumpInner({'NAME': 'x', 'RETRIES': 1})}))['NAME'] == 'x'
+
+        with pytest.raises(FieldValueError):
+            dump_to_env(Shared({'NAME': 'x', 'INNER': DumpInner({'NAME': 'y', 'RETRIES': 1})}))
+
+    def test_separator_in_item(self, config):
+        with pytest.raises(FieldValueError):
+            dump_to_env(config.replace(LABELS={'a,b': 1}))
+
+        with pytest.raises(FieldValueError):
+            dump_to_env(config.replace(LABELS={'a:b': 1}))
+
+        with pytest.raises(FieldValueError):
+            dump_to_env(config.replace(PATTERNS=field.RegexListField().parse(['a,b'])))
+
+
+class TestDumpToDotenv:
+    def test_quoting(self, config):
+        content = dump_to_dotenv(config)
+
+        assert "NAME='it\\'s a \"name\" \\\\ with\nlines'\n" in content
+        assert "COUNT='1180591620717411303424'\n" in content
+
+    def test_path(self, config, tmp_path):
+        path = tmp_path / '.env'
+
+        assert dump_to_dotenv(config, path) == path.read_text()
+
+
+class TestDumpToJson:
+    def test_native_values(self, config):
+        data = json.loads(dump_to_json(config))
+
+        assert data['COUNT'] == 2 ** 70
+        assert data['PORTS'] == [80, 443]
+        assert data['LABELS'] == {'a': 1, 'b': 2}
+        assert data['PATTERNS'] == ['a', 'b+']
+        assert data['nested']['inner'] == {'NAME': 'y', 'RETRIES': 0}
+
+    def test_roundtrip(self, config, tmp_path):
+        config = config.replace(LABELS={'a:b,c': 1})
+        path = tmp_path / 'config.json'
+        dump_to_json(config, path)
+
+        restored = load_from_json(DumpConfig, path)
+
+        assert restored.fingerprint == config.fingerprint
+        assert restored.NESTED.NAME == 'y'
@@ -1,13 +1,18 @@
-from typing import Any
+from typing import Any, Iterator
 
 import pytest
 
+import re
+import base64
 import logging
 import enum
+import time
+from datetime import timedelta
 from pathlib import Path as _Path
 
 from configoo.exception import *
 from configoo.field import *
+from configoo.field.num_field import Num
 
 
 class TestIntegerField:
@@ -109,6 +114,29 @@ class TestIntegerField:
         with pytest.raises(FieldValueError):
             field.parse(value)
 
+    def test_positional_arguments(self):
+        field = IntField('PORT', False, 80, 'Port', 1, 10)
+
+        assert (field.name, field.default, field.description) == ('PORT', 80, 'Port')
+        with pytest.raises(FieldValueError):
+            field.parse('11')
+
+
+class TestRawDefault:
+    @pytest.mark.parametrize('field_type,default', [
+        (UrlField, 'https://example.com'),
+        (RouteField, '/webhook'),
+        (IpField, '10.0.0.1'),
+        (RegexField, 'a+'),
+        (RegexListField, ['a', 'b']),
+        (CpuCountField, 'auto'),
+    ])
+    def test_factory_conflict(self, field_type, default):
+        assert field_type(default=default).default_factory is not None
+
+        with pytest.raises(ValueError):
+            field_type(default=default, default_factory=lambda: None)
+
 
 class TestFloatField:
     @pytest.mark.parametrize('field,value,expected', [
@@ -969,3 +997,727 @@ class TestDictField:
             actual_value = actual[key]
             assert isinstance(actual_value, type(expected_value))
             assert actual_value == expected_value
+
+
+class TestRegexField:
+    @pytest.mark.parametrize('field,value,string', [
+        (
+            RegexField(),
+            r'^foo\d+$',
+            'foo123',
+        ),
+        (
+            RegexField(flags=re.IGNORECASE),
+            'bar',
+            'BAR',
+        ),
+    ])
+    def test_valid_parse(self, field: RegexField, value, string):
+        actual = field.parse(value)
+        assert isinstance(actual, re.Pattern)
+        assert actual.search(string)
+
+    def test_compiled_once(self):
+        field = RegexField()
+        assert field.parse('spam|eggs') is field.parse('spam|eggs')
+        assert RegexField(flags=re.I).parse('spam|eggs') is not field.parse('spam|eggs')
+
+    @pytest.mark.parametrize('field,value', [
+        (
+            RegexField(),
+            '(foo',
+        ),
+        (
+            RegexField(),
+            None,
+        ),
+    ])
+    def test_invalid_parse(self, field: RegexField, value):
+        with pytest.raises(FieldValueError):
+            field.parse(value)
+
+
+class TestRegexListField:
+    @pytest.mark.parametrize('field,value,string,expected', [
+        (
+            RegexListField(),
+            r'foo\d+,bar,spam',
+            'xx bar foo1',
+            1,
+        ),
+        (
+            RegexListField(separator=';'),
+            r'a{1,3}b;(?P<name>c)d',
+            'zcd',
+            1,
+        ),
+        (
+            RegexListField(),
+            r'(a)\1,b',
+            'xaa',
+            0,
+        ),
+        (
+            RegexListField(),
+            r'foo,bar',
+            'eggs',
+            None,
+        ),
+    ])
+    def test_search(self, field: RegexListField, value, string, expected):
+        patterns = field.parse(value)
+        actual = patterns.search(string)
+
+        if expected is None:
+            assert actual is None
+        else:
+            assert actual is patterns.patterns[expected]
+
+    def test_combined(self):
+        patterns = RegexListField().parse(','.join(f"item{i}$" for i in range(500)))
+        assert len(patterns) == 500
+        assert patterns.combined is not None
+        assert patterns.fullmatch('item321') is patterns.patterns[321]
+        assert patterns.match('item') is None
+
+    def test_invalid_parse(self):
+        with pytest.raises(FieldValueError):
+            RegexListField().parse('foo,(bar')
+
+    def test_parse_file(self, tmp_path):
+        path = tmp_path / 'patterns'
+        path.write_text('foo\\d+\n\na{1,3}b\r\n')
+
+        with path.open() as fd:
+            patterns = RegexListField().parse_file(fd)
+
+        assert [pattern.pattern for pattern in patterns] == [r'foo\d+', 'a{1,3}b']
+        assert patterns.search('xaab') is patterns.patterns[1]
+
+    def test_pattern_cache_bounded(self):
+        maxsize = compile_pattern.cache_info().maxsize
+
+        for i in range(maxsize + 10):
+            RegexListField().parse(f'foo,bar{i}')
+
+        assert maxsize is not None
+        assert compile_pattern.cache_info().currsize <= maxsize
+
+
+class TestResourceField:
+    @pytest.fixture
+    def cgroup_v2(self, tmp_path):
+        (tmp_path / 'cpu.max').write_text('300000 100000\n')
+        (tmp_path / 'memory.max').write_text(f'{2**30}\n')
+        return tmp_path
+
+    @pytest.fixture
+    def cgroup_v1(self, tmp_path):
+        (tmp_path / 'cpu').mkdir()
+        (tmp_path / 'cpu' / 'cpu.cfs_quota_us').write_text('150000\n')
+        (tmp_path / 'cpu' / 'cpu.cfs_period_us').write_text('100000\n')
+        (tmp_path / 'memory').mkdir()
+        (tmp_path / 'memory' / 'memory.limit_in_bytes').write_text(f'{2**29}\n')
+        return tmp_path
+
+    @pytest.fixture(autouse=True)
+    def affinity(self, monkeypatch):
+        monkeypatch.setattr('os.sched_getaffinity', lambda pid: set(range(8)), raising=False)
+
+    @pytest.mark.parametrize('value,expected', [
+        ('auto', 3),
+        ('auto*2', 6),
+        ('AUTO / 2', 1),
+        ('auto/10', 1),
+        ('50%', 1),
+        ('200%', 6),
+        ('7', 7),
+        (5, 5),
+    ])
+    def test_cpu_count_v2(self, cgroup_v2, value, expected):
+        actual = CpuCountField(cgroup_root=cgroup_v2).parse(value)
+        assert isinstance(actual, int)
+        assert actual == expected
+
+    def test_cpu_count_v1(self, cgroup_v1):
+        assert CpuCountField(cgroup_root=cgroup_v1).parse('auto') == 2
+
+    def test_cpu_count_unlimited(self, tmp_path):
+        (tmp_path / 'cpu.max').write_text('max 100000\n')
+        assert CpuCountField(cgroup_root=tmp_path).parse('auto') == 8
+
+    @pytest.mark.parametrize('value,expected', [
+        ('auto', 2**30),
+        ('25%', 2**28),
+        ('auto/4', 2**28),
+        ('1024', 1024),
+    ])
+    def test_memory_limit_v2(self, cgroup_v2, value, expected):
+        assert MemoryLimitField(cgroup_root=cgroup_v2).parse(value) == expected
+
+    def test_memory_limit_literal(self, cgroup_v2):
+        field = MemoryLimitField(cgroup_root=cgroup_v2, max_value=2**30)
+        assert field.parse('512MiB') == 2**29
+
+        with pytest.raises(FieldValueError):
+            field.parse('2GiB')
+
+    def test_memory_limit_v1(self, cgroup_v1):
+        assert MemoryLimitField(cgroup_root=cgroup_v1).parse('auto') == 2**29
+
+    def test_default_expression(self, cgroup_v2):
+        field = CpuCountField(cgroup_root=cgroup_v2, default='auto*2')
+
+        assert field.default is None
+        assert field.default_factory() == 6
+
+    @pytest.mark.parametrize('field,value', [
+        (
+            CpuCountField(max_value=4),
+            'auto*2',
+        ),
+        (
+            CpuCountField(min_value=2),
+            'auto/3',
+        ),
+        (
+            CpuCountField(),
+            'auto/0',
+        ),
+        (
+            CpuCountField(),
+            'auto+1',
+        ),
+        (
+            MemoryLimitField(),
+            'half',
+        ),
+    ])
+    def test_invalid_parse(self, cgroup_v2, field, value):
+        field.cgroup_root = cgroup_v2
+        with pytest.raises(FieldValueError):
+            field.parse(value)
+
+
+class TestByteSizeField:
+    @pytest.mark.parametrize('field,value,expected', [
+        (
+            ByteSizeField(),
+            '64MiB',
+            64 * 2**20,
+        ),
+        (
+            ByteSizeField(),
+            '64 mb',
+            64 * 10**6,
+        ),
+        (
+            ByteSizeField(),
+            '1.5Ki',
+            1536,
+        ),
+        (
+            ByteSizeField(),
+            '512',
+            512,
+        ),
+        (
+            ByteSizeField(),
+            4096,
+            4096,
+        ),
+        (
+            ByteSizeField(),
+            '18446744073709551617B',
+            2**64 + 1,
+        ),
+        (
+            ByteSizeField(min_value='1KiB', max_value='1GiB'),
+            '1G',
+            10**9,
+        ),
+    ])
+    def test_valid_parse(self, field: ByteSizeField, value, expected: int):
+        actual = field.parse(value)
+        assert isinstance(actual, int)
+        assert actual == expected
+
+    @pytest.mark.parametrize('field,value', [
+        (
+            ByteSizeField(),
+            '12 parsecs',
+        ),
+        (
+            ByteSizeField(),
+            '0.5B',
+        ),
+        (
+            ByteSizeField(),
+            None,
+        ),
+        (
+            ByteSizeField(),
+            '-1KiB',
+        ),
+        (
+            ByteSizeField(max_value='1MiB'),
+            '2MiB',
+        ),
+        (
+            ByteSizeField(min_value='1KiB'),
+            '1000',
+        ),
+    ])
+    def test_invalid_parse(self, field: ByteSizeField, value):
+        with pytest.raises(FieldValueError):
+            field.parse(value)
+
+    def test_list(self):
+        field = ListField(ByteSizeField())
+        assert field.parse('1KiB,2k,3') == [1024, 2000, 3]
+
+
+class TestDurationField:
+    @pytest.mark.parametrize('field,value,expected', [
+        (
+            DurationField(),
+            '250ms',
+            0.25,
+        ),
+        (
+            DurationField(),
+            '1h30m',
+            5400.0,
+        ),
+        (
+            DurationField(),
+            '2 d',
+            172800.0,
+        ),
+        (
+            DurationField(),
+            '15',
+            15.0,
+        ),
+        (
+            DurationField(unit='ms'),
+            1500,
+            1.5,
+        ),
+        (
+            DurationField(unit='ms'),
+            '10s',
+            10.0,
+        ),
+        (
+            DurationField(min_value='1s', max_value='1m'),
+            '30s',
+            30.0,
+        ),
+    ])
+    def test_valid_parse(self, field: DurationField, value, expected: float):
+        actual = field.parse(value)
+        assert isinstance(actual, float)
+        assert actual == pytest.approx(expected)
+
+    def test_timedelta(self):
+        field = DurationField(as_timedelta=True, default='5m', max_value=timedelta(hours=1))
+        assert field.default == timedelta(minutes=5)
+        assert field.parse('1500ms') == timedelta(seconds=1.5)
+        assert field.return_type is timedelta
+
+        with pytest.raises(FieldValueError):
+            field.parse('2h')
+
+    @pytest.mark.parametrize('field,value', [
+        (
+            DurationField(),
+            'soon',
+        ),
+        (
+            DurationField(),
+            '1 2',
+        ),
+        (
+            DurationField(),
+            '5 fortnights',
+        ),
+        (
+            DurationField(),
+            '1h!30m',
+        ),
+        (
+            DurationField(),
+            '1h30',
+        ),
+        (
+            DurationField(),
+            None,
+        ),
+        (
+            DurationField(max_value=60),
+            '2m',
+        ),
+    ])
+    def test_invalid_parse(self, field: DurationField, value):
+        with pytest.raises(FieldValueError):
+            field.parse(value)
+
+    def test_long_invalid_value(self):
+        started = time.perf_counter()
+
+        with pytest.raises(FieldValueError):
+            DurationField().parse('1' * 5000 + '!')
+
+        assert time.perf_counter() - started < 1
+
+
+class TestBytesField:
+    KEY = bytes(range(32))
+
+    @pytest.mark.parametrize('field,value', [
+        (
+            BytesField(),
+            base64.b64encode(KEY).decode(),
+        ),
+        (
+            BytesField(encoding=BytesField.Encoding.URLSAFE_BASE64),
+            base64.urlsafe_b64encode(KEY).decode().rstrip('='),
+        ),
+        (
+            BytesField(encoding=BytesField.Encoding.HEX, length=32),
+            KEY.hex(),
+        ),
+        (
+            BytesField(length=32),
+            '\n'.join(base64.encodebytes(KEY).decode().split()),
+        ),
+    ])
+    def test_valid_parse(self, field: BytesField, value):
+        actual = field.parse(value)
+        assert isinstance(actual, bytes)
+        assert actual == self.KEY
+
+    @pytest.mark.parametrize('encoding,encode', [
+        (BytesField.Encoding.BASE64, lambda v: base64.b64encode(v).decode()),
+        (BytesField.Encoding.URLSAFE_BASE64, lambda v: base64.urlsafe_b64encode(v).decode()),
+        (BytesField.Encoding.HEX, lambda v: v.hex()),
+    ])
+    def test_lazy_parse(self, encoding, encode):
+        field = BytesField(encoding=encoding, lazy=True, length=len(self.KEY))
+        actual = field.parse(encode(self.KEY))
+
+        assert isinstance(actual, LazyBytes)
+        assert not actual.decoded
+        assert len(actual) == len(self.KEY)
+        assert 'bytes' in str(actual) and encode(self.KEY) not in str(actual)
+
+        assert actual.bytes is actual.bytes
+        assert actual == self.KEY
+        assert actual.view.readonly
+        assert bytes(actual.view[:4]) == self.KEY[:4]
+
+    @pytest.mark.parametrize('field,value', [
+        (
+            BytesField(),
+            'not base64!',
+        ),
+        (
+            BytesField(),
+            'QUJD-_',
+        ),
+        (
+            BytesField(encoding=BytesField.Encoding.HEX),
+            'abc',
+        ),
+        (
+            BytesField(lazy=True),
+            'A===',
+        ),
+        (
+            BytesField(length=16),
+            base64.b64encode(KEY).decode(),
+        ),
+        (
+            BytesField(lazy=True, length=16),
+            base64.b64encode(KEY).decode(),
+        ),
+        (
+            BytesField(),
+            None,
+        ),
+    ])
+    def test_invalid_parse(self, field: BytesField, value):
+        with pytest.raises(FieldValueError):
+            field.parse(value)
+
+
+class TestFieldCreateParser:
+    @pytest.mark.parametrize('field,value,expected', [
+        (IntField(), 2**63 + 1, 2**63 + 1),
+        (IntField(), True, 1),
+        (NumField(), 2**63 + 1, 2**63 + 1),
+        (ListField(NumField()), [1, 2.0, 2.5, True], [1, 2, 2.5, 1]),
+        (NumField(), 2.0, 2),
+        (NumField(), 2.5, 2.5),
+        (FloatField(), 2.5, 2.5),
+        (StrField(), 'abc', 'abc'),
+        (StrField(modifyer=StrField.Modifyer.UPPER), 'abc', 'ABC'),
+        (ListField(IntField()), [1, '2', 3], [1, 2, 3]),
+        (DictField(StrField(), IntField()), {'a': 1, 'b': '2'}, {'a': 1, 'b': 2}),
+        (ByteSizeField(), 1024, 1024),
+        (CpuCountField(), 4, 4),
+    ])
+    def test_typed_value(self, field, value, expected):
+        clean_value = field.create_parser(type(value))(value)
+
+        assert clean_value == expected
+        assert type(clean_value) is type(expected)
+        assert clean_value == field.parse(value)
+
+    @pytest.mark.parametrize('field,value', [
+        (IntField(max_value=10), 11),
+        (NumField(min_value=0), -0.5),
+        (FloatField(max_value=1.0), 1.5),
+        (ListField(IntField(min_value=0)), [0, -1]),
+        (DictField(StrField(), IntField(max_value=0)), {'a': 1}),
+        (ByteSizeField(), 1.5),
+    ])
+    def test_typed_value_invalid(self, field, value):
+        with pytest.raises(FieldValueError):
+            field.create_parser(type(value))(value)
+
+    def test_num_large_int_str(self):
+        assert NumField().parse(str(2**63 + 1)) == 2**63 + 1
+        assert NumField().parse('1e3') == 1000
+
+
+class TestCoercionRegistry:
+    class Celsius(float):
+        pass
+
+    @pytest.fixture
+    def registry(self):
+        return CoercionRegistry()
+
+    def test_resolve_mro(self, registry):
+        registry.register(float, str, repr)
+
+        assert registry.resolve(self.Celsius, str) is repr
+        assert registry.resolve(self.Celsius, str) is registry.resolve(self.Celsius, str)
+
+    def test_resolve_abstract(self, registry):
+        registry.register(object, list, list)
+        registry.register(Iterator, list, tuple)
+
+        assert registry.resolve(type(iter([])), list) is tuple
+        assert registry.resolve(int, list) is list
+
+    def test_register_invalidates(self, registry):
+        registry.register(object, int, int)
+        assert registry.resolve(bool, int) is int
+
+        registry.register(bool, int, float)
+        assert registry.resolve(bool, int) is float
+
+    def test_missing(self, registry):
+        with pytest.raises(TypeError):
+            registry.coerce('1', int)
+
+    @pytest.mark.parametrize('value,target_type,expected', [
+        ('12', int, 12),
+        (True, int, 1),
+        ('12', float, 12.0),
+        ('12', Num, 12),
+        ('1.5', Num, 1.5),
+        (2.0, Num, 2),
+        (str(2**63 + 1), Num, 2**63 + 1),
+        (12, str, '12'),
+        ((1, 2), list, (1, 2)),
+    ])
+    def test_builtin(self, value, target_type, expected):
+        clean_value = coerce(value, target_type)
+
+        assert clean_value == expected
+        assert type(clean_value) is type(expected)
+
+    def test_field_custom_type(self, monkeypatch):
+        from decimal import Decimal
+
+        monkeypatch.setattr(COERCIONS, '_CoercionRegistry__resolved', {})
+        monkeypatch.setattr(COERCIONS, '_CoercionRegistry__coercions', dict(COERCIONS._CoercionRegistry__coercions))
+        register_coercion(Decimal, float, lambda value: float(value.quantize(Decimal('0.01'))))
+
+        assert FloatField().parse(Decimal('1.005')) == 1.0
+        assert ListField(FloatField()).parse([Decimal('0.5')]) == [0.5]
+
+    def test_register_after_parse(self, monkeypatch):
+        from decimal import Decimal
+        from configoo import model
+
+        monkeypatch.setattr(COERCIONS, '_CoercionRegistry__resolved', {})
+        monkeypatch.setattr(COERCIONS, '_CoercionRegistry__coercions', dict(COERCIONS._CoercionRegistry__coercions))
+
+        class Config(model.Model):
+            RATIO = FloatField()
+            RATIOS = ListField(FloatField())
+
+        definitions = dict(Config.iter_fields())
+        value = Decimal('1.005')
+
+        assert definitions['RATIO'].get_parser(Decimal)(value) == 1.005
+        assert definitions['RATIOS'].get_parser(list)([value]) == [1.005]
+
+        register_coercion(Decimal, float, lambda value: float(value.quantize(Decimal('0.01'))))
+
+        assert definitions['RATIO'].get_parser(Decimal)(value) == 1.0
+        assert definitions['RATIOS'].get_parser(list)([value]) == [1.0]
+
+
+class TestCanonicalEncoding:
+    class Color(enum.Enum):
+        RED = 'red'
+
+    @pytest.mark.parametrize('value', [
+        UrlField().parse('https://example.com/a?b=1'),
+        IpField().parse('10.0.0.1'),
+        IpField().parse('::1'),
+        _Path('/tmp/a'),
+        timedelta(seconds=90),
+        RegexField().parse('^a+$'),
+        RegexListField().parse('a,b'),
+        BytesField(lazy=True).parse('YWJj'),
+        Color.RED,
+    ])
+    def test_field_types(self, value):
+        encoded = encode_canonical(value)
+
+        assert isinstance(encoded, bytes)
+        assert encoded != encode_canonical(str(value))
+
+    @pytest.mark.parametrize('first,second', [
+        (1, True),
+        (1, 1.0),
+        ('1', 1),
+        (['a', 'b'], ['ab']),
+        ({'a': 1}, {'a': '1'}),
+    ])
+    def test_distinct(self, first, second):
+        assert encode_canonical(first) != encode_canonical(second)
+
+    def test_container_order(self):
+        assert encode_canonical({'a': 1, 'b': 2}) == encode_canonical({'b': 2, 'a': 1})
+        assert encode_canonical([1, 2]) == encode_canonical((1, 2))
+        assert encode_canonical([1, 2]) != encode_canonical([2, 1])
+        assert encode_canonical(BytesField(lazy=True).parse('YWJj')) == encode_canonical(b'abc')
+
+    def test_unsupported(self):
+        with pytest.raises(TypeError):
+            encode_canonical(object())
+
+
+class TestFieldMerge:
+    @pytest.mark.parametrize('merge,base,override,expected', [
+        (Field.Merge.REPLACE, {'a': 1}, {'b': 2}, {'b': 2}),
+        (Field.Merge.APPEND, [1, 2], [3], [1, 2, 3]),
+        (Field.Merge.APPEND, {'a': {'x': 1}}, {'a': {'y': 2}}, {'a': {'y': 2}}),
+        (Field.Merge.DEEP_MERGE, {'a': {'x': 1}, 'b': 1}, {'a': {'y': 2}}, {'a': {'x': 1, 'y': 2}, 'b': 1}),
+        (Field.Merge.DEEP_MERGE, {'a': [1]}, {'a': [2]}, {'a': [2]}),
+        (Field.Merge.DEEP_MERGE, None, {'a': 1}, {'a': 1}),
+    ])
+    def test_apply(self, merge, base, override, expected):
+        assert merge.apply(base, override) == expected
+
+    def test_deep_merge_sharing(self):
+        base = {'a': {'x': [1, 2]}, 'b': {'y': 1}}
+        merged = Field.Merge.DEEP_MERGE.apply(base, {'b': {'z': 2}})
+
+        assert merged['a'] is base['a']
+        assert merged['b'] == {'y': 1, 'z': 2}
+        assert base['b'] == {'y': 1}
+
+
+class TestFrozenContainers:
+    class Config:
+        pass
+
+    def test_list(self):
+        field = ListField(IntField(), frozen=True)
+
+        assert field.parse('1,2') == (1, 2)
+        assert field.create_parser(list)([1, 2]) == (1, 2)
+
+    def test_dict(self):
+        field = DictField(StrField(), IntField(), frozen=True)
+        value = field.parse({'a': '1'})
+
+        assert value == {'a': 1}
+        with pytest.raises(TypeError):
+            value['b'] = 2
+
+    @pytest.mark.parametrize('field,expected', [
+        (ListField(IntField(), default=[1, 2], frozen=True), (1, 2)),
+        (DictField(StrField(), IntField(), default={'a': 1}, frozen=True), {'a': 1}),
+    ])
+    def test_shared_default(self, field, expected):
+        definition = field.define(self.Config)
+
+        assert definition.default == expected
+        assert definition.default is definition.default
+
+    def test_mutable_default_copied(self):
+        definition = ListField(IntField(), default=[1]).define(self.Config)
+
+        assert definition.default == [1]
+        assert definition.default is not definition.default
+
+    def test_merge_keeps_frozen(self):
+        definition = DictField(StrField(), IntField(), frozen=True, merge=Field.Merge.DEEP_MERGE).define(self.Config)
+        merged = definition.merge_values(definition.parser({'a': 1}), definition.parser({'b': 2}))
+
+        assert merged == {'a': 1, 'b': 2}
+        with pytest.raises(TypeError):
+            merged['c'] = 3
+
+
+class TestDefaultFactory:
+    class Config:
+        pass
+
+    def test_called_once(self):
+        calls = []
+
+        def factory():
+            calls.append(1)
+            return {'a': 1}
+
+        definition = DictField(StrField(), IntField(), name='LIMITS', default_factory=factory).define(self.Config)
+        assert not calls
+
+        assert definition.default == {'a': 1}
+        assert definition.default == {'a': 1}
+        assert definition.prefixed('X_').default == {'a': 1}
+        assert len(calls) == 1
+
+    def test_frozen(self):
+        definition = ListField(IntField(), default_factory=lambda: [1, 2], frozen=True).define(self.Config)
+
+        assert definition.default == (1, 2)
+        assert definition.default is definition.default
+
+    @pytest.mark.parametrize('field', [
+        UrlField(name='URL', default='http://localhost/'),
+        IpField(name='IP', default='127.0.0.1'),
+        RegexField(name='PATTERN', default='a+'),
+    ])
+    def test_lazy_parsed_default(self, field):
+        assert field.default is None
+        assert field.define(self.Config).default == field.default_factory()
+
+    @pytest.mark.parametrize('kwargs', [
+        {'required': True, 'default_factory': dict},
+        {'default': {}, 'default_factory': dict},
+    ])
+    def test_invalid(self, kwargs):
+        with pytest.raises(ValueError):
+            DictField(StrField(), StrField(), **kwargs).define(self.Config)
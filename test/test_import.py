@@ -0,0 +1,98 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import configoo
+from configoo import field, loader, model
+
+
+SOURCE_DIR = Path(configoo.__file__).resolve().parent.parent
+
+HEAVY_MODULES = (
+    'json',
+    'logging',
+    'ipaddress',
+    'inspect',
+    'pathlib',
+    'urllib.parse',
+    'concurrent.futures',
+)
+
+
+def import_modules(code: str):
+    # A fresh interpreter, the test process has imported everything already.
+    env = dict(os.environ, PYTHONPATH=str(SOURCE_DIR))
+    result = subprocess.run(
+        [sys.executable, '-c', f'{code}; import sys; print(*sys.modules, sep="\\n")'],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    return set(result.stdout.split())
+
+
+class TestLazyImport:
+    def test_import_package(self):
+        modules = import_modules('import configoo')
+
+        assert sorted(name for name in modules if name.startswith('configoo')) == [
+            'configoo',
+            'configoo._lazy',
+            'configoo.exception',
+            'configoo.field',
+            'configoo.loader',
+            'configoo.model',
+        ]
+        assert not modules.intersection(HEAVY_MODULES)
+
+    def test_import_env_usage(self):
+        modules = import_modules('import configoo; configoo.IntField; configoo.load_from_env')
+
+        assert 'configoo.field.int_field' in modules
+        assert 'configoo.loader.env' in modules
+        assert 'configoo.loader.json' not in modules
+        assert 'configoo.field.url' not in modules
+        assert not modules.intersection(HEAVY_MODULES)
+
+    def test_star_import(self):
+        # Shared memory is imported on use only, it is not available on every supported Python.
+        modules = import_modules('from configoo import *')
+
+        assert 'configoo.prefork' in modules
+        assert 'multiprocessing.shared_memory' not in modules
+
+    @pytest.mark.parametrize('package', [configoo, field, model, loader])
+    def test_exports(self, package):
+        for name in package.__all__:
+            assert getattr(package, name) is not None
+
+        assert set(package.__all__) <= set(dir(package))
+
+    @pytest.mark.parametrize('package', [field, model, loader])
+    def test_exports_match_modules(self, package):
+        modules = {
+            getattr(package, name).__module__
+            for name in package.__all__
+            if hasattr(getattr(package, name), '__module__')
+        }
+
+        expected = {
+            name
+            for module in modules
+            for name in sys.modules[module].__all__
+        }
+
+        assert set(package.__all__) == expected
+
+    def test_submodule_attribute(self):
+        assert configoo.utils.load_from_env is configoo.load_from_env
+        assert field.list_field.ListField is field.ListField
+
+    def test_unknown_attribute(self):
+        with pytest.raises(AttributeError):
+            configoo.UnknownField
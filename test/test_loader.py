@@ -1,10 +1,16 @@
 import pytest
 
+import gc
+import os
+import json
 import logging
+import weakref
 from enum import Enum
 from pathlib import Path
 
 from configoo import field, model, loader
+from configoo.exception import LoaderError
+from configoo.utils import load_from_directory, load_from_json, load_from_json_directory, load_rewriting, load_appending
 
 
 class Config(model.Model):
@@ -118,3 +124,606 @@ class TestDotenvLoader:
         assert config.LOG_LEVEL == logging.INFO
         assert config.LOG_PATH.absolute() == self.RESOURCES
         assert config.SCHEMA == {'FOO': 'bar', 'SPAM': 'eggs'}
+
+
+class TestFileReference:
+    class Config(model.Model):
+        TOKEN = field.StrField(required=True)
+        HOSTS = field.ListField(field.StrField(), required=True)
+        LIMITS = field.DictField(field.StrField(), field.IntField())
+        PORT = field.PortField()
+        EMAIL = field.StrField()
+
+    @pytest.fixture
+    def envs(self, monkeypatch, tmp_path):
+        (tmp_path / 'token').write_text('s3cr3t\n')
+        (tmp_path / 'hosts').write_text('a.example\nb.example\n\nc.example\n')
+        (tmp_path / 'limits').write_text('foo:1\nbar:2\n')
+
+        envs = {
+            'TOKEN': f'@{tmp_path / "token"}',
+            'HOSTS': f'@{tmp_path / "hosts"}',
+            'LIMITS': f'@{tmp_path / "limits"}',
+            'PORT': '8080',
+            'EMAIL': '@@admin',
+        }
+
+        def getenv(name: str, default=None):
+            return envs.get(name, default)
+
+        monkeypatch.setattr('configoo.loader.env.getenv', getenv)
+
+        return envs
+
+    def test_resolved(self, envs):
+        l = loader.EnvLoader(
+            driver=loader.EnvLoaderDriver(file_reference_prefix='@'),
+        )
+
+        config = l.load_model(self.Config)
+
+        assert config.TOKEN == 's3cr3t'
+        assert config.HOSTS == ['a.example', 'b.example', 'c.example']
+        assert config.LIMITS == {'foo': 1, 'bar': 2}
+        assert config.PORT == 8080
+        assert config.EMAIL == '@admin'
+
+    def test_disabled(self, envs):
+        del envs['LIMITS']
+
+        config = loader.EnvLoader(driver=loader.EnvLoaderDriver()).load_model(self.Config)
+
+        assert config.TOKEN == envs['TOKEN']
+
+    def test_missing_file(self, envs, tmp_path):
+        envs['TOKEN'] = f'@{tmp_path / "missing"}'
+
+        l = loader.EnvLoader(
+            driver=loader.EnvLoaderDriver(file_reference_prefix='@'),
+        )
+
+        with pytest.raises(LoaderError):
+            l.load_model(self.Config)
+
+    @pytest.mark.parametrize('key', ['TOKEN', 'HOSTS'])
+    def test_invalid_utf8_file(self, envs, tmp_path, key):
+        (tmp_path / 'invalid').write_bytes(b'a.example\n\xff\xfe\n')
+        envs[key] = f'@{tmp_path / "invalid"}'
+
+        l = loader.EnvLoader(
+            driver=loader.EnvLoaderDriver(file_reference_prefix='@'),
+        )
+
+        with pytest.raises(LoaderError):
+            l.load_model(self.Config)
+
+
+class TestDirectoryLoader:
+    class Config(model.Model):
+        TOKEN = field.StrField(required=True)
+        HOSTS = field.ListField(field.StrField())
+        PORT = field.PortField(default=8000)
+
+    @staticmethod
+    def write_generation(root: Path, name: str, files: dict) -> None:
+        generation = root / name
+        generation.mkdir()
+
+        for key, value in files.items():
+            (generation / key).write_text(value)
+
+        link = root / '..data_tmp'
+        link.symlink_to(name)
+        link.replace(root / '..data')
+
+        for key in files:
+            if not (root / key).is_symlink():
+                (root / key).symlink_to(Path('..data') / key)
+
+    def test_plain_directory(self, tmp_path):
+        (tmp_path / 'TOKEN').write_text('s3cr3t\n')
+        (tmp_path / 'HOSTS').write_text('a\nb\n')
+        (tmp_path / 'UNRELATED').write_text('ignored')
+
+        config = load_from_directory(self.Config, tmp_path)
+
+        assert config.TOKEN == 's3cr3t'
+        assert config.HOSTS == ['a', 'b']
+        assert config.PORT == 8000
+
+    def test_kubernetes_generations(self, tmp_path):
+        self.write_generation(tmp_path, '..gen1', {'TOKEN': 'one', 'PORT': '8001'})
+        l = loader.DirectoryLoader(driver=loader.DirectoryLoaderDriver())
+
+        config = l.load_model(self.Config, tmp_path)
+        assert (config.TOKEN, config.PORT) == ('one', 8001)
+
+        self.write_generation(tmp_path, '..gen2', {'TOKEN': 'two', 'PORT': '8002'})
+
+        context = l.driver.create_context(self.Config, tmp_path)
+        l.driver.start_loading(context)
+        assert all(path.parent.name == '..gen2' for path in context.index.values())
+
+        config = l.load_model(self.Config, tmp_path)
+        assert (config.TOKEN, config.PORT) == ('two', 8002)
+
+    def test_required(self, tmp_path):
+        with pytest.raises(LoaderError):
+            load_from_directory(self.Config, tmp_path)
+
+
+class TestJsonDirectoryLoader:
+    class Config(model.Model):
+        NAME = field.StrField(required=True)
+        PORT = field.PortField(default=8000)
+        HOSTS = field.ListField(field.StrField())
+
+    @staticmethod
+    def write(path: Path, data: dict, mtime_ns: int) -> None:
+        path.write_text(json.dumps(data))
+        os.utime(path, ns=(mtime_ns, mtime_ns))
+
+    def test_merged_in_order(self, tmp_path):
+        self.write(tmp_path / '10-base.json', {'NAME': 'base', 'PORT': 1000}, 10**18)
+        self.write(tmp_path / '20-hosts.json', {'HOSTS': ['a', 'b']}, 10**18)
+        self.write(tmp_path / '90-override.json', {'PORT': 9000}, 10**18)
+        (tmp_path / 'README.txt').write_text('not a fragment')
+
+        config = load_from_json_directory(
+            self.Config,
+            tmp_path,
+            driver=loader.JsonDirectoryLoaderDriver(max_workers=2),
+        )
+
+        assert config.NAME == 'base'
+        assert config.PORT == 9000
+        assert config.HOSTS == ['a', 'b']
+
+    def test_reload_parses_changed_fragments(self, tmp_path, monkeypatch):
+        self.write(tmp_path / '10-base.json', {'NAME': 'base', 'PORT': 1000}, 10**18)
+        self.write(tmp_path / '20-hosts.json', {'HOSTS': ['a']}, 10**18)
+
+        driver = loader.JsonDirectoryLoaderDriver()
+        l = loader.JsonDirectoryLoader(driver=driver)
+        parsed = []
+
+        def parse_fragment(path, parse=driver.parse_json_file):
+            parsed.append(path)
+            return parse(path)
+
+        monkeypatch.setattr(driver, 'parse_json_file', parse_fragment)
+
+        assert l.load_model(self.Config, tmp_path).HOSTS == ['a']
+        assert len(parsed) == 2
+
+        assert l.load_model(self.Config, tmp_path).HOSTS == ['a']
+        assert len(parsed) == 2
+
+        self.write(tmp_path / '20-hosts.json', {'HOSTS': ['a', 'c']}, 2 * 10**18)
+
+        config = l.load_model(self.Config, tmp_path)
+        assert config.HOSTS == ['a', 'c']
+        assert config.NAME == 'base'
+        assert parsed[-1] == tmp_path / '20-hosts.json'
+        assert len(parsed) == 3
+
+        (tmp_path / '20-hosts.json').unlink()
+
+        config = l.load_model(self.Config, tmp_path)
+        assert config.HOSTS is None
+        assert len(parsed) == 3
+
+    def test_relative_directory_parsed_once(self, tmp_path, monkeypatch):
+        directory = tmp_path / 'conf.d'
+        directory.mkdir()
+        self.write(directory / '10-base.json', {'NAME': 'base'}, 10**18)
+        self.write(directory / '20-port.json', {'PORT': 9000}, 10**18)
+        self.write(directory / '30-hosts.json', {'HOSTS': ['a']}, 10**18)
+        monkeypatch.chdir(tmp_path)
+
+        driver = loader.JsonDirectoryLoaderDriver(max_workers=2)
+        parsed = []
+
+        def parse_fragment(path, parse=driver.parse_json_file):
+            parsed.append(path)
+            return parse(path)
+
+        monkeypatch.setattr(driver, 'parse_json_file', parse_fragment)
+
+        config = load_from_json_directory(self.Config, Path('conf.d'), driver=driver)
+
+        assert (config.NAME, config.PORT, config.HOSTS) == ('base', 9000, ['a'])
+        assert len(parsed) == 3
+
+    def test_cached_data_copied(self, tmp_path):
+        self.write(tmp_path / '10-base.json', {'NAME': 'base', 'HOSTS': ['a']}, 10**18)
+
+        driver = loader.JsonDirectoryLoaderDriver()
+
+        for _ in range(2):
+            context = driver.create_context(self.Config, tmp_path)
+            driver.start_loading(context)
+
+            assert context.data == context.document == {'NAME': 'base', 'HOSTS': ['a']}
+            assert context.data['HOSTS'] is not context.document['HOSTS']
+
+            context.data['NAME'] = 'changed'
+            context.data['HOSTS'].append('b')
+
+        config = load_from_json_directory(self.Config, tmp_path, driver=driver)
+        assert (config.NAME, config.HOSTS) == ('base', ['a'])
+
+    def test_cache_size(self, tmp_path, monkeypatch):
+        for name in ('a', 'b', 'c'):
+            self.write(tmp_path / f'{name}.json', {'NAME': name}, 10**18)
+
+        parsed = []
+
+        def create_driver(cache_size):
+            driver = loader.JsonLoaderDriver(cache_size=cache_size)
+
+            def parse_fragment(path, parse=driver.parse_json_file):
+                parsed.append(path.stem)
+                return parse(path)
+
+            monkeypatch.setattr(driver, 'parse_json_file', parse_fragment)
+            return driver
+
+        def load(driver, name):
+            return load_from_json(self.Config, tmp_path / f'{name}.json', driver=driver).NAME
+
+        driver = create_driver(2)
+
+        for name in ('a', 'b', 'a', 'c', 'a', 'b'):
+            assert load(driver, name) == name
+
+        assert parsed == ['a', 'b', 'c', 'b']
+
+        uncached = create_driver(0)
+
+        for _ in range(2):
+            load(uncached, 'a')
+
+        assert parsed[4:] == ['a', 'a']
+
+    @pytest.mark.parametrize('cache_size', [0, 2])
+    @pytest.mark.parametrize('max_workers', [1, 2])
+    def test_fragments_parsed_once(self, tmp_path, monkeypatch, cache_size, max_workers):
+        for i in range(5):
+            self.write(tmp_path / f'{i}0-fragment.json', {'NAME': 'base', 'PORT': 1000 + i}, 10**18)
+
+        driver = loader.JsonDirectoryLoaderDriver(max_workers=max_workers, cache_size=cache_size)
+        parsed = []
+
+        def parse_fragment(path, parse=driver.parse_json_file):
+            parsed.append(path)
+            return parse(path)
+
+        monkeypatch.setattr(driver, 'parse_json_file', parse_fragment)
+
+        assert load_from_json_directory(self.Config, tmp_path, driver=driver).PORT == 1004
+        assert len(parsed) == 5
+
+    def test_invalid_fragment(self, tmp_path):
+        self.write(tmp_path / '10-base.json', ['NAME'], 10**18)
+
+        with pytest.raises(LoaderError):
+            load_from_json_directory(self.Config, tmp_path)
+
+
+class TestJsonInclude:
+    class Service(model.Model):
+        NAME = field.StrField(required=True)
+        LOG_LEVEL = field.LoggingLevelField()
+        POOL_SIZE = field.IntField()
+
+    class Worker(model.Model):
+        LOG_LEVEL = field.LoggingLevelField()
+        POOL_SIZE = field.IntField()
+
+    @pytest.fixture
+    def driver(self, monkeypatch):
+        driver = loader.JsonLoaderDriver()
+        driver.parsed = []
+
+        def parse_json_file(path, parse=driver.parse_json_file):
+            driver.parsed.append(path.name)
+            return parse(path)
+
+        monkeypatch.setattr(driver, 'parse_json_file', parse_json_file)
+
+        return driver
+
+    def test_include(self, tmp_path, driver):
+        (tmp_path / 'common').mkdir()
+        (tmp_path / 'common' / 'logging.json').write_text(json.dumps({'LOG_LEVEL': 'debug', 'POOL_SIZE': 4}))
+        (tmp_path / 'common' / 'pool.json').write_text(json.dumps({'$include': 'logging.json', 'POOL_SIZE': 8}))
+        (tmp_path / 'service.json').write_text(json.dumps({
+            '$include': ['common/logging.json', 'common/pool.json'],
+            'NAME': 'api',
+            'LOG_LEVEL': 'warning',
+        }))
+        (tmp_path / 'worker.json').write_text(json.dumps({'$include': 'common/pool.json'}))
+
+        l = loader.JsonLoader(driver=driver)
+
+        service = l.load_model(self.Service, tmp_path / 'service.json')
+        assert (service.NAME, service.LOG_LEVEL, service.POOL_SIZE) == ('api', logging.WARNING, 8)
+
+        worker = l.load_model(self.Worker, tmp_path / 'worker.json')
+        assert (worker.LOG_LEVEL, worker.POOL_SIZE) == (logging.DEBUG, 8)
+
+        assert sorted(driver.parsed) == ['logging.json', 'pool.json', 'service.json', 'worker.json']
+
+        l.load_model(self.Service, tmp_path / 'service.json')
+        assert len(driver.parsed) == 4
+
+    def test_cycle(self, tmp_path, driver):
+        (tmp_path / 'a.json').write_text(json.dumps({'$include': 'b.json', 'NAME': 'a'}))
+        (tmp_path / 'b.json').write_text(json.dumps({'$include': 'a.json'}))
+
+        with pytest.raises(LoaderError):
+            loader.JsonLoader(driver=driver).load_model(self.Service, tmp_path / 'a.json')
+
+
+class TestJsonFieldPath:
+    class Config(model.Model):
+        NAME = field.StrField(required=True)
+        DB_HOST = field.StrField(path='db.host')
+        DB_POOL_MAX_SIZE = field.IntField(path='db.pool.max_size')
+        DB_POOL_TIMEOUT = field.DurationField(path='/db/pool/timeout')
+        FIRST_REPLICA = field.StrField(path='db.replicas.0')
+        ODD_KEY = field.StrField(path='/a~1b/c~0d')
+        MISSING = field.IntField(path='db.pool.missing', default=7)
+
+    def test_nested(self, tmp_path):
+        path = tmp_path / 'config.json'
+        path.write_text(json.dumps({
+            'NAME': 'api',
+            'db': {
+                'host': 'db.local',
+                'pool': {
+                    'max_size': 16,
+                    'timeout': '250ms',
+                },
+                'replicas': ['r1.local', 'r2.local'],
+            },
+            'a/b': {
+                'c~d': 'odd',
+            },
+        }))
+
+        config = loader.JsonLoader(driver=loader.JsonLoaderDriver()).load_model(self.Config, path)
+
+        assert config.NAME == 'api'
+        assert config.DB_HOST == 'db.local'
+        assert config.DB_POOL_MAX_SIZE == 16
+        assert config.DB_POOL_TIMEOUT == pytest.approx(0.25)
+        assert config.FIRST_REPLICA == 'r1.local'
+        assert config.ODD_KEY == 'odd'
+        assert config.MISSING == 7
+
+    def test_accessor(self):
+        fields = dict(self.Config.iter_fields())
+
+        assert fields['NAME'].accessor == ('NAME',)
+        assert fields['DB_POOL_MAX_SIZE'].accessor == ('db', 'pool', 'max_size')
+        assert fields['DB_POOL_TIMEOUT'].accessor == ('db', 'pool', 'timeout')
+        assert fields['ODD_KEY'].accessor == ('a/b', 'c~d')
+
+    def test_accessor_tree_released(self, tmp_path):
+        path = tmp_path / 'config.json'
+        path.write_text(json.dumps({'db': {'host': 'db.local'}}))
+        driver = loader.JsonLoaderDriver()
+
+        class Temporary(model.Model):
+            DB_HOST = field.StrField(path='db.host')
+
+        assert loader.JsonLoader(driver=driver).load_model(Temporary, path).DB_HOST == 'db.local'
+
+        reference = weakref.ref(Temporary)
+        del Temporary
+        gc.collect()
+
+        assert reference() is None
+
+    def test_path_field_key_path(self):
+        class Paths(model.Model):
+            LOG_DIR = field.DirectoryPathField(field_path='paths.log')
+
+        assert dict(Paths.iter_fields())['LOG_DIR'].accessor == ('paths', 'log')
+
+    def test_keyword_only(self):
+        with pytest.raises(TypeError):
+            field.IntField('PORT', False, None, 'Port', 1, 10, 'db.port')
+
+
+class TestJsonTypedValues:
+    class Config(model.Model):
+        ID = field.NumField()
+        PORTS = field.ListField(field.PortField())
+        LIMITS = field.DictField(field.StrField(), field.ByteSizeField())
+
+    def test_load(self, tmp_path):
+        path = tmp_path / 'config.json'
+        path.write_text(json.dumps({
+            'ID': 2**63 + 1,
+            'PORTS': [80, 443],
+            'LIMITS': {'memory': '1Ki', 'disk': 2048},
+        }))
+
+        config = loader.JsonLoader(driver=loader.JsonLoaderDriver()).load_model(self.Config, path)
+
+        assert config.ID == 2**63 + 1
+        assert config.PORTS == [80, 443]
+        assert config.LIMITS == {'memory': 1024, 'disk': 2048}
+
+    def test_parser_cache(self):
+        fields = dict(self.Config.iter_fields())
+
+        assert fields['ID'].get_parser(int) is fields['ID'].get_parser(int)
+        assert fields['PORTS'].get_parser(str)('80,443') == [80, 443]
+
+    def test_invalid(self, tmp_path):
+        path = tmp_path / 'config.json'
+        path.write_text(json.dumps({'PORTS': [80, 70000]}))
+
+        with pytest.raises(LoaderError):
+            loader.JsonLoader(driver=loader.JsonLoaderDriver()).load_model(self.Config, path)
+
+
+class TestModelField:
+    class Tls(model.Model):
+        CERT = field.StrField(required=True)
+        VERIFY = field.IntField(default=1)
+
+    class Db(model.Model):
+        HOST = field.StrField(default='localhost')
+        PORT = field.PortField(default=5432)
+
+    @pytest.fixture
+    def config_model(self):
+        class Http(model.Model):
+            PORT = field.PortField(default=80)
+            TLS = model.ModelField(self.Tls, prefix='TLS_')
+
+        class Config(model.Model):
+            NAME = field.StrField()
+            DB = model.ModelField(self.Db, prefix='DB_')
+            HTTP = model.ModelField(Http, prefix='HTTP_')
+            HTTP_COPY = model.ModelField(Http, prefix='HTTP_')
+
+        return Config
+
+    def test_env_prefix(self, monkeypatch, config_model):
+        envs = {
+            'NAME': 'api',
+            'DB_HOST': 'db.local',
+            'HTTP_PORT': '8443',
+            'HTTP_TLS_CERT': '/etc/cert.pem',
+        }
+
+        monkeypatch.setattr('configoo.loader.env.getenv', lambda name, default=None: envs.get(name, default))
+
+        config = loader.EnvLoader(driver=loader.EnvLoaderDriver()).load_model(config_model)
+        data = config._Model__data
+
+        assert not data['DB'].built
+        assert config.DB.HOST == 'db.local'
+        assert config.DB.PORT == 5432
+        assert data['DB'].built
+        assert config.DB is config.DB
+
+        assert config.HTTP.PORT == 8443
+        assert config.HTTP.TLS.CERT == '/etc/cert.pem'
+        assert config.HTTP.TLS.VERIFY == 1
+        assert config.HTTP_COPY is config.HTTP
+
+    def test_env_required(self, monkeypatch, config_model):
+        monkeypatch.setattr('configoo.loader.env.getenv', lambda name, default=None: default)
+
+        with pytest.raises(LoaderError):
+            loader.EnvLoader(driver=loader.EnvLoaderDriver()).load_model(config_model)
+
+    def test_json_path(self, tmp_path):
+        class Config(model.Model):
+            DB = model.ModelField(self.Db, path='db')
+            TLS = model.ModelField(self.Tls, path='http.tls')
+
+        path = tmp_path / 'config.json'
+        path.write_text(json.dumps({
+            'db': {'HOST': 'db.local', 'PORT': 6432},
+            'http': {'tls': {'CERT': 'cert.pem', 'VERIFY': 0}},
+        }))
+
+        config = loader.JsonLoader(driver=loader.JsonLoaderDriver()).load_model(Config, path)
+
+        assert (config.DB.HOST, config.DB.PORT) == ('db.local', 6432)
+        assert (config.TLS.CERT, config.TLS.VERIFY) == ('cert.pem', 0)
+
+    def test_parse(self):
+        db = model.ModelField(self.Db).parse({'PORT': '6000'})
+
+        assert isinstance(db, self.Db)
+        assert (db.HOST, db.PORT) == ('localhost', 6000)
+
+
+class TestLayeredMerge:
+    class Db(model.Model):
+        HOST = field.StrField(default='localhost')
+        PORT = field.IntField(default=5432)
+
+    @pytest.fixture
+    def config_model(self):
+        class Config(model.Model):
+            NAME = field.StrField(default='app')
+            LABELS = field.DictField(field.StrField(), field.StrField(), default={}, merge=field.Field.Merge.DEEP_MERGE)
+            HOSTS = field.ListField(field.StrField(), default=[], merge=field.Field.Merge.APPEND)
+            TAGS = field.ListField(field.StrField(), default=[])
+            DB = model.ModelField(self.Db, path='db', prefix='DB_')
+
+        return Config
+
+    @pytest.fixture
+    def layers(self, tmp_path, monkeypatch):
+        path = tmp_path / 'config.json'
+        path.write_text(json.dumps({
+            'NAME': 'api',
+            'LABELS': {'team': 'core', 'tier': 'backend'},
+            'HOSTS': ['a.local'],
+            'TAGS': ['x', 'y'],
+            'db': {'HOST': 'db.local', 'PORT': 6432},
+        }))
+
+        envs = {
+            'LABELS': 'tier:frontend',
+            'HOSTS': 'b.local',
+            'TAGS': 'z',
+            'DB_PORT': '7432',
+        }
+        monkeypatch.setattr('configoo.loader.env.getenv', lambda name, default=None: envs.get(name, default))
+
+        return [
+            (loader.JsonLoader(driver=loader.JsonLoaderDriver()), [path]),
+            loader.EnvLoader(driver=loader.EnvLoaderDriver()),
+        ]
+
+    def test_rewriting(self, config_model, layers):
+        config = load_rewriting(config_model, layers)
+
+        assert config.NAME == 'api'
+        assert config.LABELS == {'team': 'core', 'tier': 'frontend'}
+        assert config.HOSTS == ['a.local', 'b.local']
+        assert config.TAGS == ['z']
+        assert (config.DB.HOST, config.DB.PORT) == ('db.local', 7432)
+
+    def test_appending(self, config_model, layers):
+        config = load_appending(config_model, layers)
+
+        assert config.NAME == 'api'
+        assert config.LABELS == {'team': 'core', 'tier': 'backend'}
+        assert config.HOSTS == ['b.local', 'a.local']
+        assert config.TAGS == ['x', 'y']
+        assert (config.DB.HOST, config.DB.PORT) == ('db.local', 6432)
+
+    @pytest.mark.parametrize('load', [load_rewriting, load_appending])
+    def test_default_factory(self, layers, load):
+        calls = []
+
+        def factory(value):
+            return lambda: calls.append(value) or value
+
+        class Db(model.Model):
+            HOST = field.StrField(default_factory=factory('db-host'))
+            USER = field.StrField(default_factory=factory('db-user'))
+
+        class Config(model.Model):
+            NAME = field.StrField(default_factory=factory('name'))
+            OWNER = field.StrField(default_factory=factory('owner'))
+            DB = model.ModelField(Db, path='db', prefix='DB_')
+
+        config = load(Config, layers)
+
+        assert (config.NAME, config.OWNER) == ('api', 'owner')
+        assert (config.DB.HOST, config.DB.USER) == ('db.local', 'db-user')
+        assert sorted(calls) == ['db-user', 'owner']
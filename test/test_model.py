@@ -0,0 +1,385 @@
+import os
+import pickle
+import subprocess
+import sys
+from pathlib import Path
+from types import MappingProxyType
+
+import pytest
+
+import configoo
+from configoo import field, model
+from configoo import load_from_env
+from configoo.exception import FieldValueError, UndefinedFieldError, LoaderError
+from configoo.model import LazyModel
+
+
+SOURCE_DIR = Path(configoo.__file__).resolve().parent.parent
+
+
+class TestModelInheritance:
+    class Base(model.Model):
+        HOST = field.StrField(default='localhost')
+        PORT = field.IntField(default=80)
+
+    class Mixin(model.Model):
+        DEBUG = field.IntField(default=0)
+
+    @pytest.fixture
+    def child_model(self):
+        class Child(self.Base, self.Mixin):
+            PORT = field.IntField(default=8080)
+            NAME = field.StrField(default='child')
+
+        return Child
+
+    def test_inherited_fields(self, child_model):
+        fields = dict(child_model.iter_fields())
+
+        assert list(fields) == ['DEBUG', 'HOST', 'PORT', 'NAME']
+        assert fields['HOST'] is dict(self.Base.iter_fields())['HOST']
+        assert fields['DEBUG'] is dict(self.Mixin.iter_fields())['DEBUG']
+
+    def test_overridden_field(self, child_model):
+        fields = dict(child_model.iter_fields())
+
+        assert fields['PORT'] is not dict(self.Base.iter_fields())['PORT']
+        assert fields['PORT'].default == 8080
+        assert dict(self.Base.iter_fields())['PORT'].default == 80
+
+    def test_values(self, child_model):
+        config = child_model({'DEBUG': 1, 'HOST': 'a.local', 'PORT': 8000, 'NAME': 'x'})
+
+        assert (config.DEBUG, config.HOST, config.PORT, config.NAME) == (1, 'a.local', 8000, 'x')
+
+    def test_hidden_field(self):
+        class Child(self.Base):
+            HOST = 'static'
+
+        assert [key for key, _ in Child.iter_fields()] == ['PORT']
+        assert Child.HOST == 'static'
+
+
+class TestFieldSlots:
+    @pytest.mark.parametrize('value', [
+        field.IntField(default=1),
+        field.ListField(field.StrField()),
+        field.DictField(field.StrField(), field.IntField()),
+        field.UrlField(),
+    ])
+    def test_no_instance_dict(self, value):
+        assert not hasattr(value, '__dict__')
+
+    def test_spec(self):
+        assert field.IntField(default=1).get_spec() == field.IntField(default=1).get_spec()
+        assert field.IntField(default=1).get_spec() != field.IntField(default=True).get_spec()
+        assert field.ListField(field.IntField(), default=[]).get_spec() != field.ListField(field.IntField(), default=()).get_spec()
+
+    def test_shared_definition(self):
+        class First(model.Model):
+            LIMIT = field.IntField(default=10, min_value=0)
+
+        class Second(model.Model):
+            LIMIT = field.IntField(default=10, min_value=0)
+
+        class Third(model.Model):
+            LIMIT = field.IntField(default=20, min_value=0)
+
+        first = dict(First.iter_fields())['LIMIT']
+        second = dict(Second.iter_fields())['LIMIT']
+
+        assert second.model is Second
+        assert str(second) == 'Second.LIMIT'
+        assert second._FieldDefinition__parsers is first._FieldDefinition__parsers
+        assert dict(Third.iter_fields())['LIMIT']._FieldDefinition__parsers is not first._FieldDefinition__parsers
+        assert Second({'LIMIT': 5}).LIMIT == 5
+
+    def test_spec_of_repeated_names_only(self, monkeypatch):
+        specs = []
+        get_spec = field.IntField.get_spec
+        monkeypatch.setattr(field.IntField, 'get_spec', lambda self: specs.append(self.name) or get_spec(self))
+
+        class First(model.Model):
+            UNIQUE_LIMIT = field.IntField(default=10)
+            SHARED_LIMIT = field.IntField(default=10)
+
+        class Second(model.Model):
+            SHARED_LIMIT = field.IntField(default=10)
+
+        assert specs == ['SHARED_LIMIT', 'SHARED_LIMIT']
+
+        first = dict(First.iter_fields())['SHARED_LIMIT']
+        second = dict(Second.iter_fields())['SHARED_LIMIT']
+
+        assert second._FieldDefinition__parsers is first._FieldDefinition__parsers
+
+    def test_shared_definition_errors(self, monkeypatch):
+        class Alpha(model.Model):
+            PORT = field.PortField(required=True)
+
+        class Beta(model.Model):
+            PORT = field.PortField(required=True)
+
+        monkeypatch.setattr('configoo.loader.env.getenv', lambda name, default=None: default)
+
+        with pytest.raises(LoaderError, match="'Beta.PORT'"):
+            load_from_env(Beta)
+
+    def test_not_shared_with_factory(self):
+        def create_models():
+            return [
+                type('Item', (model.Model,), {'ITEMS': field.ListField(field.IntField(), default_factory=list)})
+                for _ in range(2)
+            ]
+
+        first, second = create_models()
+
+        assert dict(first.iter_fields())['ITEMS'] is not dict(second.iter_fields())['ITEMS']
+
+    def test_unhashable_spec(self):
+        class Dynamic(field.StrField):
+            def __init__(self, **kwargs):
+                super().__init__(**kwargs)
+                self.extra = []
+
+        assert Dynamic().get_spec() is None
+
+
+class TestModelSnapshot:
+    class Inner(model.Model):
+        NAME = field.StrField(default='inner')
+
+    @pytest.fixture
+    def config_model(self):
+        class Config(model.Model):
+            HOST = field.StrField(default='localhost')
+            PORTS = field.ListField(field.IntField(), default=[80])
+            LABELS = field.DictField(field.StrField(), field.StrField(), default={})
+            INNER = model.ModelField(self.Inner)
+
+        return Config
+
+    def create(self, config_model, **values):
+        data = {'HOST': 'localhost', 'PORTS': [80, 443], 'LABELS': {'a': 'b'}, 'INNER': self.Inner({'NAME': 'x'})}
+        data.update(values)
+        return config_model(data)
+
+    def test_loaded_model_identity(self, config_model):
+        config = self.create(config_model)
+
+        assert config != self.create(config_model)
+        assert hash(config) == hash(config)
+        assert not config.is_snapshot
+
+    def test_equal_snapshots(self, config_model):
+        first = self.create(config_model).snapshot()
+        second = self.create(config_model).snapshot()
+
+        assert first.is_snapshot
+        assert first == second
+        assert hash(first) == hash(second)
+        assert {first: 1}[second] == 1
+        assert first.snapshot() is first
+        assert first != self.create(config_model, HOST='remote').snapshot()
+
+    def test_key_order(self, config_model):
+        first = self.create(config_model)
+        second = config_model(dict(reversed(list(dict(first).items()))))
+
+        assert list(second._Model__data) != list(first._Model__data)
+        assert hash(first.snapshot()) == hash(second.snapshot())
+        assert first.snapshot() == second.snapshot()
+
+    def test_frozen_values(self, config_model):
+        snapshot = self.create(config_model).snapshot()
+
+        assert snapshot.PORTS == (80, 443)
+        assert snapshot.INNER.is_snapshot
+        with pytest.raises(TypeError):
+            snapshot.LABELS['c'] = 'd'
+
+    def test_tuple_values(self):
+        class Service(model.Model):
+            URL = field.UrlField()
+
+        snapshot = Service({'URL': field.UrlField().parse('https://example.com')}).snapshot()
+
+        assert snapshot.URL.hostname == 'example.com'
+
+    def test_fingerprint(self, config_model):
+        config = self.create(config_model)
+        snapshot = config.snapshot()
+
+        assert snapshot.fingerprint == config.fingerprint
+        assert len(snapshot.fingerprint) == 64
+        assert snapshot.fingerprint != self.create(config_model, PORTS=[80]).fingerprint
+        assert snapshot.fingerprint != self.create(config_model, INNER=self.Inner({'NAME': 'y'})).fingerprint
+
+    def test_fingerprint_stable_across_processes(self):
+        code = (
+            "from configoo import field, model\n"
+            "class Config(model.Model):\n"
+            "    VALUES = field.DictField(field.StrField(), field.IntField())\n"
+            "print(Config({'VALUES': {'b': 2, 'a': 1}}).fingerprint)\n"
+        )
+
+        fingerprints = {
+            subprocess.run(
+                [sys.executable, '-c', code],
+                env=dict(os.environ, PYTHONPATH=str(SOURCE_DIR), PYTHONHASHSEED=str(seed)),
+                capture_output=True,
+                text=True,
+                check=True,
+            ).stdout
+            for seed in (1, 2)
+        }
+
+        assert len(fingerprints) == 1
+
+    def test_fingerprint_unsupported_value(self):
+        class Config(model.Model):
+            VALUE = field.StrField()
+
+        with pytest.raises(TypeError):
+            Config({'VALUE': object()}).fingerprint
+
+
+class TestModelReplace:
+    @pytest.fixture
+    def config(self):
+        class Config(model.Model):
+            HOST = field.StrField(default='localhost')
+            PORT = field.IntField(default=80, min_value=1)
+            TAGS = field.ListField(field.StrField(), default=[])
+            TOKEN = field.StrField(required=True)
+
+        return Config({'HOST': 'localhost', 'PORT': 80, 'TAGS': ['a'], 'TOKEN': 'secret'})
+
+    def test_replace(self, config):
+        derived = config.replace(PORT='8080', TAGS='x,y')
+
+        assert (derived.HOST, derived.PORT, derived.TAGS) == ('localhost', 8080, ['x', 'y'])
+        assert (config.PORT, config.TAGS) == (80, ['a'])
+        assert type(derived) is type(config)
+        assert list(dict(derived)) == ['HOST', 'PORT', 'TAGS', 'TOKEN']
+
+    def test_shares_parent_values(self, config):
+        derived = config.replace(PORT=8080)
+
+        assert derived.TAGS is config.TAGS
+
+    def test_chain(self, config):
+        derived = config
+        for port in range(1, 100):
+            derived = derived.replace(PORT=port)
+
+        derived = derived.replace(HOST='remote')
+
+        assert (derived.HOST, derived.PORT, derived.TOKEN) == ('remote', 99, 'secret')
+        assert len(derived._Model__data.maps) == 2
+
+    def test_validation(self, config):
+        with pytest.raises(FieldValueError):
+            config.replace(PORT=0)
+
+        with pytest.raises(FieldValueError):
+            config.replace(TOKEN=None)
+
+        with pytest.raises(UndefinedFieldError):
+            config.replace(UNKNOWN=1)
+
+        assert config.replace(HOST=None).HOST is None
+
+    def test_parsed_values(self):
+        class Config(model.Model):
+            URL = field.UrlField()
+            FORMAT = field.LoggingBracketFormatField()
+            PORT = field.IntField()
+
+        config = Config({'URL': None, 'FORMAT': None, 'PORT': 80}).replace(
+            URL='http://localhost:8080/api',
+            FORMAT='at,level,message',
+        )
+        derived = config.replace(URL=config.URL, FORMAT=config.FORMAT)
+
+        assert (derived.URL, derived.FORMAT) == (config.URL, config.FORMAT)
+
+        with pytest.raises(FieldValueError):
+            config.replace(URL=8080)
+
+        with pytest.raises(FieldValueError):
+            config.replace(PORT=object())
+
+    def test_snapshot(self, config):
+        snapshot = config.snapshot()
+        derived = snapshot.replace(TAGS=['b'])
+
+        assert derived.is_snapshot
+        assert derived.TAGS == ('b',)
+        assert derived == config.replace(TAGS=['b']).snapshot()
+        assert derived.fingerprint == config.replace(TAGS=['b']).fingerprint
+
+
+class PickledInner(model.Model):
+    NAME = field.StrField(default='inner')
+
+
+class PickledConfig(model.Model):
+    PORT = field.IntField(default=80)
+    URL = field.UrlField(default='http://localhost')
+    TAGS = field.ListField(field.StrField(), frozen=True)
+    LABELS = field.DictField(field.StrField(), field.StrField(), frozen=True)
+    INNER = model.ModelField(PickledInner)
+
+
+class TestModelPickle:
+    @pytest.fixture
+    def config(self):
+        return PickledConfig({
+            'PORT': 8080,
+            'URL': field.UrlField().parse('https://example.com'),
+            'TAGS': ('a', 'b'),
+            'LABELS': MappingProxyType({'a': 'b'}),
+            'INNER': LazyModel(PickledInner, {'NAME': 'x'}),
+        })
+
+    @pytest.mark.parametrize('protocol', range(2, pickle.HIGHEST_PROTOCOL + 1))
+    def test_roundtrip(self, config, protocol):
+        restored = pickle.loads(pickle.dumps(config, protocol=protocol))
+
+        assert type(restored) is PickledConfig
+        assert str(restored) == str(config)
+        assert isinstance(restored.LABELS, MappingProxyType)
+        assert restored.INNER.NAME == 'x'
+        assert not restored.is_snapshot
+
+    def test_snapshot(self, config):
+        snapshot = config.replace(PORT=9090).snapshot()
+        restored = pickle.loads(pickle.dumps(snapshot))
+
+        assert restored.is_snapshot
+        assert restored == snapshot
+        assert restored.fingerprint == snapshot.fingerprint
+
+    def test_skips_parsers(self, config, monkeypatch):
+        payload = pickle.dumps(config)
+
+        def parse(self, value):
+            raise AssertionError("Values must not be parsed again!")
+
+        monkeypatch.setattr(field.IntField, 'parse', parse)
+
+        assert pickle.loads(payload).PORT == 8080
+
+    def test_from_trusted_data(self, monkeypatch):
+        def parse(self, value):
+            raise AssertionError("Values must not be parsed!")
+
+        monkeypatch.setattr(field.StrField, 'parse', parse)
+
+        assert PickledInner.from_trusted_data({'NAME': 'x'}).NAME == 'x'
+        assert not PickledInner.from_trusted_data({'NAME': 'x'}).is_snapshot
+        assert PickledInner.from_trusted_data({'NAME': 'x'}, snapshot=True).is_snapshot
+
+    def test_compact(self, config):
+        assert b'_Model__data' not in pickle.dumps(config)
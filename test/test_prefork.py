@@ -0,0 +1,144 @@
+import gc
+import multiprocessing
+import sys
+
+import pytest
+
+from configoo import field, model
+from configoo.exception import LoaderError
+from configoo.prefork import SharedConfigPublisher, SharedConfigReader, freeze_for_fork
+
+
+class SharedConfig(model.Model):
+    HOST = field.StrField(default='localhost')
+    PORTS = field.ListField(field.IntField(), default=[])
+
+
+def read_in_child(reader, queue):
+    config = reader.get()
+    queue.put((reader.generation, config.HOST, config.PORTS, id(config)))
+    reader.close()
+
+
+class TestSharedConfig:
+    @pytest.fixture
+    def publisher(self):
+        with SharedConfigPublisher(size=4096) as publisher:
+            yield publisher
+
+    def test_publish(self, publisher):
+        reader = SharedConfigReader(publisher.name)
+
+        assert publisher.publish(SharedConfig({'HOST': 'a.local', 'PORTS': [80]})) == 1
+
+        config = reader.get()
+
+        assert (reader.generation, config.HOST, config.PORTS) == (1, 'a.local', [80])
+        assert reader.get() is config
+
+        reader.close()
+
+    def test_reload(self, publisher):
+        reader = publisher.reader()
+        publisher.publish(SharedConfig({'HOST': 'a.local', 'PORTS': []}))
+        first = reader.get()
+
+        publisher.publish(SharedConfig({'HOST': 'b.local', 'PORTS': [443]}))
+        second = reader.get()
+
+        assert second is not first
+        assert (reader.generation, second.HOST, second.PORTS) == (2, 'b.local', [443])
+
+        reader.close()
+
+    def test_published_instance(self, publisher):
+        config = SharedConfig({'HOST': 'a.local', 'PORTS': [80]})
+        publisher.publish(config)
+        reader = publisher.reader()
+
+        assert reader.generation == 1
+        assert reader.get() is config
+
+        publisher.publish(SharedConfig({'HOST': 'b.local', 'PORTS': []}))
+
+        assert reader.get().HOST == 'b.local'
+
+        reader.close()
+
+    def test_not_published(self, publisher):
+        reader = publisher.reader()
+
+        with pytest.raises(LoaderError):
+            reader.get()
+
+        reader.close()
+
+    def test_capacity(self, publisher):
+        with pytest.raises(ValueError):
+            publisher.publish(SharedConfig({'HOST': 'x' * 8192, 'PORTS': []}))
+
+        assert publisher.generation == 0
+
+    @pytest.mark.skipif('fork' not in multiprocessing.get_all_start_methods(), reason="fork is not available")
+    def test_forked_workers(self, publisher):
+        context = multiprocessing.get_context('fork')
+        reader = publisher.reader()
+        config = SharedConfig({'HOST': 'a.local', 'PORTS': [80, 443]})
+        publisher.publish(config)
+
+        queue = context.Queue()
+        workers = [
+            context.Process(target=read_in_child, args=(worker_reader, queue))
+            for worker_reader in (reader, publisher.reader())
+        ]
+
+        for worker in workers:
+            worker.start()
+            worker.join(10)
+
+        unpickled, inherited = [queue.get(timeout=10) for _ in workers]
+
+        assert unpickled[:3] == inherited[:3] == (1, 'a.local', [80, 443])
+        # Readers created after publish hand the master's instance to forked workers.
+        assert unpickled[3] != id(config)
+        assert inherited[3] == id(config)
+        # Exiting workers must not remove the segment owned by the publisher.
+        assert reader.get().HOST == 'a.local'
+
+        reader.close()
+
+
+class TestFreezeForFork:
+    class Config(model.Model):
+        HOST = field.StrField(default='localhost')
+        PORTS = field.ListField(field.IntField(), default_factory=lambda: [80])
+        TAGS = field.ListField(field.StrField())
+
+    @pytest.fixture
+    def config(self):
+        return self.Config({'HOST': ''.join(['a', '.local']), 'PORTS': [80], 'TAGS': ['x', ''.join(['y', 'z'])]})
+
+    def test_frozen(self, config, monkeypatch):
+        monkeypatch.setattr(gc, 'freeze', lambda: pytest.fail("gc.freeze() is opt-in!"))
+
+        frozen = freeze_for_fork(config)
+
+        assert frozen.is_snapshot
+        assert frozen.TAGS == ('x', 'yz')
+        assert frozen.HOST is sys.intern('a.local')
+        assert frozen.TAGS[1] is sys.intern('yz')
+        assert dict(self.Config.iter_fields())['PORTS']._FieldDefinition__lazy_default._LazyDefault__factory is None
+
+    def test_interns_snapshot(self, config):
+        snapshot = config.snapshot()
+
+        assert freeze_for_fork(snapshot) == snapshot
+        assert freeze_for_fork(snapshot).HOST is sys.intern('a.local')
+
+    def test_gc_freeze(self, config, monkeypatch):
+        calls = []
+        monkeypatch.setattr(gc, 'freeze', lambda: calls.append(True))
+
+        freeze_for_fork(config, gc_freeze=True)
+
+        assert calls == [True]